@@ -0,0 +1,176 @@
+"""Construction benchmarks of the classes across their scale knobs, and the paths of the dots coordinates.
+
+Run it from the project directory:
+    python benchmarks/construction.py --max-size 1000 -o baseline.json
+    python benchmarks/construction.py --max-size 1000 --compare baseline.json --threshold 0.1
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from colour import Color  # noqa: E402
+from harness import benchmark, main  # noqa: E402
+from numpy import arange, stack, zeros  # noqa: E402
+from numpy.random import default_rng  # noqa: E402
+
+from classes import (  # noqa: E402
+    CategoricalGraph,
+    ContinuousGraph,
+    CustomersTable,
+    Funnel,
+    Funnels,
+    GaltonBoard,
+    HistogramDot,
+    MovableCategoricalGraph,
+    MovableFunnel,
+    ShapePoint,
+    ShapePointArray,
+    get_line_segments,
+)
+
+BINS = 100
+COLORS = list(Color("#7fcc81").range_to("#ff7555", BINS))
+
+
+def get_values(count: int) -> list:
+    return [i % BINS + 1 for i in range(count)]
+
+
+@benchmark("CustomersTable", sizes=[10, 100, 1000, 10000, 100000])
+def customers_table(size: int):
+    return lambda: CustomersTable(
+        ((-6.5, 3), (-2.5, 3)),
+        row_count=size,
+        visible_row_count=size,
+        bins=BINS,
+        colors=COLORS,
+        text="Customer",
+    )
+
+
+@benchmark("CustomersTable(dot_cloud)", sizes=[10, 100, 1000, 10000, 100000])
+def customers_table_dot_cloud(size: int):
+    return lambda: CustomersTable(
+        ((-6.5, 3), (-2.5, 3)),
+        row_count=size,
+        visible_row_count=size,
+        bins=BINS,
+        colors=COLORS,
+        text="Customer",
+        dot_cloud=True,
+    )
+
+
+@benchmark("CategoricalGraph", sizes=[4, 40, 400, 4000, 10000])
+def categorical_graph(size: int):
+    return lambda: CategoricalGraph(((-6.5, -3), (6.5, -3)), None, bins=size, annot=True)
+
+
+@benchmark("ContinuousGraph", sizes=[4, 40, 400, 4000, 10000])
+def continuous_graph(size: int):
+    return lambda: ContinuousGraph(((-6.5, -3), (6.5, -3)), None, bins=size, annot=True)
+
+
+@benchmark("Funnels", sizes=[5, 50, 500])
+def funnels(size: int):
+    return lambda: Funnels(
+        start_end_points=((-6.5, -4), (6.5, -4)),
+        funnel=MovableFunnel,
+        count=size,
+        # Every funnel needs at least one bin for its annotation
+        bins=max(BINS, size * 10),
+        annot=True,
+        point_radius=0.2,
+        run_time=0.8,
+        height=4,
+    )
+
+
+@benchmark("HistogramDot", sizes=[1, 10, 100, 1000, 10000, 100000])
+def histogram_dot(size: int):
+    values = get_values(size)
+    points = stack([zeros(size), -arange(size) * 0.5, zeros(size)], axis=1)
+
+    def run():
+        # Prototypes are shared, so they are created in every round for the same work
+        HistogramDot.prototypes.clear()
+
+        return [HistogramDot(value=x, point=y, color=COLORS[x - 1]) for x, y in zip(values, points)]
+
+    return run
+
+
+@benchmark("ShapePoint", sizes=[1, 100, 10000, 100000])
+def shape_point(size: int):
+    coords = [(i * 0.5, -i * 0.5) for i in range(size)]
+
+    return lambda: [ShapePoint(x) for x in coords]
+
+
+@benchmark("ShapePointArray", sizes=[1, 100, 10000, 100000])
+def shape_point_array(size: int):
+    coords = stack([arange(size) * 0.5, -arange(size) * 0.5], axis=1)
+
+    return lambda: ShapePointArray(coords)
+
+
+def create_dots(size: int) -> list:
+    return [HistogramDot(value=x, point=(i * 0.01 - 6, 3)) for i, x in enumerate(get_values(size))]
+
+
+@benchmark("Movable._get_next_dot_coords", sizes=[10, 100, 1000, 10000])
+def movable_next_dot_coords(size: int):
+    dots = create_dots(size)
+    graph = MovableCategoricalGraph(((-6.5, -3), (6.5, -3)), None, bins=BINS, annot=False)
+
+    return lambda: [graph._get_next_dot_coords(x) for x in dots]
+
+
+@benchmark("Movable.get_next_dots_coords", sizes=[10, 100, 1000, 10000])
+def movable_next_dots_coords(size: int):
+    values = get_values(size)
+    graph = MovableCategoricalGraph(((-6.5, -3), (6.5, -3)), None, bins=BINS, annot=False)
+
+    return lambda: graph.get_next_dots_coords(values, HistogramDot.radius)
+
+
+def create_funnel() -> MovableFunnel:
+    return MovableFunnel(((-6, 2), (6, 2)), run_time=0.8, height=4, point_radius=0.2)
+
+
+@benchmark("MovableFunnel._get_next_dots_coords", sizes=[10, 100, 1000, 10000])
+def movable_funnel_next_dots_coords(size: int):
+    dots = create_dots(size)
+    funnel = create_funnel()
+
+    return lambda: [funnel._get_next_dots_coords(x) for x in dots]
+
+
+@benchmark("MovableFunnel.get_next_dots_coords", sizes=[10, 100, 1000, 10000])
+def movable_funnel_next_dots_coords_batched(size: int):
+    xs = arange(size) * 0.01 - 6
+    funnel = create_funnel()
+
+    return lambda: funnel.get_next_dots_coords(xs, HistogramDot.radius)
+
+
+@benchmark("GaltonBoard.step", sizes=[100, 1000, 10000])
+def galton_board_step(size: int):
+    radius = 0.025
+    funnels = Funnels(((-6.5, -0.5), (6.5, -0.5)), funnel=Funnel, count=5, bins=BINS, point_radius=0.15, height=3)
+
+    columns = int(12.6 / (radius * 2.4))
+    centers = stack([arange(size) % columns, arange(size) // columns], axis=1) * radius * 2.4 + (-6.3, 0.2)
+    centers[:, 0] += default_rng(0).uniform(-radius / 4, radius / 4, size)
+
+    board = GaltonBoard(get_line_segments(funnels), centers, radius)
+
+    # Dots are falling for a while, so they collide with the lines and with each other in the timed step
+    board.simulate(duration=0.5, frame_rate=30)
+
+    return lambda: board.step(1 / 30)
+
+
+if __name__ == "__main__":
+    main()
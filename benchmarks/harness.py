@@ -0,0 +1,164 @@
+"""Small benchmark runner in the style of pytest-benchmark, that doesn't need anything but the standard library.
+Every benchmark is a setup function, that gets the size and returns the function to time. Setup isn't timed.
+Results are saved to JSON and could be compared with the baseline to find regressions.
+"""
+import argparse
+import fnmatch
+import gc
+import json
+import platform
+import statistics
+import sys
+import tracemalloc
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence
+
+
+class Benchmark(NamedTuple):
+    name: str
+    sizes: Sequence[int]
+    setup: Callable[[int], Callable[[], Any]]
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, sizes: Sequence[int]) -> Callable:
+    """Registering the setup function as a benchmark for every size.
+
+    Args:
+        name (str): Benchmark name.
+        sizes (Sequence[int]): Scale knob values, ex. rows count of the table.
+    """
+
+    def decorator(setup: Callable[[int], Callable[[], Any]]):
+        BENCHMARKS.append(Benchmark(name, sizes, setup))
+        return setup
+
+    return decorator
+
+
+def measure(bench: Benchmark, size: int, rounds: int, max_time: float, memory: bool) -> Dict[str, Any]:
+    """Timing the benchmark. Rounds are stopped, when they take more than max_time, but at least one is made.
+
+    Args:
+        bench (Benchmark): Benchmark.
+        size (int): Scale knob value.
+        rounds (int): Maximum rounds count.
+        max_time (float): Time budget for all rounds in seconds.
+        memory (bool): Measure peak memory with tracemalloc in the separate round.
+
+    Returns:
+        Dict[str, Any]: Timings in seconds and peak memory in bytes.
+    """
+    times = []
+    while len(times) < rounds and (not times or sum(times) < max_time):
+        run = bench.setup(size)
+        gc.collect()
+
+        started = perf_counter()
+        run()
+        times.append(perf_counter() - started)
+
+    result = {
+        "rounds": len(times),
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+    }
+
+    # Tracing slows the code down, so memory is measured in its own round
+    if memory:
+        run = bench.setup(size)
+        gc.collect()
+
+        tracemalloc.start()
+        run()
+        _, result["peak_bytes"] = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return result
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Comparing results with the baseline. Minimum time is compared, it's the least noisy one.
+
+    Args:
+        results (Dict[str, Any]): Current results.
+        baseline (Dict[str, Any]): Baseline results.
+        threshold (float): Allowed slowdown, ex. 0.1 is 10%.
+
+    Returns:
+        List[str]: Regressions descriptions. Empty list, when there are no regressions.
+    """
+    regressions = []
+
+    for name, result in results["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            continue
+
+        for key in ("min", "peak_bytes"):
+            if key not in result or key not in base or not base[key]:
+                continue
+
+            ratio = result[key] / base[key]
+            if ratio > 1 + threshold:
+                regressions.append(f"{name} {key}: {base[key]:.6g} -> {result[key]:.6g} ({ratio - 1:+.1%})")
+
+    return regressions
+
+
+def get_machine_info() -> Dict[str, str]:
+    info = {"python": platform.python_version(), "platform": platform.platform(), "processor": platform.processor()}
+
+    try:
+        import numpy
+
+        info["numpy"] = numpy.__version__
+    except ImportError:
+        pass
+
+    return info
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Run the benchmarks.")
+    parser.add_argument("-k", "--filter", default="*", help="Glob of the benchmark names, ex. 'Funnels*'.")
+    parser.add_argument("--max-size", type=int, default=None, help="Skip sizes bigger than this one.")
+    parser.add_argument("--rounds", type=int, default=5, help="Maximum rounds of every benchmark.")
+    parser.add_argument("--max-time", type=float, default=10.0, help="Time budget of every benchmark in seconds.")
+    parser.add_argument("--no-memory", action="store_true", help="Don't measure peak memory.")
+    parser.add_argument("-o", "--output", default=None, help="Save results to the JSON file.")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file. Fails on the regressions.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Allowed regression, ex. 0.1 is 10%%.")
+    args = parser.parse_args(argv)
+
+    results = {"created": datetime.now().isoformat(), "machine": get_machine_info(), "benchmarks": {}}
+
+    for bench in BENCHMARKS:
+        for size in bench.sizes:
+            name = f"{bench.name}[{size}]"
+            if not fnmatch.fnmatch(name, args.filter) or (args.max_size and size > args.max_size):
+                continue
+
+            result = measure(bench, size, args.rounds, args.max_time, not args.no_memory)
+            results["benchmarks"][name] = result
+
+            memory = f", peak {result['peak_bytes'] / 1024 ** 2:9.2f} MB" if "peak_bytes" in result else ""
+            print(f"{name:48} min {result['min'] * 1000:10.3f} ms, median {result['median'] * 1000:10.3f} ms{memory}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,79 @@
+"""Import time of the classes package. Every case runs in a fresh interpreter, so nothing is cached in sys.modules.
+
+Run it from the project directory:
+    python benchmarks/import_time.py --repeat 10
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Eager case touches every class, the same as the package did before the lazy imports
+CASES = {
+    "import classes": "import classes",
+    "from classes import ShapePoint": "from classes import ShapePoint",
+    "eager (all classes)": "import classes\nfor name in classes.__all__: getattr(classes, name)",
+}
+
+TIMER = """
+import time
+started = time.perf_counter()
+{code}
+print(time.perf_counter() - started)
+print(int("manimlib" in __import__("sys").modules))
+"""
+
+
+def measure(code: str, repeat: int) -> dict:
+    times = []
+    manimlib_loaded = False
+
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code)],
+            cwd=ROOT,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        if completed.returncode:
+            return {"error": completed.stderr.strip().splitlines()[-1]}
+
+        seconds, loaded = completed.stdout.split()
+        times.append(float(seconds))
+        manimlib_loaded = bool(int(loaded))
+
+    return {
+        "median_ms": statistics.median(times) * 1000,
+        "min_ms": min(times) * 1000,
+        "manimlib_loaded": manimlib_loaded,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time of the classes package.")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters for every case.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    results = {name: measure(code, args.repeat) for name, code in CASES.items()}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:32} failed: {result['error']}")
+            continue
+
+        manimlib = "manimlib loaded" if result["manimlib_loaded"] else "no manimlib"
+        print(f"{name:32} median {result['median_ms']:8.1f} ms, min {result['min_ms']:8.1f} ms, {manimlib}")
+
+
+if __name__ == "__main__":
+    main()
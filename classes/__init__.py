@@ -1,11 +1,90 @@
 __version__ = "0.1.0"
 
-from .funnel import Funnel
-from .funnels import Funnels
-from .graph import CategoricalGraph, ContinuousGraph
-from .histogram_dot import HistogramDot
-from .histogram_text import HistogramText
-from .movable_funnel import MovableFunnel
-from .movable_graph import MovableCategoricalGraph, MovableContinuousGraph
-from .shape_point import ShapePoint
-from .table import CustomersTable
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Classes are imported from their modules on the first access (PEP 562). Most of the modules import manimlib,
+# which loads cairo, scipy and the rest of it, so it's loaded only when a mobject class is used.
+# ShapePoint, data sources and caches don't need manimlib at all.
+_ATTRIBUTES_MODULES = {
+    "ArrayDataSource": "data_source",
+    "CsvDataSource": "data_source",
+    "DotsDataSource": "data_source",
+    "IteratorDataSource": "data_source",
+    "NpyDataSource": "data_source",
+    "open_data_source": "data_source",
+    "DiskCache": "disk_cache",
+    "CloudDot": "dot_cloud",
+    "DotCloud": "dot_cloud",
+    "Funnel": "funnel",
+    "Funnels": "funnels",
+    "GaltonBoard": "galton_board",
+    "find_close_pairs": "galton_board",
+    "get_line_segments": "galton_board",
+    "CategoricalGraph": "graph",
+    "ContinuousGraph": "graph",
+    "HistogramDot": "histogram_dot",
+    "HistogramDotPrototypes": "histogram_dot",
+    "HistogramText": "histogram_text",
+    "LineBatch": "line_batch",
+    "MovableFunnel": "movable_funnel",
+    "MovableCategoricalGraph": "movable_graph",
+    "MovableContinuousGraph": "movable_graph",
+    "FollowTrajectories": "move_dots",
+    "MoveToTargets": "move_dots",
+    "StaggeredMove": "move_dots",
+    "get_dots_arrays": "move_dots",
+    "move_dot": "move_dots",
+    "ShapePoint": "shape_point",
+    "ShapePointArray": "shape_point",
+    "CustomersTable": "table",
+    "TextGeometryCache": "text_cache",
+    "ScrollTable": "virtual_table",
+    "VirtualCustomersTable": "virtual_table",
+}
+
+__all__ = ["__version__", *_ATTRIBUTES_MODULES]
+
+
+def __getattr__(name: str):
+    module_name = _ATTRIBUTES_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+
+    # Next time the attribute is found without __getattr__
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ATTRIBUTES_MODULES))
+
+
+if TYPE_CHECKING:
+    from .data_source import (
+        ArrayDataSource,
+        CsvDataSource,
+        DotsDataSource,
+        IteratorDataSource,
+        NpyDataSource,
+        open_data_source,
+    )
+    from .disk_cache import DiskCache
+    from .dot_cloud import CloudDot, DotCloud
+    from .funnel import Funnel
+    from .funnels import Funnels
+    from .galton_board import GaltonBoard, find_close_pairs, get_line_segments
+    from .graph import CategoricalGraph, ContinuousGraph
+    from .histogram_dot import HistogramDot, HistogramDotPrototypes
+    from .histogram_text import HistogramText
+    from .line_batch import LineBatch
+    from .movable_funnel import MovableFunnel
+    from .movable_graph import MovableCategoricalGraph, MovableContinuousGraph
+    from .move_dots import FollowTrajectories, MoveToTargets, StaggeredMove, get_dots_arrays, move_dot
+    from .shape_point import ShapePoint, ShapePointArray
+    from .table import CustomersTable
+    from .text_cache import TextGeometryCache
+    from .virtual_table import ScrollTable, VirtualCustomersTable
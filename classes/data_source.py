@@ -0,0 +1,361 @@
+import csv
+from abc import ABC, abstractmethod
+from collections import deque, namedtuple
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from numpy import load, ndarray
+
+DataRow = namedtuple("DataRow", ["value", "label"])
+
+
+class DataSourceException(Exception):
+    pass
+
+
+class DataSourceFormatException(DataSourceException):
+    pass
+
+
+class DataSourceLengthException(DataSourceException):
+    pass
+
+
+class DataSourceRewindException(DataSourceException):
+    pass
+
+
+class DotsDataSource(ABC):
+    """Source of the dots values (and optionally the row labels) for the table. Rows are read by chunks,
+    so only the rows that are shown or animated are kept in memory."""
+
+    chunk_size: int = 65536
+
+    @abstractmethod
+    def read(self, start: int, stop: int) -> List[DataRow]:
+        """Reading rows from the source.
+
+        Args:
+            start (int): First row index.
+            stop (int): Row index after the last one.
+
+        Returns:
+            List[DataRow]: Rows. There could be less rows than requested, when the source has ended.
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def __getitem__(self, row: int) -> DataRow:
+        rows = self.read(row, row + 1)
+        if not rows:
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+
+        return rows[0]
+
+    @staticmethod
+    def _parse_value(value: Union[str, int, float]) -> Union[int, float]:
+        """Values are kept as int when it's possible, the same way as the values of the table are."""
+        if isinstance(value, (int, float)):
+            return value
+
+        value = value.strip()
+        try:
+            return int(value)
+        except ValueError:
+            pass
+
+        try:
+            return float(value)
+        except ValueError as e:
+            detail = f"Dot value must be a number, got [{value}] instead."
+            raise DataSourceFormatException(detail) from e
+
+
+class ArrayDataSource(DotsDataSource):
+    """Values, that are already in memory: list, tuple or array"""
+
+    def __init__(self, values: Union[ndarray, Sequence[Union[int, float]]], labels: Sequence[str] = None):
+        """Class initialization.
+
+        Args:
+            values (Union[ndarray, Sequence[Union[int, float]]]): Dots values.
+            labels (Sequence[str], optional): Rows labels. Defaults to None.
+        """
+        self.values = values
+        self.labels = labels
+
+    def read(self, start: int, stop: int) -> List[DataRow]:
+        values = self.values[start:stop]
+        values = values.tolist() if isinstance(values, ndarray) else list(values)
+        labels = list(self.labels[start:stop]) if self.labels is not None else [None] * len(values)
+
+        return [DataRow(value, label) for value, label in zip(values, labels)]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class NpyDataSource(ArrayDataSource):
+    """Values from the .npy file. File is memory-mapped, so only the read rows are loaded from the disk."""
+
+    def __init__(self, path: Union[str, Path], column: int = 0):
+        """Class initialization.
+
+        Args:
+            path (Union[str, Path]): Path to the .npy file with 1-D array, or 2-D array with values in the column.
+            column (int, optional): Column with the values for 2-D array. Defaults to 0.
+
+        Raises:
+            DataSourceFormatException: Raises when the array has more than 2 dimensions.
+        """
+        self.path = Path(path)
+
+        values = load(self.path, mmap_mode="r")
+        if values.ndim == 2:
+            values = values[:, column]
+        elif values.ndim != 1:
+            detail = f"Array must have 1 or 2 dimensions, got [{values.ndim}] instead."
+            raise DataSourceFormatException(detail)
+
+        super().__init__(values)
+
+
+class CsvDataSource(DotsDataSource):
+    """Values from the .csv file. File is read by chunks, and the file offset of every chunk is remembered,
+    so any chunk could be read again without reading the file from the beginning."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        value_column: Union[int, str] = 0,
+        label_column: Union[int, str] = None,
+        delimiter: str = ",",
+        header: bool = None,
+        encoding: str = "utf-8",
+        chunk_size: int = None,
+    ):
+        """Class initialization.
+
+        Args:
+            path (Union[str, Path]): Path to the .csv file.
+            value_column (Union[int, str], optional): Index or name of the column with values. Defaults to 0.
+            label_column (Union[int, str], optional): Index or name of the column with row labels.
+                Defaults to None (labels are made from the table text).
+            delimiter (str, optional): Columns delimiter. Defaults to ",".
+            header (bool, optional): Does the file have a header. Defaults to None (it has a header,
+                when the first value isn't a number or the columns are set by names).
+            encoding (str, optional): File encoding. Defaults to "utf-8".
+            chunk_size (int, optional): Rows count in one chunk. Defaults to None (DotsDataSource.chunk_size).
+        """
+        self.path = Path(path)
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.chunk_size = chunk_size or self.chunk_size
+
+        with open(self.path, "rb") as file:
+            first_line = file.readline()
+            first_row = self._parse_lines([first_line])[0] if first_line.strip() else []
+
+            if header is None:
+                header = isinstance(value_column, str) or isinstance(label_column, str)
+                if not header and len(first_row) > value_column:
+                    try:
+                        self._parse_value(first_row[value_column])
+                    except DataSourceFormatException:
+                        header = True
+
+            self.value_column = self._get_column_index(value_column, first_row if header else None)
+            self.label_column = self._get_column_index(label_column, first_row if header else None)
+
+            # File offset of every chunk
+            self._chunks_offsets = [file.tell() if header else 0]
+
+        self._rows_count: Optional[int] = None
+        self._chunk: Tuple[int, List[DataRow]] = (-1, [])
+
+    def _parse_lines(self, lines: List[bytes]) -> List[List[str]]:
+        return list(csv.reader((x.decode(self.encoding) for x in lines), delimiter=self.delimiter))
+
+    @staticmethod
+    def _get_column_index(column: Union[int, str, None], header: Optional[List[str]]) -> Optional[int]:
+        if column is None or isinstance(column, int):
+            return column
+
+        if header is None or column not in header:
+            detail = f"Column [{column}] wasn't found in the header of the file."
+            raise DataSourceFormatException(detail)
+
+        return header.index(column)
+
+    def _read_chunk(self, index: int) -> List[DataRow]:
+        """Reading one chunk of the rows. The last read chunk is kept in memory.
+
+        Args:
+            index (int): Chunk index.
+
+        Returns:
+            List[DataRow]: Rows of the chunk. Empty list, when the file has ended before the chunk.
+        """
+        if self._chunk[0] == index:
+            return self._chunk[1]
+
+        # Chunks offsets are known only for the read chunks, so we are skipping the rows till the needed chunk
+        with open(self.path, "rb") as file:
+            while len(self._chunks_offsets) <= index:
+                file.seek(self._chunks_offsets[-1])
+                lines = self._read_lines(file)
+                if len(lines) < self.chunk_size:
+                    return []
+
+                self._chunks_offsets.append(file.tell())
+
+            file.seek(self._chunks_offsets[index])
+            lines = self._read_lines(file)
+
+            if len(lines) == self.chunk_size and len(self._chunks_offsets) == index + 1:
+                self._chunks_offsets.append(file.tell())
+
+        rows = []
+        for row in self._parse_lines(lines):
+            value = self._parse_value(row[self.value_column])
+            label = row[self.label_column] if self.label_column is not None else None
+            rows.append(DataRow(value, label))
+
+        self._chunk = (index, rows)
+
+        return rows
+
+    def _read_lines(self, file) -> List[bytes]:
+        lines = []
+        while len(lines) < self.chunk_size:
+            line = file.readline()
+            if not line:
+                break
+
+            # Empty lines aren't rows
+            if line.strip():
+                lines.append(line)
+
+        return lines
+
+    def read(self, start: int, stop: int) -> List[DataRow]:
+        rows = []
+        for index in range(start // self.chunk_size, (stop - 1) // self.chunk_size + 1 if stop > start else 0):
+            chunk = self._read_chunk(index)
+            chunk_start = index * self.chunk_size
+
+            rows.extend(chunk[max(start - chunk_start, 0) : stop - chunk_start])
+
+            if len(chunk) < self.chunk_size:
+                break
+
+        return rows
+
+    def __len__(self) -> int:
+        if self._rows_count is None:
+            index = len(self._chunks_offsets) - 1
+            while True:
+                chunk = self._read_chunk(index)
+                if len(chunk) < self.chunk_size:
+                    break
+                index += 1
+
+            self._rows_count = index * self.chunk_size + len(chunk)
+
+        return self._rows_count
+
+
+class IteratorDataSource(DotsDataSource):
+    """Values from any iterator, for example a generator reading the data from the network. Iterator could be read
+    only once, so only the last rows are kept in memory, and the rows before them can't be read again."""
+
+    def __init__(self, iterable: Iterable[Union[int, float, str, Tuple]], history: int = None):
+        """Class initialization.
+
+        Args:
+            iterable (Iterable[Union[int, float, str, Tuple]]): Values, or tuples with value and label.
+            history (int, optional): How many rows before the last read row are kept in memory.
+                Defaults to None (DotsDataSource.chunk_size).
+        """
+        self._iterator: Iterator = iter(iterable)
+        self.history = self.chunk_size if history is None else history
+
+        # Index of the first row in the buffer
+        self._first_row = 0
+        self._rows: Deque[DataRow] = deque()
+        self._ended = False
+
+    def _pull(self, stop: int):
+        while not self._ended and self._first_row + len(self._rows) < stop:
+            try:
+                item = next(self._iterator)
+            except StopIteration:
+                self._ended = True
+                break
+
+            if isinstance(item, tuple):
+                self._rows.append(DataRow(self._parse_value(item[0]), item[1] if len(item) > 1 else None))
+            else:
+                self._rows.append(DataRow(self._parse_value(item), None))
+
+    def read(self, start: int, stop: int) -> List[DataRow]:
+        """Reading rows from the iterator.
+
+        Raises:
+            DataSourceRewindException: Raises when the rows were already dropped from the memory.
+        """
+        if start < self._first_row:
+            detail = f"Row [{start}] was already dropped, rows from [{self._first_row}] could be read."
+            raise DataSourceRewindException(detail)
+
+        self._pull(stop)
+
+        rows = [self._rows[i - self._first_row] for i in range(start, min(stop, self._first_row + len(self._rows)))]
+
+        # Keeping memory flat, old rows are dropped
+        while self._rows and self._first_row < stop - self.history:
+            self._rows.popleft()
+            self._first_row += 1
+
+        return rows
+
+    def __len__(self) -> int:
+        if not self._ended:
+            raise DataSourceLengthException("Length of the iterator is unknown, until it's read till the end.")
+
+        return self._first_row + len(self._rows)
+
+
+def open_data_source(source: Union[str, Path, ndarray, Sequence, Iterable, DotsDataSource]) -> DotsDataSource:
+    """Creating data source for any supported type of the data.
+
+    Args:
+        source (Union[str, Path, ndarray, Sequence, Iterable, DotsDataSource]): Path to the .npy or .csv file,
+            values in memory, or any iterator.
+
+    Raises:
+        DataSourceFormatException: Raises when the file type isn't supported.
+
+    Returns:
+        DotsDataSource: Data source.
+    """
+    if isinstance(source, DotsDataSource):
+        return source
+
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if path.suffix == ".npy":
+            return NpyDataSource(path)
+
+        if path.suffix in (".csv", ".txt"):
+            return CsvDataSource(path)
+
+        detail = f"File must be .npy or .csv, got [{path.suffix}] instead."
+        raise DataSourceFormatException(detail)
+
+    if isinstance(source, (ndarray, list, tuple, range)):
+        return ArrayDataSource(source)
+
+    return IteratorDataSource(source)
@@ -0,0 +1,169 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import IO, Callable, Optional, Union
+
+
+class DiskCacheException(Exception):
+    pass
+
+
+class DiskCache:
+    """Directory with cached files, limited by size. When the limit is exceeded, the least recently used
+    files are removed first. Files are written atomically, so the cache could be shared between processes."""
+
+    suffix: str = ""
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int):
+        """Class initialization.
+
+        Args:
+            directory (Union[str, Path]): Directory for the cached files. Created on the first write.
+            max_bytes (int): Maximum size of all cached files in bytes.
+
+        Raises:
+            DiskCacheException: Raises when max_bytes is negative.
+        """
+        if max_bytes < 0:
+            detail = f"Cache size must be a positive number, got [{max_bytes}] instead."
+            raise DiskCacheException(detail)
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+        # Calculated lazily, to avoid walking the directory when the cache is only read
+        self._size: Optional[int] = None
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Making content-addressed key from any values with stable repr.
+
+        Returns:
+            str: Hex digest of the values.
+        """
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Getting the path of the cached file. Marks the file as recently used.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[Path]: Path of the file or None, when nothing was cached.
+        """
+        path = self.path(key)
+
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+
+        return path
+
+    def store(self, key: str, write: Callable[[IO[bytes]], None]) -> Path:
+        """Writing new file to the cache.
+
+        Args:
+            key (str): Cache key.
+            write (Callable[[IO[bytes]], None]): Function, that writes the content to the opened file.
+
+        Returns:
+            Path: Path of the cached file.
+        """
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Writing to the temporary file first, so no one could read the file partially written
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                write(file)
+
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(temp_path, path)
+
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        if self._size is not None:
+            self._size += path.stat().st_size - old_size
+
+        if self.size() > self.max_bytes:
+            self.evict()
+
+        return path
+
+    def store_file(self, key: str, source: Union[str, Path]) -> Path:
+        """Copying existing file to the cache.
+
+        Args:
+            key (str): Cache key.
+            source (Union[str, Path]): File to copy.
+
+        Returns:
+            Path: Path of the cached file.
+        """
+        with open(source, "rb") as source_file:
+            return self.store(key, lambda file: shutil.copyfileobj(source_file, file))
+
+    def remove(self, key: str):
+        path = self.path(key)
+
+        if path.exists():
+            size = path.stat().st_size
+            path.unlink()
+
+            if self._size is not None:
+                self._size -= size
+
+    def _files(self):
+        if not self.directory.exists():
+            return []
+
+        return [x for x in self.directory.rglob(f"*{self.suffix}") if x.is_file() and x.suffix != ".tmp"]
+
+    def size(self) -> int:
+        """Size of all cached files in bytes."""
+        if self._size is None:
+            self._size = sum(x.stat().st_size for x in self._files())
+
+        return self._size
+
+    def evict(self):
+        """Removing least recently used files until the cache fits into max_bytes."""
+        files = []
+        for path in self._files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(x[1] for x in files)
+        for _, file_size, path in sorted(files, key=lambda x: x[0]):
+            if size <= self.max_bytes:
+                break
+
+            try:
+                path.unlink()
+            except OSError:
+                continue
+
+            size -= file_size
+
+        self._size = size
+
+    def clear(self):
+        """Removing all cached files."""
+        if self.directory.exists():
+            shutil.rmtree(self.directory)
+
+        self._size = 0
@@ -0,0 +1,360 @@
+from functools import reduce
+from operator import add
+from typing import Iterator, List, Sequence, Union
+
+from colour import Color
+from manimlib.imports import (
+    BLACK,
+    ORIGIN,
+    WHITE,
+    Dot,
+    VGroup,
+    VMobject,
+    color_to_rgb,
+    interpolate,
+    rgb_to_color,
+    straight_path,
+)
+from numpy import array, asarray, broadcast_to, flatnonzero, ndarray, sqrt, unique, vstack, zeros
+
+from .histogram_dot import HistogramDot
+from .histogram_text import HistogramText
+
+
+class DotCloudException(Exception):
+    pass
+
+
+class DotCloudShapeException(DotCloudException):
+    pass
+
+
+class CloudDot:
+    """View of the one dot inside the DotCloud. Has the same interface as HistogramDot, that graphs
+    and funnels are using."""
+
+    __slots__ = ("cloud", "index")
+
+    def __init__(self, cloud: "DotCloud", index: int):
+        self.cloud = cloud
+        self.index = index
+
+    @property
+    def value(self) -> Union[int, float]:
+        return self.cloud.values[self.index].item()
+
+    @property
+    def radius(self) -> float:
+        return self.cloud.radii[self.index].item()
+
+    @property
+    def color(self) -> Color:
+        return rgb_to_color(self.cloud.colors[self.index])
+
+    def get_center(self) -> ndarray:
+        return self.cloud.centers[self.index].copy()
+
+    def get_x(self) -> float:
+        return self.cloud.centers[self.index, 0].item()
+
+    def get_y(self) -> float:
+        return self.cloud.centers[self.index, 1].item()
+
+    def move_to(self, point: ndarray) -> "CloudDot":
+        self.cloud.move_dots([self.index], [point])
+        return self
+
+    def shift(self, vector: ndarray) -> "CloudDot":
+        return self.move_to(self.get_center() + vector)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.value}, {self.get_center()}, {self.radius}, {self.color})"
+
+
+class DotCloud(VMobject):
+    """Lots of dots stored as arrays of values, centers, radii and colors. Dots with the same color are drawn
+    as one path, same for the texts with the same value, so the count of mobjects doesn't depend on the dots
+    count. Could be used instead of VGroup with HistogramDot."""
+
+    dot_stroke_color: Color = BLACK
+    dot_stroke_width: Union[int, float] = 1
+    label_color: Color = BLACK
+
+    def __init__(
+        self,
+        values: Sequence[Union[int, float]],
+        centers: Union[ndarray, Sequence[Sequence[float]]],
+        radii: Union[float, Sequence[float]] = None,
+        colors: Union[ndarray, Sequence[Union[str, Color]]] = None,
+        annot: bool = True,
+        **kwargs,
+    ):
+        """Class initialization.
+
+        Args:
+            values (Sequence[Union[int, float]]): Dots values.
+            centers (Union[ndarray, Sequence[Sequence[float]]]): Dots locations with shape (N, 2) or (N, 3).
+            radii (Union[float, Sequence[float]], optional): Radius for all dots or for every dot.
+                Defaults to None (HistogramDot.radius).
+            colors (Union[ndarray, Sequence[Union[str, Color]]], optional): Color for every dot, or rgb array with
+                shape (N, 3). Defaults to None (HistogramDot.colors).
+            annot (bool, optional): Do we need to add values inside the dots or not. Defaults to True.
+
+        Raises:
+            DotCloudShapeException: Raises when the arrays have different lengths.
+        """
+        self.values = asarray(values)
+        count = len(self.values)
+
+        centers = asarray(centers, dtype=float)
+        if not centers.size:
+            centers = centers.reshape(0, 2)
+
+        if centers.ndim != 2 or centers.shape[0] != count or centers.shape[1] not in (2, 3):
+            detail = f"Centers must have a shape ({count}, 2) or ({count}, 3), got {centers.shape} instead."
+            raise DotCloudShapeException(detail)
+
+        self.centers = zeros((count, 3))
+        self.centers[:, :2] = centers[:, :2]
+
+        radii = HistogramDot.radius if radii is None else radii
+        self.radii = broadcast_to(asarray(radii, dtype=float), (count,)).copy()
+
+        if colors is None:
+            colors = [HistogramDot.colors.get(x, WHITE) for x in self.values.tolist()]
+        self.colors = self._colors_to_rgb(colors, count)
+
+        self.annot = annot
+
+        super().__init__(**kwargs)
+
+    @staticmethod
+    def _colors_to_rgb(colors: Union[ndarray, Sequence[Union[str, Color]]], count: int) -> ndarray:
+        if isinstance(colors, ndarray) and colors.dtype.kind == "f":
+            rgb = colors
+        else:
+            # Converting only unique colors, there are usually a few of them
+            names, inverse = unique(array([Color(x).hex_l for x in colors]), return_inverse=True)
+            rgb = array([color_to_rgb(x) for x in names]).reshape(-1, 3)[inverse]
+
+        if rgb.shape != (count, 3):
+            detail = f"Colors must have a length {count}, got {len(rgb)} instead."
+            raise DotCloudShapeException(detail)
+
+        return rgb.astype(float)
+
+    def generate_points(self):
+        """Creating one path for every color and one path for every text."""
+        self._circle_template = Dot(point=ORIGIN, radius=1).points
+
+        rgbs, self._color_group = unique(self.colors, axis=0, return_inverse=True)
+        self._color_group = self._color_group.reshape(-1)
+        self._color_slot = self._get_slots(self._color_group, len(rgbs))
+        self._circle_colors = rgbs
+
+        circles = VGroup(*[VMobject() for _ in rgbs])
+
+        labels = VGroup()
+        self._label_templates: List[ndarray] = []
+        if self.annot:
+            texts, self._label_group = unique(array([str(x) for x in self.values.tolist()]), return_inverse=True)
+            self._label_group = self._label_group.reshape(-1)
+            self._label_slot = self._get_slots(self._label_group, len(texts))
+
+            scale = HistogramDot.dot_scale_float if self.values.dtype.kind == "f" else HistogramDot.dot_scale_int
+            self._label_templates = [self._create_label_template(x, scale) for x in texts]
+
+            labels.add(*[VMobject() for _ in texts])
+
+        self.add(circles, labels)
+
+        self._update_points()
+
+    @staticmethod
+    def _get_slots(groups: ndarray, count: int) -> ndarray:
+        """Getting the position of every dot inside its group path.
+
+        Args:
+            groups (ndarray): Group index for every dot.
+            count (int): Groups count.
+
+        Returns:
+            ndarray: Index of the dot inside its group.
+        """
+        slots = zeros(len(groups), dtype=int)
+        for i in range(count):
+            indices = flatnonzero(groups == i)
+            slots[indices] = range(len(indices))
+
+        return slots
+
+    @staticmethod
+    def _create_label_template(text: str, scale: float) -> ndarray:
+        label = HistogramText(text, color=BLACK)
+        label.scale(scale)
+        label.move_to(ORIGIN)
+
+        # Spaces are invisible, they shouldn't be merged into one filled path
+        points = [x.points for x in label.family_members_with_points() if x.get_fill_opacity() > 0]
+
+        return vstack(points) if points else zeros((0, 3))
+
+    def init_colors(self):
+        super().init_colors()
+
+        for circle, rgb in zip(self.circles, self._circle_colors):
+            circle.set_fill(rgb_to_color(rgb), opacity=1)
+            circle.set_stroke(self.dot_stroke_color, width=self.dot_stroke_width)
+
+        for label in self.labels:
+            label.set_fill(self.label_color, opacity=1)
+            label.set_stroke(width=0)
+
+        return self
+
+    @property
+    def circles(self) -> VGroup:
+        return self.submobjects[0]
+
+    @property
+    def labels(self) -> VGroup:
+        return self.submobjects[1]
+
+    def _update_points(self, indices: ndarray = None):
+        """Updating paths of the dots from the centers and radii.
+
+        Args:
+            indices (ndarray, optional): Dots to update. Defaults to None (all dots).
+        """
+        if indices is None:
+            for i, circle in enumerate(self.circles):
+                members = flatnonzero(self._color_group == i)
+                circle.set_points(self._get_circles_points(members).reshape(-1, 3))
+
+            for i, label in enumerate(self.labels):
+                members = flatnonzero(self._label_group == i)
+                label.set_points(self._get_labels_points(members, i).reshape(-1, 3))
+
+            return
+
+        for i in unique(self._color_group[indices]):
+            members = indices[self._color_group[indices] == i]
+            circle = self.circles[i]
+            points = circle.points.reshape(-1, len(self._circle_template), 3)
+            points[self._color_slot[members]] = self._get_circles_points(members)
+            circle.points = points.reshape(-1, 3)
+
+        for i in unique(self._label_group[indices]) if self.annot else []:
+            if len(self._label_templates[i]) == 0:
+                continue
+
+            members = indices[self._label_group[indices] == i]
+            label = self.labels[i]
+            points = label.points.reshape(-1, len(self._label_templates[i]), 3)
+            points[self._label_slot[members]] = self._get_labels_points(members, i)
+            label.points = points.reshape(-1, 3)
+
+    def _get_circles_points(self, indices: ndarray) -> ndarray:
+        return self._circle_template[None] * self.radii[indices, None, None] + self.centers[indices, None]
+
+    def _get_labels_points(self, indices: ndarray, label: int) -> ndarray:
+        return self._label_templates[label][None] + self.centers[indices, None]
+
+    def move_dots(self, indices: Union[ndarray, Sequence[int]], centers: Union[ndarray, Sequence[ndarray]]):
+        """Moving dots to the new locations with a single array operation.
+
+        Args:
+            indices (Union[ndarray, Sequence[int]]): Indices of the dots to move.
+            centers (Union[ndarray, Sequence[ndarray]]): New dots locations with shape (N, 2) or (N, 3).
+
+        Returns:
+            DotCloud: Self.
+        """
+        indices = asarray(indices, dtype=int).reshape(-1)
+        centers = asarray(centers, dtype=float).reshape(len(indices), -1)
+
+        self.centers[indices, :2] = centers[:, :2]
+        self._update_points(indices)
+
+        return self
+
+    def get_centers(self, indices: Union[ndarray, Sequence[int]] = None) -> ndarray:
+        if indices is None:
+            return self.centers.copy()
+
+        return self.centers[asarray(indices, dtype=int)]
+
+    def shift(self, *vectors):
+        super().shift(*vectors)
+
+        # Vectors are summed the same way as Mobject.shift does, they could be lists
+        self.centers += asarray(reduce(add, vectors), dtype=float)
+
+        return self
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        """Centers are transformed with the points. Dots stay circles, so their radii and labels are scaled by
+        the area change of the function, ex. by the factor of scale, and aren't changed by shift or rotate."""
+        if about_point is None:
+            about_point = self.get_critical_point(ORIGIN if about_edge is None else about_edge)
+
+        super().apply_points_function_about_point(func, about_point)
+
+        self.centers = func(self.centers - about_point) + about_point
+
+        origin, unit_x, unit_y = func(array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=float))[:, :2]
+        (ax, ay), (bx, by) = unit_x - origin, unit_y - origin
+        factor = sqrt(abs(ax * by - ay * bx))
+        if factor != 1:
+            self.radii = self.radii * factor
+            self._label_templates = [x * factor for x in self._label_templates]
+
+        return self
+
+    def interpolate(self, mobject1, mobject2, alpha, path_func=straight_path):
+        super().interpolate(mobject1, mobject2, alpha, path_func)
+
+        if isinstance(mobject1, DotCloud) and isinstance(mobject2, DotCloud):
+            self.centers = path_func(mobject1.centers, mobject2.centers, alpha)
+            self.radii = interpolate(mobject1.radii, mobject2.radii, alpha)
+
+        return self
+
+    @classmethod
+    def from_dots(cls, dots: Sequence[HistogramDot], **kwargs) -> "DotCloud":
+        """Creating DotCloud from the group of HistogramDot.
+
+        Args:
+            dots (Sequence[HistogramDot]): Dots.
+
+        Returns:
+            DotCloud: Dots as arrays.
+        """
+        return cls(
+            values=[x.value for x in dots],
+            centers=[x.get_center() for x in dots],
+            radii=[x.radius for x in dots],
+            colors=[x[0].get_fill_color() for x in dots],
+            **kwargs,
+        )
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[CloudDot]:
+        return (CloudDot(self, i) for i in range(len(self.values)))
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[CloudDot, List[CloudDot]]:
+        if isinstance(item, slice):
+            return [CloudDot(self, i) for i in range(len(self.values))[item]]
+
+        if item < 0:
+            item += len(self.values)
+
+        if not 0 <= item < len(self.values):
+            raise IndexError("DotCloud index out of range")
+
+        return CloudDot(self, item)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} dots)"
@@ -52,6 +52,12 @@ class Funnel(VGroup):
 
         self.x_funnel_center = mean(array([self.right_top_point[0], self.left_top_point[0]]))
 
+        # Opening in the center of the funnel, where both slopes end. Calculated once to avoid reading
+        # the points of the lines for every dot
+        self.x_opening_left = self.x_funnel_center - self.point_diameter
+        self.x_opening_right = self.x_funnel_center + self.point_diameter
+        self.y_opening = self.y_point_top - 0.5
+
         self.left_to_bottom = Line(
             array([self.x_point_left, self.y_point_top, 0]),
             array([self.x_point_left, self.y_point_bottom, 0]),
@@ -61,7 +67,7 @@ class Funnel(VGroup):
 
         self.left_to_bottom_right = Line(
             array([self.x_point_left, self.y_point_top, 0]),
-            array([self.x_funnel_center - self.point_diameter, self.y_point_top - 0.5, 0]),
+            array([self.x_opening_left, self.y_opening, 0]),
             color=self.lines_color,
             stroke_width=self.stroke_width,
         )
@@ -75,21 +81,21 @@ class Funnel(VGroup):
 
         self.right_to_bottom_left = Line(
             array([self.x_point_right, self.y_point_top, 0]),
-            array([self.x_funnel_center + self.point_diameter, self.y_point_top - 0.5, 0]),
+            array([self.x_opening_right, self.y_opening, 0]),
             color=self.lines_color,
             stroke_width=self.stroke_width,
         )
 
         self.left_funnel_appendix = Line(
-            array([self.x_funnel_center + self.point_diameter, self.y_point_top - 0.5, 0]),
-            array([self.x_funnel_center + self.point_diameter, self.y_point_top - 0.7, 0]),
+            array([self.x_opening_right, self.y_opening, 0]),
+            array([self.x_opening_right, self.y_opening - 0.2, 0]),
             color=self.lines_color,
             stroke_width=self.stroke_width,
         )
 
         self.right_funnel_appendix = Line(
-            array([self.x_funnel_center - self.point_diameter, self.y_point_top - 0.5, 0]),
-            array([self.x_funnel_center - self.point_diameter, self.y_point_top - 0.7, 0]),
+            array([self.x_opening_left, self.y_opening, 0]),
+            array([self.x_opening_left, self.y_opening - 0.2, 0]),
             color=self.lines_color,
             stroke_width=self.stroke_width,
         )
@@ -1,10 +1,13 @@
 from typing import List, Tuple, Union
 
 from manimlib.imports import Scene, VGroup
+from numpy import array, bincount, cumsum, ndarray, searchsorted
 
 from classes.movable_funnel import MovableFunnel
 
+from .dot_cloud import DotCloud
 from .funnel import Funnel
+from .move_dots import Dots, get_dots_arrays
 from .shape_point import ShapePoint
 
 
@@ -13,7 +16,7 @@ class FunnelsExeption(Exception):
 
 
 class Funnels(VGroup):
-    funnels: List[Funnel] = []
+    funnels: List[Funnel]
 
     def __init__(
         self,
@@ -52,6 +55,7 @@ class Funnels(VGroup):
         self.right_top_point = ShapePoint(start_end_points[1])
         self.bins = bins
         self.count = count
+        self.funnels = []
 
         step = abs((self.right_top_point[0] - self.left_top_point[0]) / count)
         x_start_point = self.left_top_point[0]
@@ -82,13 +86,13 @@ class Funnels(VGroup):
 
         super().__init__(*self.funnels)
 
-    def drag_in_dots(self, scene: Scene, dots: VGroup, animate_slow: int, animate_rest: bool):
-        """Method for moving dots into funnels. Calls the same method drag_in_dots for every funnel
-            in self.funnels.
+    def drag_in_dots(self, scene: Scene, dots: Dots, animate_slow: int, animate_rest: bool):
+        """Method for moving dots into funnels. Every dot is assigned to its funnel once, and then
+            the method drag_in_dots is called for every funnel in self.funnels with its own dots only.
 
         Args:
             scene (Scene): Scene class.
-            dots (VGroup): Dots that we need to move.
+            dots (Dots): Dots that we need to move.
             animate_slow (int): How much dots we need to animate slowly.
             animate_rest (bool): Do we need to move rest of the dots or not.
 
@@ -97,15 +101,51 @@ class Funnels(VGroup):
         """
         if any(not isinstance(x, MovableFunnel) for x in self.funnels):
             raise FunnelsExeption('method "drag_in_dots" allowed only for "MovableFunnel"')
+
+        # Getting dot from VGroup by index is splitting the whole group
+        if not isinstance(dots, DotCloud):
+            dots = list(dots)
+
+        values, _, centers = get_dots_arrays(dots)
+
         # We are sorting dots ascending to be able to play animation from smallest dot to biggest.
-        _dots = VGroup(*sorted(dots, key=lambda x: x.value))
+        order = values.argsort(kind="stable")
+        funnels_indices = self._get_funnels_indices(centers[order, 0])
+
+        # Positions of the dots in the sorted order, grouped by funnels. Dots outside of all funnels are first.
+        positions = funnels_indices.argsort(kind="stable")
+        ends = cumsum(bincount(funnels_indices + 1, minlength=self.count + 1))
 
-        for funnel in self.funnels:
+        for i, funnel in enumerate(self.funnels):
+            funnel_positions = positions[ends[i] : ends[i + 1]]
+
+            # Funnel animates slowly its own dots among the first animate_slow sorted dots, and the next funnels
+            # have animate_slow reduced by the dots it has animated. It's kept as it was before the dots were routed,
+            # when every funnel got all dots, so the animation is the same.
             funnel.drag_in_dots(
                 scene=scene,
-                dots=_dots,
-                animate_slow=animate_slow,
+                dots=[dots[int(x)] for x in order[funnel_positions]],
+                animate_slow=int(searchsorted(funnel_positions, animate_slow)),
                 animate_rest=animate_rest,
             )
 
             animate_slow = animate_slow - funnel.animated_slowly
+
+    def _get_funnels_indices(self, xs: ndarray) -> ndarray:
+        """Getting funnel for every dot by its location.
+
+        Args:
+            xs (ndarray): Dots locations by X.
+
+        Returns:
+            ndarray: Index of the funnel for every dot, -1 for the dots outside of all funnels.
+        """
+        lefts = array([x.x_point_left for x in self.funnels])
+        rights = array([x.x_point_right for x in self.funnels])
+
+        indices = searchsorted(lefts, xs, side="right") - 1
+
+        outside = (indices < 0) | (xs > rights[indices.clip(0)])
+        indices[outside] = -1
+
+        return indices
@@ -0,0 +1,507 @@
+from math import ceil
+from typing import TYPE_CHECKING, Tuple, Union
+
+from numpy import (
+    arange,
+    argsort,
+    asarray,
+    bincount,
+    broadcast_to,
+    cumsum,
+    empty,
+    floor,
+    int64,
+    lexsort,
+    maximum,
+    minimum,
+    ndarray,
+    nonzero,
+    repeat,
+    searchsorted,
+    sqrt,
+    unique,
+    where,
+    zeros,
+)
+
+# Simulation itself is numpy only, manimlib is imported only to get the lines and the dots from the mobjects
+if TYPE_CHECKING:
+    from manimlib.imports import Mobject
+
+    from .move_dots import Dots
+
+# Neighbour cells of the grid, that are checked for every cell. Only the half of them, so every pair of cells
+# is checked once, the other half is checked from the neighbours.
+NEIGHBOUR_CELLS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+class GaltonBoardException(Exception):
+    pass
+
+
+class GaltonBoardShapeException(GaltonBoardException):
+    pass
+
+
+def get_line_segments(mobject: "Mobject") -> ndarray:
+    """Getting all lines of the mobject and its submobjects as segments, ex. slopes and walls of the funnels.
+
+    Args:
+        mobject (Mobject): Funnel, Funnels or any mobject with the lines.
+
+    Returns:
+        ndarray: Start and end points of the lines with shape (M, 2, 2).
+    """
+    from manimlib.imports import Line
+
+    lines = [x for x in mobject.get_family() if isinstance(x, Line)]
+    if not lines:
+        return zeros((0, 2, 2))
+
+    return asarray([[x.get_start()[:2], x.get_end()[:2]] for x in lines], dtype=float)
+
+
+def _expand_ranges(starts: ndarray, counts: ndarray) -> Tuple[ndarray, ndarray]:
+    """Expanding ranges into their items.
+
+    Args:
+        starts (ndarray): First item of every range.
+        counts (ndarray): Items count of every range.
+
+    Returns:
+        Tuple[ndarray, ndarray]: Index of the range for every item and the item itself.
+    """
+    owners = repeat(arange(len(starts)), counts)
+    offsets = arange(counts.sum()) - repeat(cumsum(counts) - counts, counts)
+
+    return owners, starts[owners] + offsets
+
+
+def _sum_pairs(first: ndarray, second: ndarray, values: ndarray, count: int) -> ndarray:
+    """Sums of the values for every index, added to the first items of the pairs and subtracted from the second
+    ones. The same as add.at, but much faster."""
+    return bincount(first, values, count) - bincount(second, values, count)
+
+
+def find_close_pairs(positions: ndarray, cell_size: float, max_grid_cells: int = 2 ** 22) -> Tuple[ndarray, ndarray]:
+    """Finding pairs of the points, that could be closer than cell_size. Points are put into the grid
+    with this cell size, so close points are always in the same or in the neighbour cells.
+
+    Args:
+        positions (ndarray): Points with shape (N, 2).
+        cell_size (float): Size of the grid cell, ex. the diameter of the biggest dot.
+        max_grid_cells (int, optional): Cells of the grid, that are stored as the table, the binary search is used
+            for the bigger grids. Defaults to 2 ** 22.
+
+    Returns:
+        Tuple[ndarray, ndarray]: Indices of the first and second points of every pair.
+    """
+    cells = floor(positions / cell_size).astype(int64)
+    cells -= cells.min(axis=0) - 1
+
+    # Cells are numbered by columns, with the empty row around, so neighbours never wrap to the next column
+    height = cells[:, 1].max() + 2
+    size = (cells[:, 0].max() + 2) * height
+    keys = cells[:, 0] * height + cells[:, 1]
+
+    order = argsort(keys, kind="stable")
+
+    # Points of every cell are found in the table of all cells, or by the binary search, when points are spread
+    # too far for the table
+    dense = size <= max_grid_cells
+    if dense:
+        cells_counts = bincount(keys, minlength=size)
+        cells_starts = cumsum(cells_counts) - cells_counts
+    else:
+        sorted_keys = keys[order]
+
+    # Neighbour cells of every point for every offset, one after another
+    count = len(keys)
+    neighbours = (keys[None] + asarray([dx * height + dy for dx, dy in NEIGHBOUR_CELLS])[:, None]).ravel()
+
+    if dense:
+        starts, counts = cells_starts[neighbours], cells_counts[neighbours]
+    else:
+        starts = searchsorted(sorted_keys, neighbours, side="left")
+        counts = searchsorted(sorted_keys, neighbours, side="right") - starts
+
+    owners, items = _expand_ranges(starts, counts)
+    first, second = owners % count, order[items]
+
+    # Points in the same cell are found twice and with themselves
+    keep = (owners >= count) | (first < second)
+
+    return first[keep], second[keep]
+
+
+class GaltonBoard:
+    """Simulation of the dots falling through the funnels. Locations and velocities of all dots are stored as
+    arrays and are changed all together in every step. Dots fall with gravity, bounce off the lines and each
+    other, and stack at the bottom. Collisions of the dots are found with the uniform grid, so every dot is
+    compared only with the dots in the neighbour cells.
+
+    10000 dots take about 0.08 seconds for every frame of 30 fps on one core, it's about 12 frames per second.
+    It's not enough to play them live, so the trajectories are simulated before the play.
+
+    Example:
+        board = GaltonBoard.from_mobjects(funnels, cloud)
+        scene.play(FollowTrajectories(cloud, board.simulate(duration=5, frame_rate=30)), run_time=5)
+    """
+
+    gravity: Union[int, float] = 9.8
+    # Part of the normal velocity, that is kept after the collision
+    restitution: Union[int, float] = 0.3
+    # Part of the tangential velocity, that is lost in every step of the contact with the line
+    friction: Union[int, float] = 0.05
+    # Corrections of the overlapping dots in every step, more of them make stacks more stable
+    iterations: int = 4
+    # Dots don't move further than this part of the smallest radius in one step, so they don't pass each other
+    max_step_distance: Union[int, float] = 1.5
+    # Pushes out of the lines in every step, a dot in the corner of the lines needs more than one
+    segment_iterations: int = 3
+    # Dots in the stack are pushed down by gravity in every step, and they are pushed back only partly with the big
+    # steps, so the stack falls apart, even when all dots are slow
+    min_substeps: int = 4
+    max_substeps: int = 64
+    # Dots don't move faster than this, it's the air resistance and it keeps the substeps count small
+    max_speed: Union[int, float] = 6
+    # Cells of the grid, that are stored as the table, the binary search is used for the bigger grids
+    max_grid_cells: int = 2 ** 22
+
+    def __init__(
+        self,
+        segments: Union[ndarray, list],
+        centers: Union[ndarray, list],
+        radii: Union[float, ndarray, list],
+        velocities: Union[ndarray, list] = None,
+        floor_y: float = None,
+        gravity: Union[int, float] = None,
+        restitution: Union[int, float] = None,
+        friction: Union[int, float] = None,
+    ):
+        """Class initialization.
+
+        Args:
+            segments (Union[ndarray, list]): Lines, that dots collide with, as start and end points with shape
+                (M, 2, 2).
+            centers (Union[ndarray, list]): Dots locations with shape (N, 2) or (N, 3).
+            radii (Union[float, ndarray, list]): Radius for all dots or for every dot.
+            velocities (Union[ndarray, list], optional): Dots velocities with shape (N, 2). Defaults to None
+                (dots are resting).
+            floor_y (float, optional): Dots don't fall below it. Defaults to None (the lowest point of the lines).
+            gravity (Union[int, float], optional): Acceleration in the frame units per second squared.
+                Defaults to None (GaltonBoard.gravity).
+            restitution (Union[int, float], optional): Bounciness from 0 to 1. Defaults to None
+                (GaltonBoard.restitution).
+            friction (Union[int, float], optional): Friction from 0 to 1. Defaults to None (GaltonBoard.friction).
+
+        Raises:
+            GaltonBoardShapeException: Raises when the arrays have wrong shapes.
+        """
+        self.segments = asarray(segments, dtype=float)
+        if self.segments.ndim != 3 or self.segments.shape[1:] != (2, 2):
+            detail = f"Segments must have a shape (M, 2, 2), got {self.segments.shape} instead."
+            raise GaltonBoardShapeException(detail)
+
+        centers = asarray(centers, dtype=float)
+        if centers.ndim != 2 or centers.shape[1] not in (2, 3):
+            detail = f"Centers must have a shape (N, 2) or (N, 3), got {centers.shape} instead."
+            raise GaltonBoardShapeException(detail)
+
+        count = len(centers)
+        self.positions = centers[:, :2].copy()
+        self.radii = broadcast_to(asarray(radii, dtype=float), (count,)).copy()
+        self.velocities = zeros((count, 2)) if velocities is None else asarray(velocities, dtype=float).copy()
+
+        if self.velocities.shape != (count, 2):
+            detail = f"Velocities must have a shape ({count}, 2), got {self.velocities.shape} instead."
+            raise GaltonBoardShapeException(detail)
+
+        if floor_y is None and len(self.segments):
+            floor_y = self.segments[:, :, 1].min()
+        self.floor_y = floor_y
+
+        self.gravity = self.gravity if gravity is None else gravity
+        self.restitution = self.restitution if restitution is None else restitution
+        self.friction = self.friction if friction is None else friction
+
+        self.time = 0.0
+
+        # Segments don't change, so their vectors are calculated once
+        self._starts = self.segments[:, 0]
+        self._vectors = self.segments[:, 1] - self.segments[:, 0]
+        self._lengths = (self._vectors ** 2).sum(axis=1).clip(1e-12)
+        self._lows, self._highs = self.segments.min(axis=1), self.segments.max(axis=1)
+
+    @classmethod
+    def from_mobjects(cls, colliders: "Mobject", dots: "Dots", **kwargs) -> "GaltonBoard":
+        """Creating the simulation from the lines of the mobject and the dots.
+
+        Args:
+            colliders (Mobject): Funnel, Funnels or any mobject with the lines.
+            dots (Dots): DotCloud or any sequence of dots.
+
+        Returns:
+            GaltonBoard: Simulation with the dots at their current locations.
+        """
+        from .move_dots import get_dots_arrays
+
+        _, radii, centers = get_dots_arrays(dots)
+
+        return cls(get_line_segments(colliders), centers, radii, **kwargs)
+
+    def simulate(self, duration: Union[int, float], frame_rate: Union[int, float]) -> ndarray:
+        """Running the simulation and recording dots locations in every frame.
+
+        Args:
+            duration (Union[int, float]): Time of the simulation in seconds.
+            frame_rate (Union[int, float]): Samples per second.
+
+        Returns:
+            ndarray: Dots locations with shape (frames + 1, N, 2), the first sample is the current state.
+        """
+        frames = max(ceil(duration * frame_rate), 1)
+        trajectories = empty((frames + 1, len(self.positions), 2))
+        trajectories[0] = self.positions
+
+        for i in range(1, frames + 1):
+            self.step(duration / frames)
+            trajectories[i] = self.positions
+
+        return trajectories
+
+    def step(self, dt: float):
+        """Advancing the simulation by dt seconds. It's split into the substeps, so the fastest dot moves less than
+        the part of the smallest radius in every one of them."""
+        if not len(self.positions):
+            self.time += dt
+            return
+
+        speed = sqrt((self.velocities ** 2).sum(axis=1).max()) + self.gravity * dt
+        distance = self.max_step_distance * self.radii.min()
+        substeps = min(max(ceil(speed * dt / distance), self.min_substeps), self.max_substeps)
+
+        h = dt / substeps
+        for _ in range(substeps):
+            previous = self.positions.copy()
+
+            self.velocities[:, 1] -= self.gravity * h
+            self._limit_speed()
+            self.positions += self.velocities * h
+            moved = self.positions.copy()
+
+            # Dots move a little in the corrections, so the pairs are found once for all of them
+            pairs = self._find_pairs()
+            for _ in range(self.iterations):
+                self._collide_dots(*pairs)
+
+            # Lines go last, so dots pushed by other dots don't stay inside the lines
+            self._collide_segments(previous)
+            self._collide_floor()
+
+            self._stop_pushed(moved)
+
+        self.time += dt
+
+    def _limit_speed(self):
+        speeds = sqrt((self.velocities ** 2).sum(axis=1))
+        (fast,) = nonzero(speeds > self.max_speed)
+        if len(fast):
+            self.velocities[fast] *= (self.max_speed / speeds[fast])[:, None]
+
+    def _stop_pushed(self, moved: ndarray):
+        """Removing the velocities against the corrections of the locations. Corrections don't change the velocities,
+        so the dots in the stack would be pushed back in every step, but they would fall faster and faster.
+
+        Args:
+            moved (ndarray): Dots locations before the corrections with shape (N, 2).
+        """
+        pushes = self.positions - moved
+        lengths = sqrt((pushes ** 2).sum(axis=1))
+        (dots,) = nonzero(lengths > 1e-12)
+
+        directions = pushes[dots] / lengths[dots, None]
+        against = minimum((self.velocities[dots] * directions).sum(axis=1), 0)
+        self.velocities[dots] -= against[:, None] * directions
+
+    def _bounce(self, indices: ndarray, normals: ndarray, friction: float) -> ndarray:
+        """Velocities of the dots after the collision with the surface.
+
+        Args:
+            indices (ndarray): Dots, that collide.
+            normals (ndarray): Unit normals of the surface towards the dots with shape (K, 2).
+            friction (float): Part of the tangential velocity, that is lost.
+
+        Returns:
+            ndarray: Changes of the velocities with shape (K, 2).
+        """
+        velocities = self.velocities[indices]
+        normal = (velocities * normals).sum(axis=1, keepdims=True)
+        tangent = velocities - normal * normals
+
+        # Dots moving into the surface are bounced, dots moving away from it keep their normal velocity
+        normal = where(normal < 0, -self.restitution * normal, normal)
+
+        return tangent * (1 - friction) + normal * normals - velocities
+
+    def _collide_segments(self, previous: ndarray):
+        """Pushing the dots out of the lines. Lines are thin, so a dot pushed by the other dots could pass the middle
+        of the line in one step, and the closest point would push it further. Dots are pushed back to the side of the
+        line, where they were at the start of the step, and dots, that crossed the line, are found as well.
+
+        Args:
+            previous (ndarray): Dots locations at the start of the step with shape (N, 2).
+        """
+        if not len(self.segments):
+            return
+
+        # Only the dots inside the boxes of the segments could touch them. Dots are sorted by x, so the dots
+        # inside every box by x are the range of the sorted dots. Boxes are bigger by the moves of the dots,
+        # so the dots, that crossed the lines, are inside them too.
+        xs, ys, radii = self.positions[:, 0], self.positions[:, 1], self.radii
+        margin = radii.max() + abs(xs - previous[:, 0]).max()
+        order = argsort(xs)
+        sorted_xs = xs[order]
+
+        starts = searchsorted(sorted_xs, self._lows[:, 0] - margin, side="left")
+        counts = searchsorted(sorted_xs, self._highs[:, 0] + margin, side="right") - starts
+
+        segments, positions = _expand_ranges(starts, counts)
+        dots = order[positions]
+
+        lows, highs = minimum(ys, previous[:, 1]) - radii, maximum(ys, previous[:, 1]) + radii
+        near = (highs[dots] > self._lows[segments, 1]) & (lows[dots] < self._highs[segments, 1])
+        dots, segments = dots[near], segments[near]
+
+        moved = zeros(len(self.positions), dtype=bool)
+        for _ in range(self.segment_iterations):
+            if not len(dots):
+                return
+
+            touching, normals, depths = self._get_segment_contacts(dots, segments, previous)
+            if not touching.any():
+                return
+
+            # Dot touching several segments, ex. at their common end, is pushed out of the deepest one only.
+            # Otherwise it's bounced and corrected by every segment, and it gains energy. Other segments are
+            # checked again after the push, ex. in the corner of two lines.
+            touched, normals, depths = dots[touching], normals[touching], depths[touching]
+            order = lexsort((-depths, touched))
+            _, deepest = unique(touched[order], return_index=True)
+            deepest = order[deepest]
+
+            touched, normals, depths = touched[deepest], normals[deepest], depths[deepest]
+            self.velocities[touched] += self._bounce(touched, normals, self.friction)
+            self.positions[touched] += normals * depths[:, None]
+
+            moved[:] = False
+            moved[touched] = True
+            keep = moved[dots]
+            dots, segments = dots[keep], segments[keep]
+
+    def _get_segment_contacts(
+        self, dots: ndarray, segments: ndarray, previous: ndarray
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """Finding the contacts of the dots with the segments.
+
+        Args:
+            dots (ndarray): Dots of the pairs.
+            segments (ndarray): Segments of the pairs.
+            previous (ndarray): Dots locations at the start of the step with shape (N, 2).
+
+        Returns:
+            Tuple[ndarray, ndarray, ndarray]: Mask of the touching pairs, unit normals towards the dots
+                with shape (K, 2) and depths of the dots in the segments.
+        """
+        relative = self.positions[dots] - self._starts[segments]
+        previous_relative = previous[dots] - self._starts[segments]
+        vectors, lengths = self._vectors[segments], self._lengths[segments]
+        t = (relative * vectors).sum(axis=1) / lengths
+
+        # Signed distances to the lines, positive on the side, where the dots were at the start of the step
+        normals = vectors[:, ::-1] * [-1, 1] / sqrt(lengths)[:, None]
+        sides = (relative * normals).sum(axis=1)
+        previous_sides = (previous_relative * normals).sum(axis=1)
+        previous_sides = where(previous_sides == 0, sides, previous_sides)
+        normals[previous_sides < 0] *= -1
+        sides = where(previous_sides < 0, -sides, sides)
+        previous_sides = abs(previous_sides)
+
+        # Dot, that crossed the line, is pushed back even if its center is past the end of the segment now
+        previous_t = (previous_relative * vectors).sum(axis=1) / lengths
+        crossing_t = previous_t + (t - previous_t) * previous_sides / (previous_sides - sides).clip(1e-12)
+        crossing = (sides < 0) & (previous_sides > 0) & (crossing_t >= 0) & (crossing_t <= 1)
+        inside = ((t >= 0) & (t <= 1)) | crossing
+
+        # Dots near the ends of the segments are pushed from the ends
+        deltas = relative - t.clip(0, 1)[:, None] * vectors
+        ends_distances = sqrt((deltas ** 2).sum(axis=1))
+        from_ends = ~inside & (ends_distances >= 1e-12)
+        normals[from_ends] = deltas[from_ends] / ends_distances[from_ends, None]
+
+        depths = self.radii[dots] - where(inside, sides, ends_distances)
+
+        return depths > 0, normals, depths
+
+    def _collide_floor(self):
+        if self.floor_y is None:
+            return
+
+        (dots,) = nonzero(self.positions[:, 1] - self.radii < self.floor_y)
+        if not len(dots):
+            return
+
+        normals = broadcast_to(asarray([[0.0, 1.0]]), (len(dots), 2))
+        self.velocities[dots] += self._bounce(dots, normals, self.friction)
+        self.positions[dots, 1] = self.floor_y + self.radii[dots]
+
+    def _find_pairs(self) -> Tuple[ndarray, ndarray, ndarray]:
+        """Finding pairs of the dots, that could overlap, and distances between their centers, when they touch.
+        Cell of the grid is as big as the biggest dot."""
+        first, second = find_close_pairs(self.positions, 2 * self.radii.max(), self.max_grid_cells)
+
+        # Most of the pairs from the neighbour cells are far from each other. Dots move a little in the corrections,
+        # so only the pairs closer than the smallest radius to the contact are corrected in this step.
+        xs, ys = self.positions[:, 0], self.positions[:, 1]
+        dx, dy = xs[second] - xs[first], ys[second] - ys[first]
+        reach = self.radii[first] + self.radii[second]
+        (close,) = nonzero(dx * dx + dy * dy < (reach + self.radii.min()) ** 2)
+
+        return first[close], second[close], reach[close]
+
+    def _collide_dots(self, first: ndarray, second: ndarray, reach: ndarray):
+        # Coordinates are taken by columns, it's faster than the reductions over the short axis
+        xs, ys = self.positions[:, 0], self.positions[:, 1]
+        dx, dy = xs[second] - xs[first], ys[second] - ys[first]
+
+        (colliding,) = nonzero(dx * dx + dy * dy < reach * reach)
+        if not len(colliding):
+            return
+
+        first, second = first[colliding], second[colliding]
+        dx, dy, reach = dx[colliding], dy[colliding], reach[colliding]
+
+        distances = sqrt(dx * dx + dy * dy)
+        inverses = 1 / distances.clip(1e-12)
+        nx, ny = dx * inverses, dy * inverses
+
+        # Dots at the same location are pushed apart vertically
+        (same,) = nonzero(distances < 1e-12)
+        nx[same], ny[same] = 0.0, 1.0
+
+        # Dot pushed by several dots at once gets the part of every impulse, otherwise the impulses are summed
+        # and the dots in the stacks are thrown away
+        count = len(self.positions)
+        contacts = bincount(first, minlength=count) + bincount(second, minlength=count)
+        shares = 1 / maximum(contacts[first], contacts[second])
+
+        # Dots are the same mass, so they share the impulse and the correction equally
+        vxs, vys = self.velocities[:, 0], self.velocities[:, 1]
+        relative = (vxs[second] - vxs[first]) * nx + (vys[second] - vys[first]) * ny
+        impulses = minimum(relative, 0) * ((1 + self.restitution) / 2) * shares
+        corrections = (reach - distances) / 2
+
+        vxs += _sum_pairs(first, second, impulses * nx, count)
+        vys += _sum_pairs(first, second, impulses * ny, count)
+        xs -= _sum_pairs(first, second, corrections * nx, count)
+        ys -= _sum_pairs(first, second, corrections * ny, count)
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
+from math import ceil, floor, log10
 from typing import Tuple
 
-from manimlib.imports import BLACK, Line, VGroup
-from numpy import array
+from manimlib.imports import BLACK, Camera, Line, VGroup
+from numpy import arange, array, concatenate, full, ndarray, stack, unique, zeros
 
 from .histogram_text import HistogramText
+from .line_batch import LineBatch
 from .shape_point import ShapePoint
 
 
@@ -16,6 +18,10 @@ class GraphLinesEmptyException(GraphException):
     pass
 
 
+class GraphCameraException(GraphException):
+    pass
+
+
 class Graph(ABC):
     """Class for drawing Graph"""
 
@@ -105,12 +111,50 @@ class Graph(ABC):
 class CategoricalGraph(Graph, VGroup):
     """Categorical Graph. Inherited from Graph"""
 
+    # Minimum gap between the labels on the screen in pixels
+    label_padding: int = 8
+
+    def __init__(
+        self,
+        *args,
+        lod: bool = False,
+        decimate_ticks: bool = False,
+        camera: Camera = None,
+        **kwargs,
+    ):
+        """Graph initialization. Receives all parameters that the Graph class needs.
+
+        Args:
+            lod (bool, optional): Level of detail mode. Only the labels that fit into the axis at the output
+                resolution are created, and the ticks are built as one LineBatch. Use it for the big bins count.
+                Defaults to False.
+            decimate_ticks (bool, optional): In the level of detail mode, create ticks only for the labeled bins.
+                Defaults to False.
+            camera (Camera, optional): Camera of the scene, labels are fitted into its resolution, ex. scene.camera.
+                It's needed in the level of detail mode. Defaults to None.
+
+        Raises:
+            GraphCameraException: Raises when the level of detail mode is used without the camera.
+        """
+        if lod and camera is None:
+            detail = "Level of detail mode needs the camera of the scene to fit the labels into its resolution."
+            raise GraphCameraException(detail)
+
+        self.lod = lod
+        self.decimate_ticks = decimate_ticks
+        self.pixels_per_unit = camera.get_pixel_width() / camera.get_frame_width() if camera is not None else None
+
+        super().__init__(*args, **kwargs)
+
     def create_graph(self) -> Tuple[list, list]:
         """Implementation of create_graph method.
 
         Returns:
             Tuple[list, list]: Tuple of the list with lines and texts.
         """
+        if self.lod:
+            return self._create_graph_lod()
+
         lines = []
         texts = []
 
@@ -182,6 +226,117 @@ class CategoricalGraph(Graph, VGroup):
 
         return texts, lines
 
+    def _create_graph_lod(self) -> Tuple[list, list]:
+        """Level of detail implementation of create_graph method. Labels are created for the bins 1, 1 + k, 1 + 2k
+            and so on only, so the count of texts depends on the axis length on the screen, not on the bins count.
+
+        Returns:
+            Tuple[list, list]: Tuple of the list with lines and texts.
+        """
+        lines = []
+        texts = []
+        ticks_starts = []
+        ticks_ends = []
+
+        # Widest label is used to calculate how many labels fit into the axis, without labels every tick is drawn
+        label = None
+        if self.annot:
+            label = HistogramText(str(self.bins), color=BLACK)
+            label.scale(self.text_scale)
+
+        if self.horizontal_line:
+            lines.append(
+                Line(
+                    self.horizontal_line[0].coords,
+                    self.horizontal_line[1].coords,
+                    color=self.color,
+                    stroke_width=self.stroke_width,
+                )
+            )
+
+            start_x = self.horizontal_line[0].coords[0]
+            y_coord = self.horizontal_line[0].coords[1]
+            step = self._get_labels_step(label.get_width(), self.step_x) if label is not None else 1
+
+            ticks_x = start_x + self._get_ticks(step) * self.step_x
+            ticks_starts.append(stack([ticks_x, full(len(ticks_x), y_coord + 0.3), zeros(len(ticks_x))], axis=1))
+            ticks_ends.append(stack([ticks_x, full(len(ticks_x), y_coord - 0.3), zeros(len(ticks_x))], axis=1))
+
+            if self.annot:
+                for i in range(1, self.bins + 1, step):
+                    text = HistogramText(str(i), color=BLACK)
+                    text.scale(self.text_scale)
+                    text.move_to(array([start_x + (i - 1) * self.step_x + (self.step_x / 2), y_coord - 0.3, 0]))
+                    texts.append(text)
+
+            if self.vertical_line:
+                lines.append(
+                    Line(
+                        self.vertical_line[0].coords,
+                        self.vertical_line[1].coords,
+                        color=self.color,
+                        stroke_width=self.stroke_width,
+                    )
+                )
+
+                start_y = self.vertical_line[0].coords[1]
+                x_coord = self.vertical_line[0].coords[0]
+                step = self._get_labels_step(label.get_height(), self.step_y) if label is not None else 1
+
+                ticks_y = start_y - self._get_ticks(step) * self.step_y
+                ticks_starts.append(stack([full(len(ticks_y), x_coord - 0.3), ticks_y, zeros(len(ticks_y))], axis=1))
+                ticks_ends.append(stack([full(len(ticks_y), x_coord + 0.3), ticks_y, zeros(len(ticks_y))], axis=1))
+
+                if self.annot:
+                    for i in range(1, self.bins + 1, step):
+                        text = HistogramText(str(i), color=BLACK)
+                        text.scale(self.text_scale)
+                        text.move_to(array([x_coord - 0.3, start_y - (i - 1) * self.step_y - (self.step_y / 2), 0]))
+                        texts.append(text)
+
+        if ticks_starts:
+            lines.append(
+                LineBatch(
+                    concatenate(ticks_starts),
+                    concatenate(ticks_ends),
+                    color=self.color,
+                    stroke_width=self.stroke_width,
+                )
+            )
+
+        return texts, lines
+
+    def _get_labels_step(self, label_size: float, bin_size: float) -> int:
+        """Calculating every which bin should be labeled, to keep the labels from overlapping on the screen.
+            Step is rounded up to 1, 2, 5, 10, 20, 50 and so on.
+
+        Args:
+            label_size (float): Size of the widest label along the axis.
+            bin_size (float): Size of the bin along the axis.
+
+        Returns:
+            int: Label every step-th bin.
+        """
+        label_pixels = label_size * self.pixels_per_unit + self.label_padding
+        bin_pixels = max(bin_size * self.pixels_per_unit, 1e-9)
+
+        min_step = max(ceil(label_pixels / bin_pixels), 1)
+
+        magnitude = 10 ** floor(log10(min_step))
+        for nice_step in (1, 2, 5, 10):
+            if nice_step * magnitude >= min_step:
+                return int(nice_step * magnitude)
+
+    def _get_ticks(self, step: int) -> ndarray:
+        """Bins borders to draw ticks at. All of them, or only the borders of the labeled bins."""
+        if not self.decimate_ticks or step == 1:
+            return arange(self.bins + 1)
+
+        # Both sides of every labeled bin, and the ends of the axis
+        labeled = arange(1, self.bins + 1, step)
+
+        return unique(concatenate(([0, self.bins], labeled - 1, labeled)))
+
 
 class ContinuousGraph(Graph, VGroup):
     def create_graph(self) -> Tuple[list, list]:
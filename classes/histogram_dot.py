@@ -1,12 +1,142 @@
-from typing import Dict, Union
+from collections import OrderedDict, namedtuple
+from typing import Dict, Tuple, Union
 
 from colour import Color
-from manimlib.imports import BLACK, WHITE, Dot, VGroup
+from manimlib.imports import BLACK, ORIGIN, WHITE, Dot, VGroup
 from numpy import ndarray
 
 from .histogram_text import HistogramText
 from .shape_point import ShapePoint
 
+PrototypesInfo = namedtuple("PrototypesInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class HistogramDotPrototypes:
+    """LRU cache with prototypes of the dot and its text. Dots with the same value, radius, color and text scale
+    are copied from one prototype, so the text is rendered only once for all of them."""
+
+    def __init__(self, maxsize: int = 256):
+        """Class initialization.
+
+        Args:
+            maxsize (int, optional): How many prototypes to keep. When the cache is full, the least recently used
+                prototype is removed. 0 disables caching. Defaults to 256.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._prototypes: "OrderedDict[tuple, Tuple[Dot, HistogramText]]" = OrderedDict()
+
+    def get(
+        self,
+        value: Union[int, float],
+        radius: Union[int, float],
+        color: Union[str, Color],
+        scale: Union[int, float],
+    ) -> Tuple[Dot, HistogramText]:
+        """Getting copies of the dot and the text for the dot located at the ORIGIN.
+
+        Args:
+            value (Union[int, float]): Text of the dot.
+            radius (Union[int, float]): Dot radius.
+            color (Union[str, Color]): Dot color.
+            scale (Union[int, float]): Text scale.
+
+        Returns:
+            Tuple[Dot, HistogramText]: Dot and text, that could be moved anywhere.
+        """
+        dot, text = self.get_prototype(value, radius, color, scale)
+
+        return dot.copy(), text.copy()
+
+    def get_prototype(
+        self,
+        value: Union[int, float],
+        radius: Union[int, float],
+        color: Union[str, Color],
+        scale: Union[int, float],
+    ) -> Tuple[Dot, HistogramText]:
+        """Getting the dot and the text without copying them. They are shared by all dots, so they must not
+            be changed, only their points and colors could be copied to other mobjects.
+
+        Args:
+            value (Union[int, float]): Text of the dot.
+            radius (Union[int, float]): Dot radius.
+            color (Union[str, Color]): Dot color.
+            scale (Union[int, float]): Text scale.
+
+        Returns:
+            Tuple[Dot, HistogramText]: Dot and text located at the ORIGIN.
+        """
+        # Color isn't hashable, and the same color could be passed in different formats
+        key = (str(value), radius, Color(color).hex_l, scale)
+
+        prototype = self._prototypes.get(key)
+        if prototype is None:
+            self.misses += 1
+            prototype = self._create_prototype(value, radius, color, scale)
+
+            if self.maxsize > 0:
+                self._prototypes[key] = prototype
+
+                if len(self._prototypes) > self.maxsize:
+                    self._prototypes.popitem(last=False)
+
+        else:
+            self.hits += 1
+            self._prototypes.move_to_end(key)
+
+        return prototype
+
+    @staticmethod
+    def _create_prototype(
+        value: Union[int, float],
+        radius: Union[int, float],
+        color: Union[str, Color],
+        scale: Union[int, float],
+    ) -> Tuple[Dot, HistogramText]:
+        """Creating the dot and the text at the ORIGIN.
+
+        Args:
+            value (Union[int, float]): Text of the dot.
+            radius (Union[int, float]): Dot radius.
+            color (Union[str, Color]): Dot color.
+            scale (Union[int, float]): Text scale.
+
+        Returns:
+            Tuple[Dot, HistogramText]: Dot and text.
+        """
+        dot = Dot(
+            point=ORIGIN,
+            radius=radius,
+            color=color,
+            stroke_color=BLACK,
+            stroke_width=1,
+        )
+        text = HistogramText(str(value), color=BLACK)
+
+        # We are changing the text size to be able to add it inside a dot
+        text.scale(scale)
+
+        # Moving text inside a dot
+        text.move_to(dot.get_center())
+
+        return dot, text
+
+    def info(self) -> PrototypesInfo:
+        """Cache statistics, the same way as functools.lru_cache does.
+
+        Returns:
+            PrototypesInfo: Hits, misses, maximum and current size of the cache.
+        """
+        return PrototypesInfo(self.hits, self.misses, self.maxsize, len(self._prototypes))
+
+    def clear(self):
+        """Removing all prototypes and resetting statistics."""
+        self._prototypes.clear()
+        self.hits = 0
+        self.misses = 0
+
 
 class HistogramDot(VGroup):
     """This class contains Dot, Text and all needed info that we want, such as 'value'"""
@@ -22,10 +152,13 @@ class HistogramDot(VGroup):
     dot_scale_int: Union[int, float] = 0.4
     radius: Union[int, float] = 0.2
 
+    # Shared between all dots, so every unique dot is rendered only once
+    prototypes: HistogramDotPrototypes = HistogramDotPrototypes()
+
     def __init__(
         self,
         value: int,
-        point: ndarray,
+        point: Union[ndarray, ShapePoint],
         radius: float = None,
         color: Color = None,
     ):
@@ -33,7 +166,7 @@ class HistogramDot(VGroup):
 
         Args:
             value (int): Text of the dot.
-            point (array): Location on the screen.
+            point (Union[ndarray, ShapePoint]): Location on the screen. ShapePoint is used as it is.
             radius (float, optional): Dot radius. Defaults to None.
             color (Color, optional): Dot color. Defaults to None.
         """
@@ -44,25 +177,19 @@ class HistogramDot(VGroup):
         if not color:
             color = self.colors.get(value, WHITE)
 
-        dot = Dot(
-            point=point,
-            radius=self.radius,
-            color=color,
-            stroke_color=BLACK,
-            stroke_width=1,
-        )
-        text = HistogramText(str(self.value), color=BLACK)
-
-        self.point = ShapePoint(point)
+        self.point = point if isinstance(point, ShapePoint) else ShapePoint(point)
 
-        # We are changing the text size to be able to add it inside a d
+        # We are changing the text size to be able to add it inside a dot
         if isinstance(self.value, float):
-            text.scale(self.dot_scale_float)
+            scale = self.dot_scale_float
         else:
-            text.scale(self.dot_scale_int)
+            scale = self.dot_scale_int
 
-        # Moving text inside a dot
-        text.move_to(dot.get_center())
+        dot, text = self.prototypes.get(self.value, self.radius, color, scale)
+
+        # Prototypes are located at the ORIGIN, so we are moving them to the dot location
+        dot.shift(self.point.coords)
+        text.shift(self.point.coords)
 
         super().__init__(dot, text)
 
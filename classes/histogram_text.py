@@ -1,7 +1,36 @@
-from manimlib.imports import Text
+import os
+from typing import List, Optional
+
+from manimlib.imports import Text, VMobject, digest_config
+from numpy import ndarray
+
+from .text_cache import TextGeometryCache
 
 TEXT_FONT_FAMILY = "Suisse Intl Regular"
 
+# Rendered texts are stored here between runs. Call HistogramText.geometry_cache.invalidate(TEXT_FONT_FAMILY)
+# after replacing the font file with the same family name.
+TEXT_CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "texts")
+TEXT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Settings that change the geometry of the text. Colors aren't here, they are applied after loading.
+TEXT_GEOMETRY_SETTINGS = (
+    "font",
+    "slant",
+    "weight",
+    "size",
+    "lsh",
+    "tab_width",
+    "height",
+    "width",
+    "should_center",
+    "unpack_groups",
+)
+
+# Settings that find parts of the text by indexes. Text is rendered without the cache with them, so the indexes are
+# the same as Text has.
+TEXT_INDEXED_SETTINGS = ("t2c", "t2f", "t2g", "t2s", "t2w")
+
 
 class HistogramText(Text):
     """Overridden class of Text to assign a new font"""
@@ -9,3 +38,74 @@ class HistogramText(Text):
     CONFIG = {
         "font": TEXT_FONT_FAMILY,
     }
+
+    # Set it to None to render every text from scratch
+    geometry_cache: Optional[TextGeometryCache] = TextGeometryCache(TEXT_CACHE_DIRECTORY, TEXT_CACHE_MAX_BYTES)
+
+    _geometry: Optional[List[ndarray]] = None
+
+    def __init__(self, text: str, **config):
+        """Class initialization. Geometry of the text is taken from the disk cache when it is possible.
+
+        Args:
+            text (str): Text to render.
+        """
+        if self.geometry_cache is None:
+            super().__init__(text, **config)
+            return
+
+        self.full2short(config)
+        digest_config(self, config)
+
+        if any(getattr(self, name) for name in TEXT_INDEXED_SETTINGS):
+            super().__init__(text, **config)
+            return
+
+        style = {name: getattr(self, name) for name in TEXT_GEOMETRY_SETTINGS}
+        key = self.geometry_cache.key(text, self.font, style)
+
+        cached = self.geometry_cache.load(key)
+        if cached is None:
+            super().__init__(text, **config)
+            self._save_geometry(key)
+            return
+
+        points, visible = cached
+
+        # Text.__init__ renders svg and parses it, we are skipping it and creating characters from the points
+        self._geometry = points
+        VMobject.__init__(self, **config)
+        self._geometry = None
+
+        # Spaces are invisible characters, but they still count when the text is indexed
+        for submobject, is_visible in zip(self.submobjects, visible):
+            if not is_visible:
+                submobject.set_fill(opacity=0)
+                submobject.set_stroke(opacity=0)
+
+        # The same attributes as Text sets after rendering
+        self.text = text
+        self.lsh = self.size if self.lsh == -1 else self.lsh
+
+        if self.gradient:
+            self.set_color_by_gradient(*self.gradient)
+
+    def generate_points(self):
+        if self._geometry is None:
+            return super().generate_points()
+
+        self.add(*[VMobject().set_points(points) for points in self._geometry])
+
+    def _save_geometry(self, key: str):
+        """Saving points of the characters to the disk cache.
+
+        Args:
+            key (str): Cache key.
+        """
+        if any(x.submobjects for x in self.submobjects):
+            # Nested characters can't be restored from the flat list of points
+            return
+
+        visible = [x.get_fill_opacity() > 0 or x.get_stroke_opacity() > 0 for x in self.submobjects]
+
+        self.geometry_cache.save(key, [x.points for x in self.submobjects], visible)
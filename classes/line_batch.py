@@ -0,0 +1,50 @@
+from typing import Sequence, Union
+
+from manimlib.imports import VMobject
+from numpy import array, asarray, ndarray
+
+
+class LineBatchException(Exception):
+    pass
+
+
+class LineBatchShapeException(LineBatchException):
+    pass
+
+
+class LineBatch(VMobject):
+    """Lots of straight lines as one VMobject. Every line is a separate bezier curve, so it looks the same
+    as the group of Line, but it's only one mobject with one array of points."""
+
+    # Control points of the straight bezier curve, the same as Line has
+    _curve_alphas: ndarray = array([0, 1 / 3, 2 / 3, 1])
+
+    def __init__(
+        self,
+        starts: Union[ndarray, Sequence[Sequence[float]]],
+        ends: Union[ndarray, Sequence[Sequence[float]]],
+        **kwargs,
+    ):
+        """Class initialization.
+
+        Args:
+            starts (Union[ndarray, Sequence[Sequence[float]]]): Start points of the lines with shape (N, 3).
+            ends (Union[ndarray, Sequence[Sequence[float]]]): End points of the lines with shape (N, 3).
+
+        Raises:
+            LineBatchShapeException: Raises when starts and ends have different shapes.
+        """
+        self.starts = asarray(starts, dtype=float).reshape(-1, 3)
+        self.ends = asarray(ends, dtype=float).reshape(-1, 3)
+
+        if self.starts.shape != self.ends.shape:
+            detail = f"Starts and ends must have the same shape, got {self.starts.shape} and {self.ends.shape}."
+            raise LineBatchShapeException(detail)
+
+        super().__init__(**kwargs)
+
+    def generate_points(self):
+        directions = self.ends - self.starts
+        points = self.starts[:, None] + directions[:, None] * self._curve_alphas[None, :, None]
+
+        self.set_points(points.reshape(-1, 3))
@@ -1,11 +1,11 @@
-from copy import deepcopy
-from typing import Dict, Tuple, Union
+from typing import Dict, Sequence, Tuple, Union
 
-from manimlib.imports import ApplyMethod, Scene, Transform, VGroup
-from numpy import array, interp
+from manimlib.imports import Scene, VGroup
+from numpy import array, asarray, broadcast_to, concatenate, cumsum, flatnonzero, full, nan, ndarray
 
 from .funnel import Funnel
 from .histogram_dot import HistogramDot
+from .move_dots import MoveToTargets, get_dots_arrays, move_dot
 
 
 class MovableFunnelException(Exception):
@@ -60,48 +60,75 @@ class MovableFunnel(Funnel):
                 Tuple[None, None, None,]
             ]: Tuple with the points for the next dot move (fall).
         """
-        # Getting all needed coordinates of the funnel
-        current_coord = self._next_dots_coords.get("y")
-        x_left_to_bottom_right = self.left_to_bottom_right.get_all_points()[-1][0]
-        x_right_to_bottom_left = self.right_to_bottom_left.get_all_points()[-1][0]
-        funnel_center_y = self.left_to_bottom_right.get_all_points()[-1][1] + 0.1
+        first_points, second_points, third_points, on_slope, inside = self.get_next_dots_coords(
+            [dot.get_x()], [dot.radius]
+        )
 
-        point_x = dot.get_x()
-        first_point = None
-        second_point = None
+        if not inside[0]:
+            return None, None, None
 
-        # Looking for the Line for Dot to move (fall)
-        if self.x_point_left <= point_x <= x_left_to_bottom_right:
-            line = self.left_to_bottom_right
+        if not on_slope[0]:
+            return None, None, third_points[0]
 
-        elif x_right_to_bottom_left <= point_x <= self.x_point_right:
-            line = self.right_to_bottom_left
+        return first_points[0], second_points[0], third_points[0]
 
-        elif x_left_to_bottom_right < point_x < x_right_to_bottom_left:
-            line = None
+    def get_next_dots_coords(
+        self,
+        xs: Union[ndarray, Sequence[float]],
+        radii: Union[float, ndarray, Sequence[float]],
+    ) -> Tuple[ndarray, ndarray, ndarray, ndarray, ndarray]:
+        """Getting points of the fall for all dots at once. Dots are stacked in the funnel in the order they were
+            passed, the same way as calling _get_next_dots_coords for every dot does.
 
-        else:
-            return None, None, None
+        Args:
+            xs (Union[ndarray, Sequence[float]]): Dots locations by X.
+            radii (Union[float, ndarray, Sequence[float]]): Radius for all dots or for every dot.
 
-        if line is not None:
-            # Getting all X, Y points from the line
-            line_x = [x[0] for x in line.get_all_points()]
-            line_y = [x[1] for x in line.get_all_points()]
+        Returns:
+            Tuple[ndarray, ndarray, ndarray, ndarray, ndarray]: First, second and third points with shape (N, 3),
+                mask of the dots that fall on the slopes (only they have first and second points), and mask
+                of the dots that fall into the funnel (only they have the third point). Missing points are NaN.
+        """
+        xs = asarray(xs, dtype=float).reshape(-1)
+        radii = broadcast_to(asarray(radii, dtype=float), xs.shape)
+
+        # Looking for the Line for Dot to move (fall)
+        left = (self.x_point_left <= xs) & (xs <= self.x_opening_left)
+        right = (self.x_opening_right <= xs) & (xs <= self.x_point_right) & ~left
+        middle = (self.x_opening_left < xs) & (xs < self.x_opening_right)
 
-            # Where the magic happens. We're interpolating Y from other X, Y points.
-            point_y = interp(point_x, line_x, line_y, period=10)
-            point_y += 0.25
+        on_slope = left | right
+        inside = on_slope | middle
 
-            first_point = array([point_x, point_y, 0])
+        first_points = full((len(xs), 3), nan)
+        second_points = full((len(xs), 3), nan)
+        third_points = full((len(xs), 3), nan)
 
-            second_point = array([self.x_funnel_center, funnel_center_y, 0])
+        # Dots are falling on the slope right under them, and then rolling into the opening
+        first_points[on_slope, 0] = xs[on_slope]
+        first_points[on_slope, 2] = 0
+        first_points[left, 1] = self._get_slope_y(xs[left], self.x_point_left, self.x_opening_left)
+        first_points[right, 1] = self._get_slope_y(xs[right], self.x_point_right, self.x_opening_right)
+        first_points[on_slope, 1] += 0.25
 
-        third_point = array([self.x_funnel_center, current_coord, 0])
+        second_points[on_slope] = [self.x_funnel_center, self.y_opening + 0.1, 0]
+
+        # Stacking dots at the bottom of the funnel, starting from the first free place
+        current_coord = self._next_dots_coords.get("y")
+        stacked_y = cumsum(concatenate(([current_coord], radii[inside] + self.dot_padding)))
+
+        third_points[inside, 0] = self.x_funnel_center
+        third_points[inside, 1] = stacked_y[:-1]
+        third_points[inside, 2] = 0
 
         # Remembering current position
-        self._next_dots_coords["y"] = current_coord + dot.radius + self.dot_padding
+        self._next_dots_coords["y"] = stacked_y[-1]
 
-        return first_point, second_point, third_point
+        return first_points, second_points, third_points, on_slope, inside
+
+    def _get_slope_y(self, xs: ndarray, x_top: float, x_opening: float) -> ndarray:
+        """Where the magic happens. We're interpolating Y of the slope from its top and bottom points."""
+        return self.y_point_top + (xs - x_top) * (self.y_opening - self.y_point_top) / (x_opening - x_top)
 
     def drag_in_dots(self, scene: Scene, dots: VGroup, animate_slow: int, animate_rest: bool):
         """Moving dots from anywhere to the funnel.
@@ -124,30 +151,20 @@ class MovableFunnel(Funnel):
                 continue
 
             if first_point is not None:
-                scene.play(ApplyMethod(dot.move_to, first_point), run_time=self.run_time)
+                scene.play(move_dot(dot, first_point), run_time=self.run_time)
 
-                scene.play(ApplyMethod(dot.move_to, second_point), run_time=self.run_time)
+                scene.play(move_dot(dot, second_point), run_time=self.run_time)
 
-            scene.play(ApplyMethod(dot.move_to, third_point), run_time=self.run_time)
+            scene.play(move_dot(dot, third_point), run_time=self.run_time)
 
             animated_slowly += 1
 
-        dots_rest = deepcopy(dots[animate_slow:])
-
-        for dot in dots_rest:
-            *_, third_point = self._get_next_dots_coords(dot)
-            if third_point is None:
-                continue
-
-            dot.move_to(third_point)
-
-        if dots_rest:
-            if animate_rest:
-                scene.play(Transform(dots[animate_slow:], dots_rest))
-
-            else:
-                scene.add(dots_rest)
+        dots_rest = list(dots[animate_slow:])
+        _, radii, centers = get_dots_arrays(dots_rest)
+        *_, third_points, _, inside = self.get_next_dots_coords(centers[:, 0], radii)
 
-            scene.remove(dots_rest)
+        # Only the dots that fall into the funnel are moving, all others are staying where they are
+        if dots_rest and animate_rest:
+            scene.play(MoveToTargets([dots_rest[i] for i in flatnonzero(inside)], third_points[inside]))
 
         self.animated_slowly = animated_slowly
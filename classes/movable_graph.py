@@ -1,22 +1,49 @@
 from abc import ABC
-from copy import deepcopy
-from typing import Dict, Union
-
-from manimlib.imports import DEFAULT_ANIMATION_RUN_TIME, ApplyMethod, Scene, Transform, VGroup
-from numpy import array, ndarray
-
+from typing import Sequence, Union
+
+from manimlib.imports import DEFAULT_ANIMATION_RUN_TIME, Scene, VGroup
+from numpy import (
+    arange,
+    array,
+    asarray,
+    bincount,
+    broadcast_to,
+    concatenate,
+    cumsum,
+    flatnonzero,
+    full,
+    ndarray,
+    uint16,
+    zeros,
+)
+
+from .dot_cloud import DotCloud
 from .graph import CategoricalGraph, ContinuousGraph
 from .histogram_dot import HistogramDot
+from .move_dots import Dots, MoveToTargets, StaggeredMove, get_dots_arrays, move_dot
+
+
+class MovableException(Exception):
+    pass
+
+
+class DotOutOfBinsException(MovableException):
+    pass
 
 
 class Movable(ABC):
     """Abstract class to add 'movable' functionality to the graph"""
 
-    _next_dot_coords: Dict[Union[int, float], Dict[str, Union[int, float]]] = {}
     dot_padding: Union[int, float] = 0
 
+    # Center of every bin by X and the next free place by Y. Bin with the value 1 has the index 0
+    _bins_x: ndarray
+    _bins_y: ndarray
+
     def __init__(self, *args, **kwargs):
-        self._next_dots_coords = self._prepare_next_dot_coords()
+        next_dots_coords = self._prepare_next_dot_coords()
+        self._bins_x = array([x["x"] for x in next_dots_coords.values()], dtype=float)
+        self._bins_y = array([x["y"] for x in next_dots_coords.values()], dtype=float)
 
         super().__init__(*args, **kwargs)
 
@@ -29,12 +56,71 @@ class Movable(ABC):
         Returns:
             array: Next dot location.
         """
-        current_coord = self._next_dots_coords.get(int(dot.value), {})
-        bin_center = array([current_coord.get("x", 0), current_coord.get("y", 0), 0])
+        return self.get_next_dots_coords([dot.value], [dot.radius])[0]
+
+    def get_next_dots_coords(
+        self,
+        values: Union[ndarray, Sequence[Union[int, float]]],
+        radii: Union[float, ndarray, Sequence[float]],
+    ) -> ndarray:
+        """Getting points for all dots to move at once. Dots are stacked in the bins in the order they were passed,
+            the same way as calling _get_next_dot_coords for every dot does.
+
+        Args:
+            values (Union[ndarray, Sequence[Union[int, float]]]): Dots values. Value is truncated to get the bin.
+            radii (Union[float, ndarray, Sequence[float]]): Radius for all dots or for every dot.
+
+        Raises:
+            DotOutOfBinsException: Raises when some value doesn't fit any bin.
+
+        Returns:
+            ndarray: Next dots locations with shape (N, 3).
+        """
+        values = asarray(values).reshape(-1)
+        radii = broadcast_to(asarray(radii, dtype=float), values.shape)
+        bins_count = len(self._bins_x)
+
+        coords = zeros((len(values), 3))
+        if not len(values):
+            return coords
+
+        indices = values.astype(int) - 1
+
+        outside = (indices < 0) | (indices >= bins_count)
+        if outside.any():
+            detail = f"Value [{values[outside][0]}] is out of the graph bins [1, {bins_count}]."
+            raise DotOutOfBinsException(detail)
+
+        # Small integers are sorted with radix sort, it's much faster for millions of dots
+        if bins_count <= 2 ** 16:
+            indices = indices.astype(uint16)
+
+        steps = radii + self.dot_padding
+
+        # Grouping dots by bins keeping their order
+        order = indices.argsort(kind="stable")
+        sorted_steps = steps[order]
+        sorted_y = zeros(len(values))
+
+        ends = cumsum(bincount(indices, minlength=bins_count))
+        for i in flatnonzero(ends - concatenate(([0], ends[:-1]))):
+            start = ends[i - 1] if i else 0
+
+            # Stacking dots inside the bin, starting from the first free place
+            bin_y = cumsum(concatenate(([self._bins_y[i]], sorted_steps[start : ends[i]])))
+            sorted_y[start : ends[i]] = bin_y[:-1]
+
+            # Remembering current position
+            self._bins_y[i] = bin_y[-1]
+
+        # Scattering contiguous array is much faster, than scattering the column of coords
+        dots_y = zeros(len(values))
+        dots_y[order] = sorted_y
 
-        self._next_dots_coords[int(dot.value)]["y"] = current_coord.get("y", 0) + dot.radius + self.dot_padding
+        coords[:, 0] = self._bins_x[indices]
+        coords[:, 1] = dots_y
 
-        return bin_center
+        return coords
 
     def drag_in_dots(
         self,
@@ -44,6 +130,7 @@ class Movable(ABC):
         animate_rest: bool,
         run_time: Union[int, float] = None,
         delay: Union[int, float] = None,
+        batched: bool = False,
     ):
         """Moving dots to the graph.
 
@@ -54,13 +141,19 @@ class Movable(ABC):
             animate_rest (bool): Do we need to move the rest of the dots or not.
             run_time (Union[int, float]): How quickly we need to animate dots. Defaults to None.
             delay (Union[int, float], optional): Delay between animations. Defaults to None.
+            batched (bool, optional): Play all moves as one animation. Looks the same, but renders much faster
+                when there are lots of slow dots. Works with DotCloud as well. Defaults to False.
         """
         if not run_time:
             run_time = DEFAULT_ANIMATION_RUN_TIME
 
+        if batched:
+            self._drag_in_dots_batched(scene, dots, animate_slow, animate_rest, run_time, delay or 0)
+            return
+
         for dot in dots[:animate_slow]:
             scene.play(
-                ApplyMethod(dot.move_to, self._get_next_dot_coords(dot)),
+                move_dot(dot, self._get_next_dot_coords(dot)),
                 run_time=run_time,
             )
 
@@ -68,18 +161,72 @@ class Movable(ABC):
                 scene.wait(delay)
 
         if animate_rest:
-            dots_rest = deepcopy(dots[animate_slow:])
+            dots_rest = dots[animate_slow:]
+            values, radii, _ = get_dots_arrays(dots_rest)
+
+            scene.play(MoveToTargets(dots_rest, self.get_next_dots_coords(values, radii)))
 
-            for dot in dots_rest:
+        else:
+            for dot in dots[animate_slow:]:
                 dot.move_to(self._get_next_dot_coords(dot))
 
-            scene.play(Transform(dots[animate_slow:], dots_rest))
+    def _drag_in_dots_batched(
+        self,
+        scene: Scene,
+        dots: Dots,
+        animate_slow: int,
+        animate_rest: bool,
+        run_time: Union[int, float],
+        delay: Union[int, float],
+    ):
+        """Moving dots to the graph with one play. Slow dots are moving one after another with the delay between
+            them, and the rest of the dots are moving all together after them.
 
-            scene.remove(dots[animate_slow:])
+        Args:
+            scene (Scene): Scene where all our objects are located.
+            dots (Dots): DotCloud or list of dots to move.
+            animate_slow (int): How many dots do we need to animate slowly.
+            animate_rest (bool): Do we need to move the rest of the dots or not.
+            run_time (Union[int, float]): How quickly we need to animate dots.
+            delay (Union[int, float]): Delay between animations.
+        """
+        values, radii, _ = get_dots_arrays(dots)
+        targets = self.get_next_dots_coords(values, radii)
+
+        animate_slow = min(animate_slow, len(values))
+        slow_time = animate_slow * (run_time + delay)
+
+        # Slow dots are going one after another, the rest of the dots are starting together after them
+        starts = full(len(values), slow_time)
+        starts[:animate_slow] = arange(animate_slow) * (run_time + delay)
 
+        durations = full(len(values), DEFAULT_ANIMATION_RUN_TIME, dtype=float)
+        durations[:animate_slow] = run_time
+
+        if animate_rest:
+            moving = len(values)
+            total_time = slow_time + DEFAULT_ANIMATION_RUN_TIME if moving > animate_slow else slow_time
         else:
-            for dot in dots[animate_slow:]:
-                dot.move_to(self._get_next_dot_coords(dot))
+            moving = animate_slow
+            total_time = slow_time
+
+        if moving:
+            scene.play(
+                StaggeredMove(
+                    dots if moving == len(values) else dots[:moving],
+                    targets[:moving],
+                    starts[:moving],
+                    durations[:moving],
+                    run_time=total_time,
+                )
+            )
+
+        # Dots, that shouldn't be animated, are just moved to their places
+        if isinstance(dots, DotCloud):
+            dots.move_dots(range(moving, len(values)), targets[moving:])
+        else:
+            for dot, target in zip(dots[moving:], targets[moving:]):
+                dot.move_to(target)
 
 
 class MovableContinuousGraph(ContinuousGraph, Movable):
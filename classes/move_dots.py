@@ -0,0 +1,263 @@
+from typing import List, Sequence, Tuple, Union
+
+from manimlib.imports import Animation, ApplyMethod, Mobject, Scene, VGroup, linear, smooth
+from numpy import allclose, array, asarray, broadcast_to, clip, flatnonzero, full, ndarray, zeros
+
+from .dot_cloud import CloudDot, DotCloud
+from .histogram_dot import HistogramDot
+
+
+class MoveDotsException(Exception):
+    pass
+
+
+class MoveDotsShapeException(MoveDotsException):
+    pass
+
+
+Dots = Union[DotCloud, Sequence[Union[HistogramDot, CloudDot]]]
+
+
+def get_dots_arrays(dots: Dots) -> Tuple[ndarray, ndarray, ndarray]:
+    """Getting values, radii and centers of the dots as arrays.
+
+    Args:
+        dots (Dots): DotCloud or any sequence of dots.
+
+    Returns:
+        Tuple[ndarray, ndarray, ndarray]: Values, radii and centers with shape (N, 3).
+    """
+    if isinstance(dots, DotCloud):
+        return dots.values, dots.radii, dots.get_centers()
+
+    dots = list(dots)
+    if not dots:
+        return zeros(0), zeros(0), zeros((0, 3))
+
+    return (
+        array([x.value for x in dots]),
+        array([x.radius for x in dots], dtype=float),
+        array([x.get_center() for x in dots], dtype=float),
+    )
+
+
+def move_dot(dot: Union[HistogramDot, CloudDot], target: ndarray) -> Animation:
+    """Animation for moving one dot to the target. ApplyMethod works only with mobjects, and CloudDot is a view
+    of the dot inside DotCloud, so it's moved with MoveToTargets.
+
+    Args:
+        dot (Union[HistogramDot, CloudDot]): Dot to move.
+        target (ndarray): Dot location at the end.
+
+    Returns:
+        Animation: Animation of the move.
+    """
+    if isinstance(dot, CloudDot):
+        return MoveToTargets([dot], [target])
+
+    return ApplyMethod(dot.move_to, target)
+
+
+class MoveToTargets(Animation):
+    """Animation for moving dots to the target locations. Unlike Transform, it doesn't need the copy of the dots
+    at the end state, only their centers, and it interpolates only the translation of every dot."""
+
+    def __init__(self, dots: Dots, targets: Union[ndarray, Sequence[ndarray]], **kwargs):
+        """Class initialization.
+
+        Args:
+            dots (Dots): DotCloud or any sequence of dots to move.
+            targets (Union[ndarray, Sequence[ndarray]]): Dots locations at the end with shape (N, 3).
+
+        Raises:
+            MoveDotsShapeException: Raises when targets count doesn't match dots count.
+        """
+        self.cloud, self.indices, self.dots = self._split_dots(dots)
+        count = len(self.indices) if self.cloud is not None else len(self.dots)
+
+        self.targets = asarray(targets, dtype=float).reshape(-1, 3)
+        if len(self.targets) != count:
+            detail = f"Targets must have a length {count}, got {len(self.targets)} instead."
+            raise MoveDotsShapeException(detail)
+
+        super().__init__(self.cloud if self.cloud is not None else VGroup(*self.dots), **kwargs)
+
+    @staticmethod
+    def _split_dots(dots: Dots) -> Tuple[Union[DotCloud, None], ndarray, List[Mobject]]:
+        """Dots of the DotCloud are moved all together by indices, other dots are moved one by one."""
+        if isinstance(dots, DotCloud):
+            return dots, array(range(len(dots)), dtype=int), []
+
+        dots = list(dots)
+        if dots and all(isinstance(x, CloudDot) for x in dots):
+            clouds = {id(x.cloud) for x in dots}
+            if len(clouds) == 1:
+                return dots[0].cloud, array([x.index for x in dots], dtype=int), []
+
+        return None, zeros(0, dtype=int), dots
+
+    def create_starting_mobject(self) -> Mobject:
+        # Only the centers are changing, so the copy of all dots isn't needed
+        return self.mobject
+
+    def begin(self):
+        if self.cloud is not None:
+            self.origins = self.cloud.get_centers(self.indices)
+        else:
+            self.origins = array([x.get_center() for x in self.dots], dtype=float).reshape(-1, 3)
+
+        self.current = self.origins.copy()
+
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        self._move_dots(array(range(len(self.origins)), dtype=int), full(len(self.origins), alpha))
+
+    def _move_dots(self, indices: ndarray, alphas: ndarray):
+        """Moving dots between their origins and targets.
+
+        Args:
+            indices (ndarray): Dots to move.
+            alphas (ndarray): Progress of every dot from 0 to 1.
+        """
+        if not len(indices):
+            return
+
+        alphas = alphas.reshape(-1, 1)
+        points = self.origins[indices] + (self.targets[indices] - self.origins[indices]) * alphas
+
+        self._set_dots_points(indices, points)
+
+    def _set_dots_points(self, indices: ndarray, points: ndarray):
+        """Moving dots to the points.
+
+        Args:
+            indices (ndarray): Dots to move.
+            points (ndarray): New dots locations with shape (N, 3).
+        """
+        if self.cloud is not None:
+            self.cloud.move_dots(self.indices[indices], points)
+
+        else:
+            for i, point in zip(indices, points):
+                self.dots[i].shift(point - self.current[i])
+
+        self.current[indices] = points
+
+    def clean_up_from_scene(self, scene: Scene):
+        super().clean_up_from_scene(scene)
+
+        # Group, that was created for the animation, was added to the scene, and the dots were taken out of their
+        # parents for it. Dots stay in the scene on their own, the same as after ApplyMethod for every dot.
+        if self.cloud is None:
+            scene.remove(self.mobject)
+            scene.add(*self.dots)
+
+
+class StaggeredMove(MoveToTargets):
+    """One animation for moving lots of dots, where every dot has its own start time and duration.
+    It renders the same as playing ApplyMethod(dot.move_to, target) for every dot one after another,
+    but the scene pays for only one play."""
+
+    CONFIG = {
+        # Time is going linearly for the whole animation, every dot is eased with dot_rate_func
+        "rate_func": linear,
+        "dot_rate_func": smooth,
+    }
+
+    def __init__(
+        self,
+        dots: Dots,
+        targets: Union[ndarray, Sequence[ndarray]],
+        starts: Union[float, Sequence[float]],
+        durations: Union[float, Sequence[float]],
+        **kwargs,
+    ):
+        """Class initialization.
+
+        Args:
+            dots (Dots): DotCloud or any sequence of dots to move.
+            targets (Union[ndarray, Sequence[ndarray]]): Dots locations at the end with shape (N, 3).
+            starts (Union[float, Sequence[float]]): Time in seconds, when every dot starts moving.
+            durations (Union[float, Sequence[float]]): How long every dot is moving in seconds.
+
+        Raises:
+            MoveDotsShapeException: Raises when targets count doesn't match dots count.
+        """
+        count = len(targets)
+
+        self.starts = broadcast_to(asarray(starts, dtype=float), (count,))
+        self.durations = broadcast_to(asarray(durations, dtype=float), (count,)).clip(1e-6)
+
+        run_time = (self.starts + self.durations).max() if count else 0
+        kwargs.setdefault("run_time", max(run_time, 1e-6))
+
+        super().__init__(dots, targets, **kwargs)
+
+    def begin(self):
+        self.last_alphas = zeros(len(self.targets))
+
+        # Rate functions with the conditions or math functions work only with numbers, they are called for every dot
+        probe = array([0.0, 0.25, 0.75, 1.0])
+        try:
+            self.vectorized_rate_func = allclose(self.dot_rate_func(probe), [self.dot_rate_func(x) for x in probe])
+        except (TypeError, ValueError):
+            self.vectorized_rate_func = False
+
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        time = alpha * self.run_time
+        alphas = clip((time - self.starts) / self.durations, 0, 1)
+
+        # Only dots, that are moving right now, or have just finished, should be updated
+        changed = flatnonzero(alphas != self.last_alphas)
+        self.last_alphas = alphas
+
+        if self.vectorized_rate_func:
+            rates = broadcast_to(self.dot_rate_func(alphas[changed]), (len(changed),))
+        else:
+            rates = array([self.dot_rate_func(x) for x in alphas[changed]], dtype=float)
+
+        self._move_dots(changed, rates)
+
+
+class FollowTrajectories(MoveToTargets):
+    """Animation for moving dots along the recorded trajectories, ex. from the simulation. Trajectories are
+    sampled evenly over the run time, dots locations between the samples are interpolated linearly."""
+
+    CONFIG = {
+        # Samples are made with the constant time step, so the time is going linearly
+        "rate_func": linear,
+    }
+
+    def __init__(self, dots: Dots, trajectories: Union[ndarray, Sequence[ndarray]], **kwargs):
+        """Class initialization.
+
+        Args:
+            dots (Dots): DotCloud or any sequence of dots to move.
+            trajectories (Union[ndarray, Sequence[ndarray]]): Dots locations in every sample with shape
+                (samples, N, 2) or (samples, N, 3).
+
+        Raises:
+            MoveDotsShapeException: Raises when trajectories have a wrong shape.
+        """
+        trajectories = asarray(trajectories, dtype=float)
+        if trajectories.ndim != 3 or not len(trajectories) or trajectories.shape[2] not in (2, 3):
+            detail = f"Trajectories must have a shape (samples, N, 2) or (samples, N, 3), got {trajectories.shape}."
+            raise MoveDotsShapeException(detail)
+
+        self.trajectories = zeros((*trajectories.shape[:2], 3))
+        self.trajectories[:, :, : trajectories.shape[2]] = trajectories
+
+        super().__init__(dots, self.trajectories[-1], **kwargs)
+
+    def interpolate_mobject(self, alpha: float):
+        position = alpha * (len(self.trajectories) - 1)
+        index = min(int(position), max(len(self.trajectories) - 2, 0))
+
+        points = self.trajectories[index]
+        if index + 1 < len(self.trajectories):
+            points = points + (self.trajectories[index + 1] - points) * (position - index)
+
+        self._set_dots_points(array(range(len(points)), dtype=int), points)
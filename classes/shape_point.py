@@ -1,6 +1,7 @@
-from typing import Tuple, Union
+import math
+from typing import Iterator, Sequence, Tuple, Union
 
-from numpy import array, ndarray
+from numpy import array, asarray, ascontiguousarray, isfinite, ndarray, zeros
 
 
 class ShapePointException(Exception):
@@ -15,14 +16,36 @@ class ShapePointTooManyValuesException(ShapePointException):
     pass
 
 
+class ShapePointNotFiniteException(ShapePointException):
+    pass
+
+
 class ShapePoint:
     """Class for validation and storing information about screen points"""
 
+    __slots__ = ("_coords",)
+
     _coords: ndarray
 
     def __init__(self, coords: Tuple[Union[int, float], Union[int, float]]):
         self.coords = coords
 
+    @classmethod
+    def from_trusted(cls, coords: ndarray) -> "ShapePoint":
+        """Creating point without validation. Coords must be already validated float array with 3 values,
+            for example the row of ShapePointArray.
+
+        Args:
+            coords (ndarray): Coordinates (x, y, 0).
+
+        Returns:
+            ShapePoint: Point, that uses the same array.
+        """
+        point = cls.__new__(cls)
+        point._coords = coords
+
+        return point
+
     @property
     def coords(self):
         return self._coords
@@ -38,6 +61,7 @@ class ShapePoint:
             ShapePointTypeError: Wrong data type was passed.
             ShapePointTooManyValuesException: You put too many variables inside tuple.
             ShapePointTypeError: Data inside tuple is in the wrong format.
+            ShapePointNotFiniteException: Coordinates are NaN or infinite.
         """
         if not isinstance(value, Tuple) and not isinstance(value, ndarray):
             detail = f"Coords must be a type of: [tuple, np.ndarray], got [{type(value)}] instead."
@@ -50,15 +74,111 @@ class ShapePoint:
             detail = "Coords must contain 2 values"
             raise ShapePointTooManyValuesException(detail)
 
-        for coord in value:
-            if not isinstance(coord, int) and not isinstance(coord, float):
-                detail = f"Values in coords must be a type of: [int, float], got [{coord}:{type(coord)}] instead."
-                raise ShapePointTypeError(detail)
+        # Arrays are checked by their type at once
+        if isinstance(value, ndarray) and value.dtype.kind in "iuf":
+            coords = array([value[0], value[1], 0], dtype=float)
+        else:
+            for coord in value:
+                if not isinstance(coord, int) and not isinstance(coord, float):
+                    detail = f"Values in coords must be a type of: [int, float], got [{coord}:{type(coord)}] instead."
+                    raise ShapePointTypeError(detail)
 
-        self._coords = array([value[0], value[1], 0])
+            coords = array([value[0], value[1], 0])
+
+        # Checking two numbers is much faster without numpy
+        if not math.isfinite(coords[0]) or not math.isfinite(coords[1]):
+            detail = "Coords must contain only finite values."
+            raise ShapePointNotFiniteException(detail)
+
+        self._coords = coords
 
     def __getitem__(self, item):
         return self.coords[item]
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.coords})"
+
+
+class ShapePointArray:
+    """Class for validation and storing lots of screen points in one contiguous array with shape (N, 3)"""
+
+    __slots__ = ("_coords",)
+
+    _coords: ndarray
+
+    def __init__(self, coords: Union[ndarray, Sequence[Sequence[Union[int, float]]]]):
+        self.coords = coords
+
+    @classmethod
+    def from_trusted(cls, coords: ndarray) -> "ShapePointArray":
+        """Creating points without validation. Coords must be already validated float array with shape (N, 3).
+
+        Args:
+            coords (ndarray): Coordinates.
+
+        Returns:
+            ShapePointArray: Points, that use the same array.
+        """
+        points = cls.__new__(cls)
+        points._coords = coords
+
+        return points
+
+    @property
+    def coords(self) -> ndarray:
+        return self._coords
+
+    @coords.setter
+    def coords(self, value: Union[ndarray, Sequence[Sequence[Union[int, float]]]]):
+        """Method -setter for validation and storing coordinates. All points are validated at once.
+
+        Args:
+            value (Union[ndarray, Sequence[Sequence[Union[int, float]]]]): Coordinates with shape (N, 2) or (N, 3).
+                Z coordinate is always set to 0, the same way as ShapePoint does.
+
+        Raises:
+            ShapePointTypeError: Data is in the wrong format.
+            ShapePointTooManyValuesException: Points have wrong count of values.
+            ShapePointNotFiniteException: Some coordinates are NaN or infinite.
+        """
+        try:
+            value = asarray(value)
+        except ValueError as e:
+            detail = f"Coords must be an array with shape (N, 2) or (N, 3), got [{type(value)}] instead."
+            raise ShapePointTypeError(detail) from e
+
+        if value.size == 0:
+            value = value.reshape(0, 2)
+
+        if value.dtype.kind not in "iuf":
+            detail = f"Values in coords must be a type of: [int, float], got [{value.dtype}] instead."
+            raise ShapePointTypeError(detail)
+
+        if value.ndim != 2 or value.shape[1] not in (2, 3):
+            detail = f"Coords must have a shape (N, 2) or (N, 3), got {value.shape} instead."
+            raise ShapePointTooManyValuesException(detail)
+
+        if not isfinite(value).all():
+            detail = "Coords must contain only finite values."
+            raise ShapePointNotFiniteException(detail)
+
+        coords = zeros((len(value), 3))
+        coords[:, :2] = value[:, :2]
+
+        self._coords = ascontiguousarray(coords)
+
+    def __len__(self):
+        return len(self._coords)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[ShapePoint, "ShapePointArray"]:
+        if isinstance(item, slice):
+            return self.from_trusted(self._coords[item])
+
+        # Point is a view of the row, so no data is copied
+        return ShapePoint.from_trusted(self._coords[item])
+
+    def __iter__(self) -> Iterator[ShapePoint]:
+        return (ShapePoint.from_trusted(x) for x in self._coords)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} points)"
@@ -1,13 +1,18 @@
 import random
-from typing import Tuple, Union
+from pathlib import Path
+from typing import Iterable, List, Tuple, Union
 
 from colour import Color
-from manimlib.imports import BLACK, LEFT_SIDE, Line, VGroup
-from numpy import array
+from manimlib.imports import BLACK, LEFT_SIDE, VGroup
+from numpy import arange, array, concatenate, cumsum, full, meshgrid, ndarray, stack, zeros
+from numpy.random import default_rng
 
+from .data_source import DataRow, DataSourceLengthException, DotsDataSource, open_data_source
+from .dot_cloud import DotCloud
 from .histogram_dot import HistogramDot
 from .histogram_text import HistogramText
-from .shape_point import ShapePoint
+from .line_batch import LineBatch
+from .shape_point import ShapePoint, ShapePointArray
 
 
 class TableException(Exception):
@@ -18,8 +23,12 @@ class TableLineEmptyException(TableException):
     pass
 
 
+class TableRowCountException(TableException):
+    pass
+
+
 class Table(VGroup):
-    """Table class. Built from Lines"""
+    """Table class. Built from one batch of lines"""
 
     def __init__(
         self,
@@ -77,63 +86,46 @@ class Table(VGroup):
         super().__init__(*self.lines, *args, **kwargs)
 
     def _create_table(self) -> VGroup:
-        """Method for creating table.
+        """Method for creating table. All lines are built at once as one LineBatch.
 
         Returns:
-            VGroup: Object made from the list of lines (Line).
+            VGroup: Object made from the table grid (LineBatch).
         """
-        lines = []
         y_point = self.horizontal_line[0][1]
         y_step = self.row_height
         x_left_point = self.horizontal_line[0][0]
         x_right_point = self.horizontal_line[1][0]
         distance = abs(x_right_point - x_left_point)
 
-        # Drawing table
-        for i in range(self.row_count + 1):
-            # Adding horizontal line
-            lines.append(
-                Line(
-                    array([x_left_point, y_point, 0]),
-                    array([x_right_point, y_point, 0]),
-                    color=self.lines_color,
-                    stroke_width=self.stroke_width,
-                )
-            )
-
-            if i == self.row_count:
-                break
-
-            # Adding verical lines
-            x_point = x_left_point
-            for j in range(self.column_count + 1):
-                lines.append(
-                    Line(
-                        array([x_point, y_point, 0]),
-                        array([x_point, y_point - y_step, 0]),
-                        color=self.lines_color,
-                        stroke_width=self.stroke_width,
-                    )
-                )
+        if self.columns_width:
+            for temp_step in self.columns_width:
+                assert isinstance(temp_step, float), "Column width must be a float value"
+                assert 0 < temp_step <= 1, "Column with must be in range [0 < column_width <= 1]"
 
-                if j == self.column_count:
-                    break
+            columns_width = array(self.columns_width) * distance
+        else:
+            columns_width = full(self.column_count, distance / self.column_count) if self.column_count else zeros(0)
 
-                if self.columns_width:
-                    temp_step = self.columns_width[j]
+        rows_y = y_point - arange(self.row_count + 1) * y_step
+        columns_x = x_left_point + concatenate(([0], cumsum(columns_width)))
 
-                    assert isinstance(temp_step, float), "Column width must be a float value"
-                    assert 0 < temp_step <= 1, "Column with must be in range [0 < column_width <= 1]"
+        # Horizontal lines for every row
+        horizontal_starts = stack([full(len(rows_y), x_left_point), rows_y, zeros(len(rows_y))], axis=1)
+        horizontal_ends = stack([full(len(rows_y), x_right_point), rows_y, zeros(len(rows_y))], axis=1)
 
-                    x_point = x_point + (distance * temp_step)
-                else:
-                    x_point = x_point + (distance / self.column_count)
-
-            y_point -= y_step
+        # Vertical lines for every cell, going column by column
+        cells_x, cells_y = meshgrid(columns_x, rows_y[:-1], indexing="ij")
+        vertical_starts = stack([cells_x.ravel(), cells_y.ravel(), zeros(cells_x.size)], axis=1)
+        vertical_ends = vertical_starts - array([0, y_step, 0])
 
-        lines = VGroup(*lines)
+        grid = LineBatch(
+            concatenate([horizontal_starts, vertical_starts]),
+            concatenate([horizontal_ends, vertical_ends]),
+            color=self.lines_color,
+            stroke_width=self.stroke_width,
+        )
 
-        return lines
+        return VGroup(grid)
 
 
 class CustomersTable(Table):
@@ -149,6 +141,9 @@ class CustomersTable(Table):
         bins: Union[int, float] = 0,
         text: str = "",
         start_dots_values: list = None,
+        dot_cloud: bool = False,
+        seed: int = None,
+        data_source: Union[str, Path, Iterable, DotsDataSource] = None,
     ):
         """Class initialization.
 
@@ -164,6 +159,17 @@ class CustomersTable(Table):
                 Defaults to "".
             start_dots_values (list, optional): List with initial values for the dots.
                 Defaults to None.
+            dot_cloud (bool, optional): Store dots as one DotCloud instead of VGroup with HistogramDot.
+                Use it for the big tables. Defaults to False.
+            seed (int, optional): Seed for the dots values, that weren't passed in start_dots_values. All values
+                are generated at once by numpy.random.Generator. Defaults to None (every row is seeded with its
+                index, the same values as before).
+            data_source (Union[str, Path, Iterable, DotsDataSource], optional): Path to the .npy or .csv file,
+                or any iterator with the dots values (or tuples with value and label). Rows are read by chunks,
+                only for the created rows. Rows after the end of the source are generated. Defaults to None.
+
+        Raises:
+            TableRowCountException: Raises when row_count isn't passed with the iterator, its length is unknown.
         """
         self.horizontal_line = [
             ShapePoint(start_end_points[0]),
@@ -178,6 +184,13 @@ class CustomersTable(Table):
         self.text_scale = 0.6
         self.start_dots_values = start_dots_values
         self.default_color = "red"
+        self.dot_cloud = dot_cloud
+        self.seed = seed
+        self._generated_values: ndarray = None
+        self.data_source = open_data_source(data_source) if data_source is not None else None
+
+        if self.data_source is not None and not row_count:
+            row_count = self._get_row_count(self.data_source)
 
         self.customers, self.dots = self._add_dots_and_customers_to_table(
             row_count=row_count,
@@ -195,7 +208,7 @@ class CustomersTable(Table):
             BLACK,
             1,
             *self.customers,
-            *self.dots,
+            *([self.dots] if self.dot_cloud else self.dots),
         )
 
     def _add_dots_and_customers_to_table(
@@ -203,7 +216,7 @@ class CustomersTable(Table):
         row_height: Union[int, float],
         row_count: int,
         columns_width: Tuple,
-    ) -> Tuple[VGroup, VGroup]:
+    ) -> Tuple[VGroup, Union[VGroup, DotCloud]]:
         """Method for creating dots and texts.
 
         Args:
@@ -212,10 +225,10 @@ class CustomersTable(Table):
             columns_width (Tuple): Table rows width.
 
         Returns:
-            Tuple[VGroup, VGroup]: Tuple with all dots and texts.
+            Tuple[VGroup, Union[VGroup, DotCloud]]: Tuple with all dots and texts.
         """
         customers = []
-        dots = []
+        dots_colors = []
         y_point = self.horizontal_line[0][1]
         y_step = row_height
         x_left_point = self.horizontal_line[0][0]
@@ -223,54 +236,156 @@ class CustomersTable(Table):
         distance = abs(x_right_point - x_left_point)
         step_x = distance * columns_width[0]
 
+        rows = self._get_rows(0, row_count)
+        dots_values = [x.value for x in rows]
+
         # Adding texts and dots
-        for i in range(row_count):
+        for row in rows:
+            customers.append(self._create_customer(row.label, y_point, y_step))
 
-            # Adding text to the table
-            customer = HistogramText(
-                f"{self.text} {i+1}",
-                color=BLACK,
-            )
+            dots_colors.append(self._get_dot_color(row.value))
 
-            # Changind text size
-            customer.scale(self.text_scale)
+            y_point -= y_step
 
-            # Moving text to the table cell
-            customer.move_to(
-                array([x_left_point + 0.2, y_point - (y_step / 2), 0]),
-                aligned_edge=LEFT_SIDE,  # Aligning it at the left side of the cell
+        customers = VGroup(*customers)
+
+        # All dots are in the same column, one below the other
+        dots_y = self.horizontal_line[0][1] - arange(row_count) * y_step - (y_step / 2)
+        dots_points = ShapePointArray(stack([full(row_count, x_left_point + step_x + 0.3), dots_y], axis=1))
+
+        if self.dot_cloud:
+            dots = DotCloud(dots_values, dots_points.coords, colors=dots_colors)
+        else:
+            dots = VGroup(
+                *[
+                    HistogramDot(value=value, point=point, color=color)
+                    for value, point, color in zip(dots_values, dots_points, dots_colors)
+                ]
             )
-            customers.append(customer)
 
-            # Forcing to generate always the same numbers
-            random.seed(i + 1)
+        return customers, dots
 
-            # Adding dot value
-            if self.start_dots_values and i < len(self.start_dots_values):
-                dot_value = self.start_dots_values[i]
-            else:
-                if isinstance(self.bins, int):
-                    dot_value = random.randrange(1, self.bins + 1)
-                else:
-                    dot_value = round(random.uniform(1.0, self.bins + 1.0), 1)
+    @staticmethod
+    def _get_row_count(data_source: DotsDataSource) -> int:
+        """Rows count of the data source. Iterator is read only once, so it isn't read till the end to count
+        the rows, the count must be passed with it."""
+        try:
+            return len(data_source)
+        except DataSourceLengthException as e:
+            detail = "Rows count of the iterator is unknown, row_count must be passed with it."
+            raise TableRowCountException(detail) from e
 
-            if len(self.colors) < dot_value:
-                dot_color = self.default_color
-            else:
-                dot_color = self.colors[int(dot_value) - 1]
+    def _create_customer(self, label: str, y_point: Union[int, float], row_height: Union[int, float]) -> HistogramText:
+        """Creating text for the row.
 
-            # Adding dot
-            dot = HistogramDot(
-                value=dot_value,
-                point=array([x_left_point + step_x + 0.3, y_point - (y_step / 2), 0]),
-                color=dot_color,
-            )
+        Args:
+            label (str): Row label.
+            y_point (Union[int, float]): Top of the row.
+            row_height (Union[int, float]): Row height.
 
-            dots.append(dot)
+        Returns:
+            HistogramText: Text at the left side of the row.
+        """
+        # Adding text to the table
+        customer = HistogramText(
+            label,
+            color=BLACK,
+        )
 
-            y_point -= y_step
+        # Changind text size
+        customer.scale(self.text_scale)
 
-        customers = VGroup(*customers)
-        dots = VGroup(*dots)
+        # Moving text to the table cell
+        customer.move_to(
+            array([self.horizontal_line[0][0] + 0.2, y_point - (row_height / 2), 0]),
+            aligned_edge=LEFT_SIDE,  # Aligning it at the left side of the cell
+        )
 
-        return customers, dots
+        return customer
+
+    def _get_row_label(self, row: int, label: Union[str, None] = None) -> str:
+        """Getting text for the row. Label from the data source is used, when the source has it."""
+        if label is not None:
+            return str(label)
+
+        return f"{self.text} {row+1}"
+
+    def _get_dot_value(self, row: int) -> Union[int, float]:
+        """Getting value of the dot for the row, that isn't in the data source. Values are always the same
+            for the same row.
+
+        Args:
+            row (int): Row index.
+
+        Returns:
+            Union[int, float]: Dot value.
+        """
+        if self.start_dots_values is not None and row < len(self.start_dots_values):
+            return self.start_dots_values[row]
+
+        if self.seed is not None:
+            return self._get_generated_values(row + 1)[row].item()
+
+        # Forcing to generate always the same numbers. Own generator is used to keep the global state untouched
+        generator = random.Random(row + 1)
+
+        if isinstance(self.bins, int):
+            return generator.randrange(1, self.bins + 1)
+
+        return round(generator.uniform(1.0, self.bins + 1.0), 1)
+
+    def _get_rows(self, start: int, stop: int) -> List[DataRow]:
+        """Getting values and labels of the rows at once. Data source is read only once for every row, so
+            the iterators, that can't go back, could be used as well. Rows after the end of the source are generated.
+
+        Args:
+            start (int): First row index.
+            stop (int): Row index after the last one.
+
+        Returns:
+            List[DataRow]: Dots values and rows labels.
+        """
+        rows = self.data_source.read(start, stop) if self.data_source is not None else []
+        values = [x.value for x in rows]
+        labels = [x.label for x in rows]
+
+        first = start + len(values)
+        if self.seed is None:
+            values += [self._get_dot_value(i) for i in range(first, stop)]
+        else:
+            if self.start_dots_values is not None:
+                values += list(self.start_dots_values[first:stop])
+
+            values += self._get_generated_values(stop)[start + len(values) : stop].tolist()
+
+        labels += [None] * (stop - first)
+
+        return [DataRow(x, self._get_row_label(start + i, y)) for i, (x, y) in enumerate(zip(values, labels))]
+
+    def _get_generated_values(self, count: int) -> ndarray:
+        """Getting generated values for at least count first rows. Generator produces the same sequence for the
+            same seed, so the value of the row doesn't depend on how many values were generated.
+
+        Args:
+            count (int): Rows count.
+
+        Returns:
+            ndarray: Values for the rows, including the rows with start_dots_values.
+        """
+        if self._generated_values is None or len(self._generated_values) < count:
+            # Growing twice, so the tables that are read row by row don't generate values too often
+            size = max(count, 2 * len(self._generated_values) if self._generated_values is not None else 0)
+            generator = default_rng(self.seed)
+
+            if isinstance(self.bins, int):
+                self._generated_values = generator.integers(1, self.bins + 1, size=size)
+            else:
+                self._generated_values = generator.uniform(1.0, self.bins + 1.0, size=size).round(1)
+
+        return self._generated_values
+
+    def _get_dot_color(self, dot_value: Union[int, float]) -> Color:
+        if len(self.colors) < dot_value:
+            return self.default_color
+
+        return self.colors[int(dot_value) - 1]
@@ -0,0 +1,105 @@
+import re
+import shutil
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+from numpy import array, cumsum, float32, int32, load, ndarray, save, split, vstack, zeros
+
+from .disk_cache import DiskCache
+
+
+class TextGeometryCache(DiskCache):
+    """Disk cache with the points of the text characters. Every text is stored as a single .npy file
+    in the directory of its font, so all texts of the font could be invalidated at once."""
+
+    suffix: str = ".npy"
+
+    # Increase it when the stored format changes
+    version: int = 1
+
+    def key(self, text: str, font: str, style: dict) -> str:
+        """Making the cache key.
+
+        Args:
+            text (str): Text.
+            font (str): Font family.
+            style (dict): All settings that change the geometry of the text (size, slant, weight etc).
+
+        Returns:
+            str: Cache key.
+        """
+        digest = self.make_key(self.version, text, font, sorted(style.items()))
+
+        return f"{self._font_directory(font)}/{digest}"
+
+    @staticmethod
+    def _font_directory(font: str) -> str:
+        return re.sub(r"[^\w.-]+", "_", font) or "_"
+
+    def load(self, key: str) -> Optional[Tuple[List[ndarray], ndarray]]:
+        """Loading points of the text characters.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[Tuple[List[ndarray], ndarray]]: Points for every character and mask of visible characters.
+                None when nothing was cached.
+        """
+        path = self.get(key)
+        if path is None:
+            return None
+
+        try:
+            with open(path, "rb") as file:
+                lengths = load(file)
+                visible = load(file)
+                points = load(file)
+
+        except (OSError, ValueError):
+            # Broken file, we will render the text again
+            self.remove(key)
+            return None
+
+        if len(lengths) == 0:
+            return [], visible
+
+        return split(points.astype(float), cumsum(lengths)[:-1]), visible
+
+    def save(self, key: str, points: Sequence[ndarray], visible: Sequence[bool]) -> Path:
+        """Saving points of the text characters.
+
+        Args:
+            key (str): Cache key.
+            points (Sequence[ndarray]): Points for every character.
+            visible (Sequence[bool]): Which characters are visible. Spaces are invisible characters.
+
+        Returns:
+            Path: Path to the cached file.
+        """
+        lengths = array([len(x) for x in points], dtype=int32)
+        merged = vstack(points).astype(float32) if len(points) else zeros((0, 3), dtype=float32)
+
+        def write(file):
+            save(file, lengths)
+            save(file, array(visible, dtype=bool))
+            save(file, merged)
+
+        return self.store(key, write)
+
+    def invalidate(self, font: Union[str, None] = None):
+        """Removing cached texts. Should be called when the font file has changed.
+
+        Args:
+            font (Union[str, None], optional): Font family to invalidate. Defaults to None (all fonts).
+        """
+        if font is None:
+            self.clear()
+            return
+
+        directory = self.directory / self._font_directory(font)
+        if directory.exists():
+            shutil.rmtree(directory)
+
+        # Size will be recalculated on the next write
+        self._size = None
@@ -0,0 +1,334 @@
+from math import floor
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from manimlib.imports import BLACK, Animation, Mobject, VGroup, VMobject, interpolate
+from numpy import array, clip, ndarray
+
+from .data_source import DotsDataSource, open_data_source
+from .histogram_dot import HistogramDot
+from .histogram_text import HistogramText
+from .shape_point import ShapePoint
+from .table import CustomersTable, TableException
+
+# Digits of the labels are taken from this text. Every digit is placed between the zeros, so the advance
+# of the digit is the distance between the zeros around it
+LABEL_DIGITS = "00102030405060708090"
+
+
+class VirtualTableException(TableException):
+    pass
+
+
+class VirtualTableRowsException(VirtualTableException):
+    pass
+
+
+class LabelTemplate(NamedTuple):
+    """Glyphs of the default row label, ex. "Customer 0". Prefix glyphs are kept as they are, and the number
+    is made from the digits glyphs, placed one after another."""
+
+    prefix: str
+    glyphs: List[ndarray]
+    # Points of every digit relative to the pen position, and the advance of the pen after it
+    digits: Dict[str, Tuple[ndarray, float]]
+    # Pen position of the first digit
+    start: float
+    # Character with the style of the labels, it's copied when the label needs more characters
+    style: VMobject
+
+
+class VirtualCustomersTable(CustomersTable):
+    """CustomersTable for the big datasets. Only the visible rows (and a few rows below them) are created,
+    and they are reused for the next rows when the table is scrolling. Row with the index i is always
+    shown by the slot i % slots_count."""
+
+    def __init__(
+        self,
+        start_end_points: Tuple[tuple, tuple],
+        row_count: int = 0,
+        row_height: Union[int, float] = 0.5,
+        visible_row_count: int = 0,
+        colors: list = None,
+        bins: Union[int, float] = 0,
+        text: str = "",
+        start_dots_values: list = None,
+        overscan: int = 2,
+        seed: int = None,
+        data_source: Union[str, Path, Iterable, DotsDataSource] = None,
+    ):
+        """Class initialization.
+
+        Args:
+            start_end_points (Tuple[tuple, tuple]): Left top and right top points. ((x1,y1), (x2,y2)).
+            row_count (int, optional): Rows count in the dataset. Defaults to 0.
+            row_height (Union[int, float], optional): Table row height. Defaults to 0.5.
+            visible_row_count (int, optional): Table visible row count. Defaults to 0.
+            colors (list, optional): List with dot colors. Defaults to None.
+            bins (Union[int, float], optional): Count of posiible dots values. Defaults to 0.
+            text (str, optional): Text for adding to the table. Ex "Customer". Defaults to "".
+            start_dots_values (list, optional): List with initial values for the dots. Could be an array
+                with the whole dataset. Defaults to None.
+            overscan (int, optional): How many rows are created below the visible ones, to be ready
+                for scrolling. Defaults to 2.
+            seed (int, optional): Seed for the generated dots values. Defaults to None.
+            data_source (Union[str, Path, Iterable, DotsDataSource], optional): File or iterator with the dataset.
+                Only the rows shown by the slots are read from it. Rows count is taken from the source,
+                when row_count isn't passed, it must be passed with the iterator. Defaults to None.
+
+        Raises:
+            VirtualTableRowsException: Raises when visible_row_count is not positive.
+            TableRowCountException: Raises when row_count isn't passed with the iterator.
+        """
+        if visible_row_count <= 0:
+            detail = f"Visible rows count must be a positive number, got [{visible_row_count}] instead."
+            raise VirtualTableRowsException(detail)
+
+        data_source = open_data_source(data_source) if data_source is not None else None
+        if data_source is not None and not row_count:
+            row_count = self._get_row_count(data_source)
+
+        self.data_row_count = row_count
+        self.overscan = overscan
+        self.slots_count = min(row_count, visible_row_count + overscan)
+
+        # Row at the top of the viewport, could be fractional while scrolling
+        self.top_row = 0.0
+
+        # Created on the first label, the text and its scale are set by the parent class
+        self._label_template: Optional[LabelTemplate] = None
+
+        super().__init__(
+            start_end_points,
+            row_count=min(row_count, visible_row_count),
+            row_height=row_height,
+            visible_row_count=visible_row_count,
+            colors=colors,
+            bins=bins,
+            text=text,
+            start_dots_values=start_dots_values,
+            seed=seed,
+            data_source=data_source,
+        )
+
+        # Rows shown by the slots and their current locations by Y
+        self.slot_rows = list(range(self.slots_count))
+        self.slot_y = [self._get_row_y(x) for x in self.slot_rows]
+        self.slot_members = [self._get_slot_members(x) for x in range(self.slots_count)]
+
+        self._update_slots_opacity()
+
+    def _add_dots_and_customers_to_table(
+        self,
+        row_height: Union[int, float],
+        row_count: int,
+        columns_width: Tuple,
+    ) -> Tuple[VGroup, VGroup]:
+        # Grid has only visible rows, but the slots below the viewport are created as well
+        return super()._add_dots_and_customers_to_table(row_height, self.slots_count, columns_width)
+
+    @property
+    def max_top_row(self) -> int:
+        return max(self.data_row_count - self.visible_row_count, 0)
+
+    def _get_row_y(self, row: int) -> float:
+        """Top of the row by Y, when the table is scrolled to self.top_row."""
+        return self.horizontal_line[0][1] - (row - self.top_row) * self.row_height
+
+    def _get_slot_members(self, slot: int) -> List[Mobject]:
+        """Mobjects of the slot, that are drawn. Characters, that aren't used by the current label, have no points."""
+        members = self.customers[slot].submobjects + self.dots[slot].family_members_with_points()
+
+        return [x for x in members if len(x.points)]
+
+    def _get_label_template(self) -> LabelTemplate:
+        if self._label_template is None:
+            prefix = f"{self.text} "
+            text = HistogramText(prefix + LABEL_DIGITS, color=BLACK)
+            text.scale(self.text_scale)
+
+            # Spaces are invisible, they have nothing to draw
+            glyphs = [x for x in text.family_members_with_points() if x.get_fill_opacity() > 0]
+            digits = glyphs[-len(LABEL_DIGITS) :]
+            lefts = [x.points[:, 0].min() for x in digits]
+
+            # Pen position is the left side of the zero, that would be drawn instead of the digit
+            zero_advance = lefts[1] - lefts[0]
+            advances = {"0": (digits[0].points - [lefts[0], 0, 0], zero_advance)}
+            for i in range(1, 10):
+                pen = lefts[2 * i - 1] + zero_advance
+                advances[str(i)] = (digits[2 * i].points - [pen, 0, 0], lefts[2 * i + 1] - pen)
+
+            glyphs_points = [x.points for x in glyphs[: -len(LABEL_DIGITS)]]
+            self._label_template = LabelTemplate(prefix, glyphs_points, advances, lefts[0], glyphs[0].copy())
+
+        return self._label_template
+
+    def _get_label_glyphs(self, label: str) -> List[ndarray]:
+        """Points of the label characters. Default labels are made from the template without rendering."""
+        template = self._get_label_template()
+        number = label[len(template.prefix) :]
+
+        if label.startswith(template.prefix) and number and all(x in template.digits for x in number):
+            glyphs = list(template.glyphs)
+            pen = template.start
+
+            for digit in number:
+                points, advance = template.digits[digit]
+                glyphs.append(points + [pen, 0, 0])
+                pen += advance
+
+            return glyphs
+
+        # Labels from the data source are rendered, their geometry is usually in the disk cache
+        text = HistogramText(label, color=BLACK)
+        text.scale(self.text_scale)
+
+        return [x.points for x in text.family_members_with_points() if x.get_fill_opacity() > 0]
+
+    @staticmethod
+    def _set_glyphs(text: VMobject, glyphs: List[ndarray], style: Optional[VMobject]):
+        """Setting points of the characters in place. Characters are copied from the style, when the text gets
+        longer, and the extra ones are left without points, so they aren't drawn."""
+        while len(text.submobjects) < len(glyphs):
+            text.add(style.copy())
+
+        for i, member in enumerate(text.submobjects):
+            if i < len(glyphs):
+                member.set_points(glyphs[i])
+            else:
+                member.clear_points()
+
+    def _set_label(self, customer: VMobject, label: str, y_point: Union[int, float], row_height: Union[int, float]):
+        """Moving label to the left side of the row, the same way as CustomersTable does."""
+        glyphs = self._get_label_glyphs(label)
+
+        if glyphs:
+            left = min(x[:, 0].min() for x in glyphs)
+            bottom, top = min(x[:, 1].min() for x in glyphs), max(x[:, 1].max() for x in glyphs)
+            shift = array([self.horizontal_line[0][0] + 0.2 - left, y_point - (row_height / 2) - (bottom + top) / 2, 0])
+            glyphs = [x + shift for x in glyphs]
+
+        self._set_glyphs(customer, glyphs, self._get_label_template().style)
+
+    def _create_customer(self, label: str, y_point: Union[int, float], row_height: Union[int, float]) -> VGroup:
+        """Label is made of the characters, that are changed in place, when the slot shows another row."""
+        customer = VGroup()
+        self._set_label(customer, label, y_point, row_height)
+
+        return customer
+
+    def _set_dot(self, dot: HistogramDot, value: Union[int, float], point: ndarray):
+        """Changing the dot in place. Points are copied from the prototypes of HistogramDot."""
+        color = self._get_dot_color(value)
+        scale = HistogramDot.dot_scale_float if isinstance(value, float) else HistogramDot.dot_scale_int
+        prototype_circle, prototype_text = HistogramDot.prototypes.get_prototype(value, dot.radius, color, scale)
+
+        circle, text = dot.submobjects
+        circle.set_points(prototype_circle.points + point)
+        circle.set_fill(color)
+
+        glyphs = [x for x in prototype_text.family_members_with_points() if x.get_fill_opacity() > 0]
+        self._set_glyphs(text, [x.points + point for x in glyphs], glyphs[0] if glyphs else None)
+
+        dot.value = value
+        dot.point = ShapePoint(point)
+
+    def _bind_row(self, slot: int, row: int):
+        """Showing the new row in the slot. Mobjects of the slot stay the same, only their points and colors
+        are changed.
+
+        Args:
+            slot (int): Slot index.
+            row (int): Row index in the dataset.
+        """
+        y_point = self._get_row_y(row)
+
+        # Row is read once, the iterator could have dropped it after that
+        row_data = self._get_rows(row, row + 1)[0]
+
+        self._set_label(self.customers[slot], row_data.label, y_point, self.row_height)
+        self._set_dot(self.dots[slot], row_data.value, array([self._get_dot_x(), y_point - (self.row_height / 2), 0]))
+
+        self.slot_rows[slot] = row
+        self.slot_y[slot] = y_point
+        self.slot_members[slot] = self._get_slot_members(slot)
+
+    def _get_dot_x(self) -> float:
+        distance = abs(self.horizontal_line[1][0] - self.horizontal_line[0][0])
+
+        return self.horizontal_line[0][0] + distance * self.columns_width[0] + 0.3
+
+    def scroll_to(self, top_row: Union[int, float]) -> "VirtualCustomersTable":
+        """Scrolling the table. Slots of the rows that went out of the viewport are reused for the next rows.
+
+        Args:
+            top_row (Union[int, float]): Row at the top of the viewport. Could be fractional.
+
+        Returns:
+            VirtualCustomersTable: Self.
+        """
+        self.top_row = float(clip(top_row, 0, self.max_top_row))
+
+        first_row = floor(self.top_row)
+        last_row = min(first_row + self.slots_count, self.data_row_count)
+
+        for row in range(first_row, last_row):
+            slot = row % self.slots_count
+
+            if self.slot_rows[slot] != row:
+                self._bind_row(slot, row)
+                continue
+
+            y_point = self._get_row_y(row)
+            shift = array([0, y_point - self.slot_y[slot], 0])
+            self.customers[slot].shift(shift)
+            self.dots[slot].shift(shift)
+            self.slot_y[slot] = y_point
+
+        self._update_slots_opacity()
+
+        return self
+
+    def scroll(self, rows: Union[int, float]) -> "VirtualCustomersTable":
+        return self.scroll_to(self.top_row + rows)
+
+    def _update_slots_opacity(self):
+        """Rows are faded out, when they are going out of the viewport."""
+        for slot, row in enumerate(self.slot_rows):
+            # Part of the row inside the viewport
+            top = row - self.top_row
+            opacity = clip(min(top + 1, self.visible_row_count) - max(top, 0), 0, 1)
+
+            for member in self.slot_members[slot]:
+                member.set_fill(opacity=opacity)
+                member.set_stroke(opacity=opacity)
+
+
+class ScrollTable(Animation):
+    """Animation for scrolling VirtualCustomersTable. Rows are moving smoothly, and the rows that went out
+    of the viewport are reused for the next rows."""
+
+    def __init__(self, table: VirtualCustomersTable, rows: Union[int, float], **kwargs):
+        """Class initialization.
+
+        Args:
+            table (VirtualCustomersTable): Table to scroll.
+            rows (Union[int, float]): How many rows to scroll. Negative value scrolls the table up.
+        """
+        self.rows = rows
+
+        super().__init__(table, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # Table state is restored by the scroll position, so the copy of the table isn't needed
+        return self.mobject
+
+    def begin(self):
+        self.start_row = self.mobject.top_row
+        self.end_row = self.start_row + self.rows
+
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        self.mobject.scroll_to(interpolate(self.start_row, self.end_row, alpha))
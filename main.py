@@ -1,20 +1,11 @@
-import os
-from pathlib import Path
-
 # We are importing MovingCamera, instead of CameraScene to be able to
 # move camera around.
 from manimlib.imports import MovingCameraScene
 
 from config import SCENE_BACKGROUND_COLOR
+from rendering.cli import main
 from scenario import Scenario
 
-# Adding flags to build animation.
-# -l (low quality)
-# -s (only screenshot)
-RESOLUTION = ""
-FLAGS = f"-pl {RESOLUTION}"
-SCENE = "MainScene"
-
 
 class MainScene(MovingCameraScene):
     # Scene background is black by default, to change it we need to
@@ -23,20 +14,21 @@ class MainScene(MovingCameraScene):
         "camera_config": {
             "background_color": SCENE_BACKGROUND_COLOR,
         },
+        # Scenario methods, that are played one after another. Available methods:
+        # play_first_scene, play_second_scene, play_third_scene, play_fourth_scene,
+        # play_fifth_scene, play_sixth_scene, play_galton_board, play_whole_scenario
+        "segments": ["play_whole_scenario"],
     }
 
     def construct(self):
         """Construct method - enter point to create animation"""
         hist = Scenario(self)
-        # hist.play_first_scene()
-        # hist.play_second_scene()
-        # hist.play_third_scene()
-        # hist.play_fourth_scene()
-        # hist.play_fifth_scene()
-        # hist.play_sixth_scene()
-        hist.play_whole_scenario()
+
+        for segment in self.segments:
+            getattr(hist, segment)()
 
 
 if __name__ == "__main__":
-    script_name = Path(__file__).resolve()
-    os.system(f"manim {script_name} {SCENE} {FLAGS}")
+    # Rendering in this process. Flags are the same as for python -m rendering,
+    # ex. "python main.py -q medium -w 8 -p", run "python main.py -h" for all of them.
+    main()
@@ -0,0 +1,64 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Names are imported from their modules on the first access (PEP 562), as in the classes package.
+# Segments planning and the segment cache don't need manimlib, so they are used without it.
+_ATTRIBUTES_MODULES = {
+    "DirtyRectsMixin": "dirty_rects",
+    "DryRunMixin": "dry_run",
+    "DryRunReport": "dry_run",
+    "DryRunResult": "dry_run",
+    "LayoutBox": "dry_run",
+    "LayoutWarning": "dry_run",
+    "dry_run": "dry_run",
+    "Instrumentation": "instrumentation",
+    "InstrumentationMixin": "instrumentation",
+    "Progress": "instrumentation",
+    "instrumented_segment": "instrumentation",
+    "RenderOptions": "parallel",
+    "SegmentResult": "parallel",
+    "concat_videos": "parallel",
+    "render_parallel": "parallel",
+    "PlayCache": "play_cache",
+    "PlayCacheMixin": "play_cache",
+    "PlayCacheRecord": "play_cache",
+    "RenderResult": "render",
+    "render": "render",
+    "SegmentCache": "segment_cache",
+    "Segment": "segments",
+    "plan_segments": "segments",
+    "schedule_segments": "segments",
+    "split_segment": "segments",
+    "StaticLayersMixin": "static_layers",
+}
+
+__all__ = list(_ATTRIBUTES_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _ATTRIBUTES_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+
+    # Next time the attribute is found without __getattr__
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ATTRIBUTES_MODULES))
+
+
+if TYPE_CHECKING:
+    from .dirty_rects import DirtyRectsMixin
+    from .dry_run import DryRunMixin, DryRunReport, DryRunResult, LayoutBox, LayoutWarning, dry_run
+    from .instrumentation import Instrumentation, InstrumentationMixin, Progress, instrumented_segment
+    from .parallel import RenderOptions, SegmentResult, concat_videos, render_parallel
+    from .play_cache import PlayCache, PlayCacheMixin, PlayCacheRecord
+    from .render import RenderResult, render
+    from .segment_cache import SegmentCache
+    from .segments import Segment, plan_segments, schedule_segments, split_segment
+    from .static_layers import StaticLayersMixin
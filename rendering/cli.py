@@ -0,0 +1,116 @@
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+from .dry_run import dry_run, write_dry_run_report
+from .instrumentation import print_progress
+from .render import render
+from .scene import DEFAULT_SCENE, QUALITIES
+from .segments import DEFAULT_SEGMENT_COST
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Render scenario segments.")
+    parser.add_argument("segments", nargs="*", help="Scenario methods. Defaults to the segments of the scene.")
+    parser.add_argument("--scene", default=DEFAULT_SCENE, help="Scene class as 'module:Class'.")
+    parser.add_argument("-q", "--quality", default="low", choices=list(QUALITIES), help="Video quality.")
+    parser.add_argument("--fps", type=int, default=None, help="Frame rate. Defaults to the frame rate of quality.")
+    parser.add_argument("-o", "--output", default=None, help="Path of the video. Defaults to media/<Scene>.mp4.")
+    parser.add_argument("--media-dir", default="media", help="Directory for manim files.")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Processes count.")
+    parser.add_argument("--no-split", action="store_true", help="Don't split long segments by plays.")
+    parser.add_argument("--segment-cost", type=int, default=DEFAULT_SEGMENT_COST, help="Maximum cost of the segment.")
+    parser.add_argument("--cache-dir", default=".cache/segments", help="Directory of the segments cache.")
+    parser.add_argument("--cache-size", type=int, default=2048, help="Maximum size of every cache in MB.")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the segments cache.")
+    parser.add_argument("--force", action="store_true", help="Render all segments again, even when cached.")
+    parser.add_argument("--play-cache", action="store_true", help="Reuse partial movies of the unchanged plays.")
+    parser.add_argument("--play-cache-dir", default=".cache/plays", help="Directory of the plays cache.")
+    parser.add_argument("--report", default=None, help="Directory for the timings report of every play.")
+    parser.add_argument("--progress", action="store_true", help="Print progress with ETA.")
+    parser.add_argument("--static-layers", action="store_true", help="Draw only the animated mobjects every frame.")
+    parser.add_argument("--dirty-rects", action="store_true", help="Redraw only the changed boxes of the frames.")
+    parser.add_argument("--dry-run", action="store_true", help="Check the layout without rendering any frames.")
+    parser.add_argument("-p", "--preview", action="store_true", help="Open the video when it's rendered.")
+
+    return parser.parse_args(argv)
+
+
+def open_file(path: Path):
+    """Opening the file in the default application, the same as manim -p does."""
+    if sys.platform == "win32":
+        os.startfile(path)
+    else:
+        subprocess.run(["open" if sys.platform == "darwin" else "xdg-open", str(path)])
+
+
+def main_dry_run(args: argparse.Namespace):
+    report = dry_run(scene=args.scene, segments=args.segments, quality=args.quality, media_dir=args.media_dir)
+
+    for segment in report.segments:
+        print(f"{segment.segment}: {segment.plays} plays, {segment.wall_time:.1f}s")
+
+        for box in segment.boxes:
+            print(f"    {box.name}: ({box.left:.2f}, {box.bottom:.2f}) - ({box.right:.2f}, {box.top:.2f})")
+
+        for warning in segment.warnings:
+            print(f"    WARNING play {warning.play}: {warning.message}")
+
+    print(f"Layout is checked: {len(report.warnings)} warnings, {report.wall_time:.1f}s")
+
+    if args.report:
+        path = Path(args.report) / "dry_run.json"
+        write_dry_run_report(report, path)
+        print(f"Layout report is saved to {path}")
+
+    if report.warnings:
+        sys.exit(1)
+
+
+def main(argv: List[str] = None):
+    args = parse_args(argv)
+
+    if args.dry_run:
+        main_dry_run(args)
+        return
+
+    result = render(
+        scene=args.scene,
+        segments=args.segments,
+        quality=args.quality,
+        fps=args.fps,
+        workers=args.workers,
+        output=args.output,
+        media_dir=args.media_dir,
+        split=not args.no_split,
+        segment_cost=args.segment_cost,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        cache_size=args.cache_size * 1024 * 1024,
+        force=args.force,
+        play_cache_dir=args.play_cache_dir if args.play_cache else None,
+        report_dir=args.report,
+        progress=print_progress if args.progress else None,
+        static_layers=args.static_layers,
+        dirty_rects=args.dirty_rects,
+    )
+
+    if args.progress:
+        print(file=sys.stderr)
+
+    for segment in result.segments:
+        status = "cached" if segment.cached else f"{segment.wall_time:.1f}s"
+        print(f"{segment.segment.name}: {segment.frames} frames, {status}")
+
+        for record in segment.play_cache_records:
+            print(f"    play {record.index}: {'hit' if record.hit else 'miss'} {record.name}")
+
+    print(f"Video is saved to {result.output}: {result.frames} frames, {result.wall_time:.1f}s")
+
+    if args.report:
+        print(f"Timings report is saved to {Path(args.report) / 'report.json'}")
+
+    if args.preview:
+        open_file(result.output)
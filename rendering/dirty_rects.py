@@ -0,0 +1,117 @@
+from math import ceil, floor
+from typing import List, Optional, Tuple
+
+from manimlib.imports import Mobject
+from numpy import amax, vstack
+
+from .static_layers import StaticLayer, StaticLayersMixin, composite
+
+# Pixel box of the frame: first row, last row + 1, first column, last column + 1
+PixelBox = Tuple[int, int, int, int]
+
+
+def union_boxes(first: Optional[PixelBox], second: Optional[PixelBox]) -> Optional[PixelBox]:
+    if first is None or second is None:
+        return first or second
+
+    return min(first[0], second[0]), max(first[1], second[1]), min(first[2], second[2]), max(first[3], second[3])
+
+
+def crop_layer(layer: StaticLayer, box: PixelBox) -> StaticLayer:
+    """Part of the transparent layer inside the box, it's empty when they don't intersect."""
+    top, bottom = max(layer.rows.start, box[0]), min(layer.rows.stop, box[1])
+    left, right = max(layer.columns.start, box[2]), min(layer.columns.stop, box[3])
+    bottom, right = max(bottom, top), max(right, left)
+
+    rows = slice(top - layer.rows.start, bottom - layer.rows.start)
+    columns = slice(left - layer.columns.start, right - layer.columns.start)
+
+    return StaticLayer(layer.pixels[rows, columns], slice(top, bottom), slice(left, right))
+
+
+def _get_stroke_width(member: Mobject) -> float:
+    widths = [getattr(member, x, None) for x in ("stroke_width", "background_stroke_width")]
+
+    return max([float(amax(x)) for x in widths if x is not None] or [0.0])
+
+
+class DirtyRectsMixin(StaticLayersMixin):
+    """Drawing only the part of the frame, that was changed. Pixel box of the animated mobjects is tracked from
+    frame to frame, and the union of the previous and current boxes is restored from the background layer and
+    drawn again over the previous frame. Everything outside the box is the same as in the previous frame,
+    so the output is the same as the full redraw with the static layers. Small dots moving over the big static
+    scene cost in proportion to their area."""
+
+    # Pixels around the boxes for antialiasing
+    dirty_rects_padding: int = 2
+
+    # When the box takes more of the frame, the whole frame is drawn, it's cheaper than the box for it
+    dirty_rects_max_area: float = 0.5
+
+    def __init__(self, **kwargs):
+        # Box of the animated mobjects in the previous frame, and if the camera has the previous frame at all
+        self._dirty_box: Optional[PixelBox] = None
+        self._has_previous_frame = False
+
+        super().__init__(**kwargs)
+
+    def get_pixel_box(self, members: List[Mobject]) -> Optional[PixelBox]:
+        """Pixel box of the mobjects with their strokes and antialiasing. Returns None, when it's out of the frame."""
+        if not members:
+            return None
+
+        camera = self.camera
+        width, height = camera.get_pixel_width(), camera.get_pixel_height()
+        scale_x, scale_y = width / camera.get_frame_width(), height / camera.get_frame_height()
+        center = camera.get_frame_center()
+
+        # Stroke is drawn around the points, cairo line width is set in the frame units
+        stroke = max(_get_stroke_width(x) for x in members) * getattr(camera, "cairo_line_width_multiple", 0.01)
+        padding = stroke * max(scale_x, scale_y) / 2 + self.dirty_rects_padding
+
+        points = vstack([x.points[:, :2] for x in members])
+        (left, bottom), (right, top) = points.min(axis=0), points.max(axis=0)
+
+        box = (
+            max(floor((center[1] - top) * scale_y + height / 2 - padding), 0),
+            min(ceil((center[1] - bottom) * scale_y + height / 2 + padding), height),
+            max(floor((left - center[0]) * scale_x + width / 2 - padding), 0),
+            min(ceil((right - center[0]) * scale_x + width / 2 + padding), width),
+        )
+
+        return box if box[0] < box[1] and box[2] < box[3] else None
+
+    def progress_through_animations(self, animations: list):
+        # Frame of the previous play could be changed between the plays, so the first frame is drawn fully
+        self._dirty_box = None
+        self._has_previous_frame = False
+
+        super().progress_through_animations(animations)
+
+    def update_frame_layers(self, background: StaticLayer, layers: List[Tuple[Optional[StaticLayer], list]]):
+        box = self.get_pixel_box([x for layer, members in layers if layer is None for x in members])
+        dirty = union_boxes(self._dirty_box, box)
+        self._dirty_box = box
+
+        if not self._has_previous_frame:
+            self._has_previous_frame = True
+            return super().update_frame_layers(background, layers)
+
+        # Nothing is drawn in the frame, and nothing was drawn in the previous one
+        if dirty is None:
+            return
+
+        pixels = self.camera.pixel_array
+        area = (dirty[1] - dirty[0]) * (dirty[3] - dirty[2])
+        if area > self.dirty_rects_max_area * pixels.shape[0] * pixels.shape[1]:
+            return super().update_frame_layers(background, layers)
+
+        rows, columns = slice(dirty[0], dirty[1]), slice(dirty[2], dirty[3])
+        pixels[rows, columns] = background.pixels[rows, columns]
+
+        # All drawn mobjects are inside the box, static layers are composited only in it
+        for layer, members in layers:
+            if layer is not None:
+                composite(pixels, crop_layer(layer, dirty))
+            else:
+                self.camera.capture_mobjects(members, include_submobjects=False)
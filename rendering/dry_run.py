@@ -0,0 +1,324 @@
+import json
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Sequence, Tuple, Type, Union
+
+from manimlib.imports import DEFAULT_WAIT_TIME, Mobject, Scene
+from numpy import asarray, concatenate, lexsort, maximum, minimum, ndarray, sqrt, stack, vstack
+
+from classes import DotCloud, HistogramDot, find_close_pairs
+
+from .scene import DEFAULT_SCENE, get_camera_config, get_scene_class, initialize_media, with_mixins
+
+
+class LayoutBox(NamedTuple):
+    name: str
+    left: float
+    bottom: float
+    right: float
+    top: float
+
+    def overlaps(self, other: "LayoutBox", tolerance: float) -> bool:
+        width = min(self.right, other.right) - max(self.left, other.left)
+        height = min(self.top, other.top) - max(self.bottom, other.bottom)
+
+        return width > tolerance and height > tolerance
+
+    def get_overflow(self, frame: "LayoutBox") -> Dict[str, float]:
+        """Distances, that the box goes out of the frame by, for every side."""
+        overflow = {
+            "left": frame.left - self.left,
+            "bottom": frame.bottom - self.bottom,
+            "right": self.right - frame.right,
+            "top": self.top - frame.top,
+        }
+
+        return {side: distance for side, distance in overflow.items() if distance > 0}
+
+
+class LayoutWarning(NamedTuple):
+    play: int
+    kind: str
+    message: str
+
+
+class DryRunResult(NamedTuple):
+    segment: str
+    plays: int
+    wall_time: float
+    # Last box of every mobject, that was in the scene, mobjects removed before the end keep their last box
+    boxes: List[LayoutBox]
+    warnings: List[LayoutWarning]
+
+
+class DryRunReport(NamedTuple):
+    segments: List[DryRunResult]
+    wall_time: float
+
+    @property
+    def warnings(self) -> List[LayoutWarning]:
+        return [x for segment in self.segments for x in segment.warnings]
+
+    def to_dict(self) -> Dict:
+        return {
+            "wall_time": self.wall_time,
+            "segments": [
+                {
+                    "name": x.segment,
+                    "plays": x.plays,
+                    "wall_time": x.wall_time,
+                    "boxes": [x._asdict() for x in x.boxes],
+                    "warnings": [x._asdict() for x in x.warnings],
+                }
+                for x in self.segments
+            ],
+        }
+
+
+def get_box(name: str, points: ndarray) -> LayoutBox:
+    (left, bottom), (right, top) = points[:, :2].min(axis=0), points[:, :2].max(axis=0)
+
+    return LayoutBox(name, left.item(), bottom.item(), right.item(), top.item())
+
+
+def _is_visible(mobject: Mobject) -> bool:
+    if not len(mobject.points):
+        return False
+
+    # Mobjects, that aren't vectorized, have no opacity methods and are always drawn
+    if not hasattr(mobject, "get_fill_opacity"):
+        return True
+
+    return mobject.get_fill_opacity() > 0 or (mobject.get_stroke_width() > 0 and mobject.get_stroke_opacity() > 0)
+
+
+def collect_layout(mobject: Mobject) -> Tuple[List[ndarray], List[ndarray], List[ndarray]]:
+    """Splitting the family of the mobject into the dots and the rest of it. Dots are moved around by design,
+    so they are checked on their own, and the rest is the layout of tables, graphs and funnels.
+
+    Returns:
+        Tuple[List[ndarray], List[ndarray], List[ndarray]]: Points of the visible mobjects, that aren't dots,
+            centers and radii of the dots.
+    """
+    points, centers, radii = [], [], []
+
+    def collect(member: Mobject):
+        if isinstance(member, HistogramDot):
+            centers.append(member.get_center()[None, :2])
+            radii.append(member.radius)
+            return
+
+        if isinstance(member, DotCloud):
+            centers.append(member.centers[:, :2])
+            radii.extend(member.radii)
+            return
+
+        if _is_visible(member):
+            points.append(member.points[:, :2])
+
+        for submobject in member.submobjects:
+            collect(submobject)
+
+    collect(mobject)
+
+    return points, centers, radii
+
+
+def find_overlapping_dots(centers: ndarray, radii: ndarray, tolerance: float) -> List[Tuple[int, int]]:
+    """Finding pairs of the dots, that are overlapping. Close pairs are found by the grid of the Galton board,
+    and their distances are checked all together.
+
+    Args:
+        centers (ndarray): Dots centers with shape (N, 2).
+        radii (ndarray): Dots radii with shape (N,).
+        tolerance (float): Dots could overlap by this distance.
+
+    Returns:
+        List[Tuple[int, int]]: Indices of the overlapping dots, sorted.
+    """
+    # Dots without size don't overlap anything
+    if not len(radii) or radii.max() <= 0:
+        return []
+
+    first, second = find_close_pairs(centers, 2 * radii.max())
+
+    distances = sqrt(((centers[first] - centers[second]) ** 2).sum(axis=1))
+    overlapping = distances < radii[first] + radii[second] - tolerance
+    first, second = first[overlapping], second[overlapping]
+
+    pairs = stack([minimum(first, second), maximum(first, second)], axis=1)
+
+    return [tuple(x) for x in pairs[lexsort(pairs.T[::-1])].tolist()]
+
+
+class DryRunMixin:
+    """Playing the scene without rasterization and encoding. All construction, dots coordinates and animation
+    bookkeeping are made as usual. Layout is checked after every play and wait: boxes of the mobjects are
+    recorded, and warnings are made for the objects out of the frame and for the overlapping objects.
+    Scene should be played with skip_animations, so frames aren't added."""
+
+    # Objects could overlap or go out of the frame by this distance, it hides rounding of the layout
+    layout_tolerance: float = 0.01
+
+    def __init__(self, **kwargs):
+        self.layout_boxes: Dict[str, LayoutBox] = {}
+        self.layout_warnings: List[LayoutWarning] = []
+        self._layout_names: Dict[int, Tuple[Mobject, str]] = {}
+        self._layout_counters: Dict[str, int] = {}
+        self._warned = set()
+
+        super().__init__(**kwargs)
+
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def get_frame(self) -> ndarray:
+        return self.camera.pixel_array
+
+    def play(self, *args, **kwargs):
+        super().play(*args, **kwargs)
+        self.check_layout()
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, stop_condition=None):
+        super().wait(duration, stop_condition)
+        self.check_layout()
+
+        return self
+
+    def get_layout_name(self, mobject: Mobject) -> str:
+        """Name of the mobject in the report, ex. CustomersTable1. It's the same for the whole scene."""
+        if id(mobject) not in self._layout_names:
+            name = type(mobject).__name__
+            self._layout_counters[name] = self._layout_counters.get(name, 0) + 1
+
+            # Mobject is kept with its name, so its id isn't reused by another one
+            self._layout_names[id(mobject)] = (mobject, f"{name}{self._layout_counters[name]}")
+
+        return self._layout_names[id(mobject)][1]
+
+    def get_frame_box(self) -> LayoutBox:
+        frame = getattr(self.camera, "frame", None)
+
+        # Moving camera has the frame mobject, other cameras have fixed frame
+        if frame is not None:
+            center, width, height = frame.get_center(), frame.get_width(), frame.get_height()
+        else:
+            center, width, height = self.camera.frame_center, self.camera.frame_width, self.camera.frame_height
+
+        x, y = center[0], center[1]
+
+        return LayoutBox("frame", x - width / 2, y - height / 2, x + width / 2, y + height / 2)
+
+    def _warn(self, kind: str, key: tuple, message: str):
+        # The same problem is usually kept for several plays, it's reported only for the first one
+        if (kind, *key) in self._warned:
+            return
+
+        self._warned.add((kind, *key))
+        self.layout_warnings.append(LayoutWarning(self.num_plays - 1, kind, message))
+
+    def check_layout(self):
+        frame = self.get_frame_box()
+        tolerance = self.layout_tolerance
+
+        boxes, dots_centers, dots_radii = [], [], []
+        for mobject in self.mobjects:
+            name = self.get_layout_name(mobject)
+            points, centers, radii = collect_layout(mobject)
+
+            if centers:
+                centers, radii = vstack(centers), asarray(radii, dtype=float)
+                dots_centers.append(centers)
+                dots_radii.append(radii)
+
+                outside = (
+                    (centers[:, 0] - radii < frame.left - tolerance)
+                    | (centers[:, 0] + radii > frame.right + tolerance)
+                    | (centers[:, 1] - radii < frame.bottom - tolerance)
+                    | (centers[:, 1] + radii > frame.top + tolerance)
+                )
+                if outside.any():
+                    message = f"{outside.sum()} of {len(radii)} dots of {name} are out of the frame."
+                    self._warn("dots_out_of_frame", (name,), message)
+
+            if not points and not len(radii):
+                continue
+
+            # Box in the report has the dots as well
+            dots = [centers - radii[:, None], centers + radii[:, None]] if len(radii) else []
+            self.layout_boxes[name] = get_box(name, vstack(points + dots))
+
+            if not points:
+                continue
+
+            box = get_box(name, vstack(points))
+            boxes.append(box)
+
+            overflow = {side: x for side, x in box.get_overflow(frame).items() if x > tolerance}
+            if overflow:
+                sides = ", ".join(f"{side} by {x:.2f}" for side, x in overflow.items())
+                self._warn("out_of_frame", (name,), f"{name} is out of the frame: {sides}.")
+
+        for i, first in enumerate(boxes):
+            for second in boxes[i + 1 :]:
+                if first.overlaps(second, tolerance):
+                    message = f"{first.name} overlaps {second.name}."
+                    self._warn("overlap", (first.name, second.name), message)
+
+        if dots_centers:
+            pairs = find_overlapping_dots(vstack(dots_centers), concatenate(dots_radii), tolerance)
+            if pairs:
+                self._warn("dots_overlap", (), f"{len(pairs)} pairs of dots are overlapping.")
+
+
+def dry_run(
+    scene: Union[str, Type[Scene]] = DEFAULT_SCENE,
+    segments: Sequence[str] = None,
+    quality: str = "low",
+    media_dir: str = "media",
+) -> DryRunReport:
+    """Checking the layout of the scene without rendering. Every segment is played in this process on its own,
+    the same way as it's rendered.
+
+    Args:
+        scene (Union[str, Type[Scene]]): Scene class or its path "module:Class".
+        segments (Sequence[str], optional): Scenario methods. Defaults to None (segments from the scene CONFIG).
+        quality (str, optional): Quality of the camera, it sets the frame size. Defaults to "low".
+        media_dir (str, optional): Directory for manim files, texts are still written there. Defaults to "media".
+
+    Returns:
+        DryRunReport: Boxes of the mobjects and layout warnings of every segment.
+    """
+    started = perf_counter()
+    initialize_media(media_dir)
+
+    scene_class = get_scene_class(scene)
+    dry_run_class = with_mixins(scene_class, DryRunMixin)
+
+    results = []
+    for method in segments or scene_class.CONFIG["segments"]:
+        segment_started = perf_counter()
+        played = dry_run_class(
+            segments=[method],
+            camera_config=get_camera_config(quality),
+            file_writer_config={"write_to_movie": False, "save_last_frame": False},
+            skip_animations=True,
+        )
+
+        results.append(
+            DryRunResult(
+                segment=method,
+                plays=played.num_plays,
+                wall_time=perf_counter() - segment_started,
+                boxes=list(played.layout_boxes.values()),
+                warnings=played.layout_warnings,
+            )
+        )
+
+    return DryRunReport(results, perf_counter() - started)
+
+
+def write_dry_run_report(report: DryRunReport, path: Union[str, Path]):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report.to_dict(), indent=2))
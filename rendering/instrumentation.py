@@ -0,0 +1,248 @@
+import json
+import sys
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+
+from manimlib.imports import DEFAULT_WAIT_TIME, Animation
+
+try:
+    import resource
+except ImportError:
+    # Windows has no resource module, peak RSS isn't reported there
+    resource = None
+
+
+class Progress(NamedTuple):
+    segment: str
+    frames: int
+    total_frames: Optional[int]
+    elapsed: float
+    eta: Optional[float]
+
+
+def get_peak_rss() -> Optional[int]:
+    """Peak resident set size of the process in bytes."""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports it in kilobytes, macOS in bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def print_progress(progress: Progress):
+    """Progress callback, that prints the progress line with ETA to stderr."""
+    total = f"/{progress.total_frames}" if progress.total_frames else ""
+    eta = f", ETA {progress.eta:.0f}s" if progress.eta is not None else ""
+
+    line = f"{progress.segment}: {progress.frames}{total} frames, {progress.elapsed:.0f}s{eta}"
+
+    print(f"\r{line}", end="", file=sys.stderr)
+
+
+class Instrumentation:
+    """Collecting timings of the plays and segments. Records are written to the JSONL file as soon as they are
+    made, so the report of the failed render has everything before the failure."""
+
+    # Progress callback is called not more often than this, in seconds
+    progress_interval: float = 0.5
+
+    def __init__(
+        self,
+        report_path: Union[str, Path] = None,
+        progress: Callable[[Progress], None] = None,
+        segment: str = "",
+        total_frames: int = None,
+    ):
+        """Class initialization.
+
+        Args:
+            report_path (Union[str, Path], optional): JSONL file for the records. Defaults to None (records are
+                only kept in memory).
+            progress (Callable[[Progress], None], optional): Progress callback. Defaults to None.
+            segment (str, optional): Name of the rendered segment for the progress. Defaults to "".
+            total_frames (int, optional): Expected frames count, ETA is calculated from it. Defaults to None.
+        """
+        self.report_path = Path(report_path) if report_path else None
+        self.progress = progress
+        self.segment = segment
+        self.total_frames = total_frames
+
+        self.records: List[Dict] = []
+        self.frames = 0
+        self.started = perf_counter()
+        self._last_progress = 0.0
+
+        if self.report_path is not None:
+            self.report_path.parent.mkdir(parents=True, exist_ok=True)
+            self.report_path.write_text("")
+
+    def record(self, kind: str, name: str, **values):
+        record = {"kind": kind, "name": name, **values, "peak_rss": get_peak_rss()}
+        self.records.append(record)
+
+        if self.report_path is not None:
+            with open(self.report_path, "a") as file:
+                file.write(json.dumps(record) + "\n")
+
+    def add_frames(self, count: int):
+        self.frames += count
+
+        now = perf_counter()
+        if self.progress is not None and now - self._last_progress >= self.progress_interval:
+            self._last_progress = now
+            self.report_progress()
+
+    def report_progress(self):
+        elapsed = perf_counter() - self.started
+
+        eta = None
+        if self.total_frames and self.frames:
+            eta = max(elapsed / self.frames * (self.total_frames - self.frames), 0.0)
+
+        self.progress(Progress(self.segment, self.frames, self.total_frames, elapsed, eta))
+
+
+def _timed(function: Callable, timings: Dict[str, float], key: str) -> Callable:
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        started = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings[key] += perf_counter() - started
+
+    return wrapper
+
+
+class InstrumentationMixin:
+    """Recording wall time, frames count, mobjects count, rasterization and encoding time of every play and wait.
+    Scene without the mixin has no overhead at all, so it's added only when the report is needed."""
+
+    def __init__(self, instrumentation: Instrumentation = None, **kwargs):
+        self.instrumentation = instrumentation or Instrumentation()
+        self._timings = {"rasterization": 0.0, "encoding": 0.0}
+        self._rasterizing = False
+
+        # Time of all plays and waits, the rest of the segment time is the construction
+        self.plays_time = 0.0
+
+        super().__init__(**kwargs)
+
+    def setup(self):
+        super().setup()
+
+        # Frames are sent to ffmpeg while writing, and ffmpeg is waited for when the partial movie is closed
+        writer = self.file_writer
+        writer.write_frame = _timed(writer.write_frame, self._timings, "encoding")
+        writer.end_animation = _timed(writer.end_animation, self._timings, "encoding")
+
+    def _rasterize(self, draw: Callable, *args, **kwargs):
+        # Drawing methods call each other, only the outer call is timed
+        if self._rasterizing:
+            return draw(*args, **kwargs)
+
+        self._rasterizing = True
+        started = perf_counter()
+        try:
+            return draw(*args, **kwargs)
+        finally:
+            self._rasterizing = False
+            self._timings["rasterization"] += perf_counter() - started
+
+    def update_frame(self, *args, **kwargs):
+        return self._rasterize(super().update_frame, *args, **kwargs)
+
+    def update_frame_layers(self, *args, **kwargs):
+        # Static layers and dirty rects draw the frames of the plays with it instead of update_frame
+        return self._rasterize(super().update_frame_layers, *args, **kwargs)
+
+    def get_static_layer(self, *args, **kwargs):
+        # Static layers are rasterized before the first frame of the play
+        return self._rasterize(super().get_static_layer, *args, **kwargs)
+
+    def add_frames(self, *frames):
+        if not self.skip_animations:
+            self.instrumentation.add_frames(len(frames))
+
+        super().add_frames(*frames)
+
+    def _record_play(self, kind: str, name: str, play: Callable):
+        timings = dict(self._timings)
+        frames = self.instrumentation.frames
+        plays = self.num_plays
+        skipped = self.skip_animations
+        started = perf_counter()
+
+        try:
+            play()
+        finally:
+            wall_time = perf_counter() - started
+            self.plays_time += wall_time
+
+            # Play could be stopped before it's started, when the scene has ended early
+            if self.num_plays > plays:
+                rasterization = self._timings["rasterization"] - timings["rasterization"]
+                encoding = self._timings["encoding"] - timings["encoding"]
+
+                self.instrumentation.record(
+                    kind,
+                    name,
+                    index=plays,
+                    skipped=skipped,
+                    wall_time=wall_time,
+                    frames=self.instrumentation.frames - frames,
+                    mobjects=len(self.get_mobject_family_members()),
+                    rasterization=rasterization,
+                    encoding=encoding,
+                    animation=wall_time - rasterization - encoding,
+                )
+
+    def play(self, *args, **kwargs):
+        play = super().play
+        names = [str(x) if isinstance(x, Animation) else getattr(x, "__name__", None) for x in args]
+        name = ", ".join(x for x in names if x) or "play"
+
+        self._record_play("play", name, lambda: play(*args, **kwargs))
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, stop_condition=None):
+        wait = super().wait
+        self._record_play("wait", f"Wait({duration})", lambda: wait(duration, stop_condition))
+
+        return self
+
+
+def instrumented_segment(method: Callable) -> Callable:
+    """Decorator for the Scenario methods. When the scene is instrumented, the segment is recorded with its wall
+    time and the time of the construction between the plays. Otherwise the method is called as it is."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        instrumentation = getattr(self.scene, "instrumentation", None)
+        if instrumentation is None:
+            return method(self, *args, **kwargs)
+
+        frames = instrumentation.frames
+        plays_time = self.scene.plays_time
+        started = perf_counter()
+
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            wall_time = perf_counter() - started
+            plays_time = self.scene.plays_time - plays_time
+
+            instrumentation.record(
+                "segment",
+                method.__name__,
+                wall_time=wall_time,
+                frames=instrumentation.frames - frames,
+                mobjects=len(self.scene.get_mobject_family_members()),
+                construction=wall_time - plays_time,
+                plays=plays_time,
+            )
+
+    return wrapper
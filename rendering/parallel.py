@@ -0,0 +1,326 @@
+import inspect
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from manimlib.imports import FFMPEG_BIN
+
+from .dirty_rects import DirtyRectsMixin
+from .instrumentation import Instrumentation, InstrumentationMixin, Progress
+from .play_cache import PlayCache, PlayCacheMixin, PlayCacheRecord
+from .scene import (
+    DEFAULT_SCENARIO,
+    DEFAULT_SCENE,
+    CostEstimateMixin,
+    FramesCounterMixin,
+    get_camera_config,
+    get_scene_class,
+    import_object,
+    initialize_media,
+    with_mixins,
+)
+from .segment_cache import SegmentCache, get_classes_digest
+from .segments import DEFAULT_SEGMENT_COST, Segment, plan_segments, schedule_segments
+from .static_layers import StaticLayersMixin
+
+
+class RenderOptions(NamedTuple):
+    """Options, that are the same for all segments. Scene is set by path, so options could be sent to
+    the worker process."""
+
+    scene: str = DEFAULT_SCENE
+    scenario: str = DEFAULT_SCENARIO
+    quality: str = "low"
+    fps: int = None
+    media_dir: str = "media"
+    play_cache_dir: str = None
+    play_cache_size: int = 2 * 1024 ** 3
+    # Timings report of every segment and progress callback. Callback must be picklable for several workers.
+    report_dir: str = None
+    progress: Callable[[Progress], None] = None
+    # Rasterize mobjects, that aren't animated, once and draw only the animated ones in every frame
+    static_layers: bool = False
+    # Draw only the boxes of the animated mobjects over the previous frame, it uses the static layers as well
+    dirty_rects: bool = False
+
+
+class SegmentEstimate(NamedTuple):
+    play_costs: List[int]
+    play_frames: List[int]
+    play_classes: List[Set[type]]
+
+
+class SegmentResult(NamedTuple):
+    segment: Segment
+    path: Path
+    frames: int
+    wall_time: float
+    cached: bool = False
+    play_cache_records: Tuple[PlayCacheRecord, ...] = ()
+    report: Path = None
+
+
+class ParallelRenderException(Exception):
+    pass
+
+
+class ConcatException(ParallelRenderException):
+    pass
+
+
+def estimate_segment(method: str, options: RenderOptions) -> SegmentEstimate:
+    """Playing Scenario method without rendering, to get the cost of its plays.
+
+    Args:
+        method (str): Scenario method.
+        options (RenderOptions): Render options.
+
+    Returns:
+        SegmentEstimate: Cost, frames count and used classes of every play and wait.
+    """
+    initialize_media(options.media_dir)
+
+    scene_class = with_mixins(get_scene_class(options.scene), CostEstimateMixin)
+    scene = scene_class(
+        segments=[method],
+        camera_config=get_camera_config(options.quality, options.fps),
+        skip_animations=True,
+    )
+
+    return SegmentEstimate(scene.play_costs, scene.play_frames, scene.play_classes)
+
+
+def render_segment(segment: Segment, options: RenderOptions, total_frames: int = None) -> SegmentResult:
+    """Rendering one segment to its own video. Runs in the worker process.
+
+    Args:
+        segment (Segment): Segment to render.
+        options (RenderOptions): Render options.
+        total_frames (int, optional): Estimated frames count for the progress ETA. Defaults to None.
+
+    Returns:
+        SegmentResult: Path of the video, frames count and wall time.
+    """
+    started = perf_counter()
+    initialize_media(options.media_dir)
+
+    mixins_kwargs = {}
+    mixins = [FramesCounterMixin]
+
+    # Instrumentation goes first, so the cached plays are timed as well
+    report = Path(options.report_dir) / f"{segment.name}.jsonl" if options.report_dir else None
+    if report is not None or options.progress is not None:
+        mixins_kwargs["instrumentation"] = Instrumentation(report, options.progress, segment.name, total_frames)
+        mixins.append(InstrumentationMixin)
+
+    # Plays, that weren't changed, are taken from the play cache
+    if options.play_cache_dir:
+        mixins_kwargs["play_cache"] = PlayCache(options.play_cache_dir, options.play_cache_size)
+        mixins.append(PlayCacheMixin)
+
+    if options.dirty_rects:
+        mixins.append(DirtyRectsMixin)
+    elif options.static_layers:
+        mixins.append(StaticLayersMixin)
+
+    scene_class = with_mixins(get_scene_class(options.scene), *mixins)
+    scene = scene_class(
+        **mixins_kwargs,
+        segments=[segment.method],
+        camera_config=get_camera_config(options.quality, options.fps),
+        file_writer_config={
+            "write_to_movie": True,
+            "output_directory": str(Path(options.media_dir).resolve() / "segments"),
+            "file_name": segment.name,
+        },
+        skip_animations=bool(segment.start),
+        start_at_animation_number=segment.start,
+        end_at_animation_number=segment.end,
+    )
+
+    return SegmentResult(
+        segment=segment,
+        path=Path(scene.file_writer.get_movie_file_path()),
+        frames=scene.rendered_frames,
+        wall_time=perf_counter() - started,
+        play_cache_records=tuple(getattr(scene, "play_cache_records", ())),
+        report=report,
+    )
+
+
+def concat_videos(paths: Sequence[Union[str, Path]], output: Union[str, Path], ffmpeg_bin: str = FFMPEG_BIN) -> Path:
+    """Joining videos with ffmpeg concat demuxer. Streams are copied, so nothing is re-encoded.
+    All videos must have the same resolution, frame rate and codec.
+
+    Args:
+        paths (Sequence[Union[str, Path]]): Videos in the order of the result.
+        output (Union[str, Path]): Path of the result.
+        ffmpeg_bin (str, optional): ffmpeg executable. Defaults to FFMPEG_BIN.
+
+    Raises:
+        ConcatException: Raises when ffmpeg has failed.
+
+    Returns:
+        Path: Path of the result.
+    """
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    # Demuxer reads the list of the files, quotes in the paths are escaped as in the shell
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+        for path in paths:
+            escaped = str(Path(path).resolve()).replace("'", "'\\''")
+            file.write(f"file '{escaped}'\n")
+
+    try:
+        completed = subprocess.run(
+            [ffmpeg_bin, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", file.name, "-c", "copy"]
+            + [str(output)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+    finally:
+        os.remove(file.name)
+
+    if completed.returncode:
+        detail = f"ffmpeg has failed with code [{completed.returncode}]: {completed.stderr.strip()}"
+        raise ConcatException(detail)
+
+    return output
+
+
+def get_frames(segment: Segment, estimates: Dict[str, SegmentEstimate]) -> Optional[int]:
+    """Expected frames count of the segment. It's known only when the segment was estimated."""
+    if segment.method not in estimates:
+        return None
+
+    return sum(estimates[segment.method].play_frames[segment.start or 0 : segment.end])
+
+
+def get_cache_keys(
+    segments: Sequence[Segment],
+    estimates: Dict[str, SegmentEstimate],
+    options: RenderOptions,
+    cache: SegmentCache,
+) -> Dict[Segment, str]:
+    """Making cache keys for the segments.
+
+    Args:
+        segments (Sequence[Segment]): Segments.
+        estimates (Dict[str, SegmentEstimate]): Estimates of the Scenario methods.
+        options (RenderOptions): Render options.
+        cache (SegmentCache): Cache of the segments.
+
+    Returns:
+        Dict[Segment, str]: Cache key of every segment.
+    """
+    scene_class = get_scene_class(options.scene)
+    scenario_class = import_object(options.scenario)
+    root = Path(inspect.getfile(scenario_class)).parent
+
+    # Segments are the part of the key already
+    scene_config = {k: v for x in reversed(scene_class.__mro__) for k, v in vars(x).get("CONFIG", {}).items()}
+    scene_config.pop("segments", None)
+
+    camera_config = get_camera_config(options.quality, options.fps)
+
+    # Only the classes of the plays of the segment are in its key, so changing a class re-renders
+    # only the segments, where its mobjects are on the screen
+    classes_digests: Dict[FrozenSet[type], str] = {}
+    keys = {}
+    for segment in segments:
+        play_classes = estimates[segment.method].play_classes[segment.start or 0 : segment.end]
+        used_classes = frozenset().union(*play_classes)
+        if used_classes not in classes_digests:
+            classes_digests[used_classes] = get_classes_digest(used_classes, root)
+
+        keys[segment] = cache.key(
+            segment,
+            inspect.getsource(getattr(scenario_class, segment.method)),
+            classes_digests[used_classes],
+            scene_config,
+            camera_config,
+        )
+
+    return keys
+
+
+def render_parallel(
+    methods: Sequence[str],
+    output: Union[str, Path],
+    options: RenderOptions = RenderOptions(),
+    workers: int = None,
+    split: bool = True,
+    segment_cost: int = DEFAULT_SEGMENT_COST,
+    cache: SegmentCache = None,
+    force: bool = False,
+) -> List[SegmentResult]:
+    """Rendering Scenario methods in the process pool. Methods are played without rendering first, to estimate
+    their cost. Long methods are split by plays, segments are rendered longest first and joined in the order
+    of the methods. Segments, that weren't changed, are taken from the cache.
+
+    Args:
+        methods (Sequence[str]): Scenario methods in the order of the video.
+        output (Union[str, Path]): Path of the whole video.
+        options (RenderOptions, optional): Render options. Defaults to RenderOptions().
+        workers (int, optional): Processes count. Defaults to None (CPU count). With one worker segments are
+            rendered in this process.
+        split (bool, optional): Split long methods by plays. Defaults to True.
+        segment_cost (int, optional): Maximum cost of the split segment, frames count multiplied by mobjects
+            count. Defaults to DEFAULT_SEGMENT_COST.
+        cache (SegmentCache, optional): Cache of the rendered segments. Defaults to None (nothing is cached).
+        force (bool, optional): Render all segments again, even when they are cached. Defaults to False.
+
+    Returns:
+        List[SegmentResult]: Segments in the order of the video.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 and cache is None and options.progress is None:
+        # Nothing to plan, methods are rendered one by one in this process
+        estimates = {}
+        segments = [Segment(x) for x in methods]
+    else:
+        # Estimation runs in this process before the pool is started. It creates all texts, so the workers
+        # find them ready and don't write the same files at the same time.
+        estimates = {x: estimate_segment(x, options) for x in methods}
+        play_costs = {x: y.play_costs for x, y in estimates.items() if y.play_costs}
+        segments = plan_segments(play_costs, segment_cost, split=split)
+
+    results: Dict[Segment, SegmentResult] = {}
+    keys = get_cache_keys(segments, estimates, options, cache) if cache is not None else {}
+
+    for segment, key in keys.items():
+        path = None if force else cache.get(key)
+        if path is not None:
+            results[segment] = SegmentResult(segment, path, get_frames(segment, estimates), 0.0, cached=True)
+
+    pending = [x for x in segments if x not in results]
+
+    if workers == 1:
+        rendered = {x: render_segment(x, options, get_frames(x, estimates)) for x in pending}
+    elif pending:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+            futures = {
+                x: executor.submit(render_segment, x, options, get_frames(x, estimates))
+                for x in schedule_segments(pending)
+            }
+            rendered = {x: y.result() for x, y in futures.items()}
+    else:
+        rendered = {}
+
+    for segment, result in rendered.items():
+        results[segment] = result
+
+        if cache is not None:
+            cache.store_file(keys[segment], result.path)
+
+    ordered_results = [results[x] for x in segments]
+    concat_videos([x.path for x in ordered_results], output)
+
+    return ordered_results
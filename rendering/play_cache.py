@@ -0,0 +1,236 @@
+import hashlib
+import shutil
+from pathlib import Path
+from types import BuiltinFunctionType, CodeType, FunctionType, MethodType
+from typing import Callable, List, NamedTuple
+
+from manimlib.imports import DEFAULT_WAIT_TIME, Animation, Mobject
+from numpy import ndarray
+
+from classes import DiskCache
+
+# Attributes of the mobjects, that change how they look
+MOBJECT_STYLE_ATTRIBUTES = (
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_factor",
+    "sheen_direction",
+    "rgbas",
+    "pixel_array",
+)
+
+# Attributes of the camera, that change the frame
+CAMERA_ATTRIBUTES = (
+    "pixel_height",
+    "pixel_width",
+    "frame_rate",
+    "frame_height",
+    "frame_width",
+    "frame_center",
+    "background_color",
+    "background_opacity",
+)
+
+
+class PlayCacheRecord(NamedTuple):
+    index: int
+    name: str
+    hit: bool
+
+
+class Fingerprint:
+    """Stable digest of the animations and mobjects. Mobjects are hashed by their points and style,
+    functions by their code, so the same scene gives the same digest in every run."""
+
+    # Depth of the objects, that are hashed by their attributes
+    max_depth: int = 4
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+
+        # Objects, that were hashed already, are written as references. It also breaks the cycles.
+        self._seen = {}
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def _write(self, *parts):
+        for part in parts:
+            self._hash.update(part if isinstance(part, bytes) else str(part).encode())
+            self._hash.update(b"\0")
+
+    def update(self, value, depth: int = 0) -> "Fingerprint":
+        if value is None or isinstance(value, (bool, int, float, str, bytes)):
+            self._write(type(value).__name__, value)
+            return self
+
+        if isinstance(value, ndarray):
+            self._write("ndarray", value.dtype, value.shape, value.tobytes())
+            return self
+
+        if id(value) in self._seen:
+            self._write("ref", self._seen[id(value)])
+            return self
+
+        self._seen[id(value)] = len(self._seen)
+
+        if isinstance(value, Mobject):
+            self._update_mobject(value)
+        elif isinstance(value, (FunctionType, MethodType, BuiltinFunctionType)):
+            self._update_function(value)
+        elif isinstance(value, CodeType):
+            self._write("code", value.co_code)
+            for const in value.co_consts:
+                self.update(const, depth)
+        elif isinstance(value, dict):
+            self._write("dict", len(value))
+            for key in sorted(value, key=str):
+                self._write(key)
+                self.update(value[key], depth)
+        elif isinstance(value, (list, tuple)):
+            self._write(type(value).__name__, len(value))
+            for item in value:
+                self.update(item, depth)
+        elif isinstance(value, (set, frozenset)):
+            self._write("set", sorted(repr(x) for x in value))
+        elif hasattr(value, "__dict__") and depth < self.max_depth:
+            self._write(type(value).__qualname__)
+            self.update(vars(value), depth + 1)
+        else:
+            # Default repr has the address of the object, it's different in every run
+            text = repr(value)
+            self._write(type(value).__qualname__, "" if " at 0x" in text else text)
+
+        return self
+
+    def _update_mobject(self, mobject: Mobject):
+        self._write("mobject", type(mobject).__qualname__)
+        self.update(mobject.points)
+
+        for attribute in MOBJECT_STYLE_ATTRIBUTES:
+            if hasattr(mobject, attribute):
+                self._write(attribute)
+                self.update(getattr(mobject, attribute))
+
+        self.update(mobject.updaters)
+        self.update(mobject.submobjects)
+
+    def _update_function(self, function: Callable):
+        self._write("function", getattr(function, "__module__", ""), getattr(function, "__qualname__", ""))
+
+        if isinstance(function, MethodType):
+            self.update(function.__self__)
+            function = function.__func__
+
+        if isinstance(function, FunctionType):
+            self.update(function.__code__)
+            self.update(function.__defaults__)
+            self.update([x.cell_contents for x in function.__closure__ or ()])
+
+
+class PlayCache(DiskCache):
+    """Disk cache with the partial movies of the plays. Key is made from the state of the scene before the play
+    (points and style of all mobjects, camera) and the animations (run_time, rate function, targets)."""
+
+    suffix: str = ".mp4"
+
+    # Increase it when the fingerprint changes
+    version: int = 1
+
+    def key(self, scene, *parts) -> str:
+        """Making the cache key.
+
+        Args:
+            scene (Scene): Scene before the play.
+            parts: Animations or arguments of the wait.
+
+        Returns:
+            str: Cache key.
+        """
+        fingerprint = Fingerprint().update(self.version)
+
+        fingerprint.update(scene.mobjects)
+        fingerprint.update(scene.foreground_mobjects)
+
+        camera = scene.camera
+        fingerprint.update(type(camera).__qualname__)
+        fingerprint.update({x: getattr(camera, x) for x in CAMERA_ATTRIBUTES if hasattr(camera, x)})
+        if hasattr(camera, "frame"):
+            fingerprint.update(camera.frame)
+
+        for part in parts:
+            fingerprint.update(vars(part) if isinstance(part, Animation) else part)
+
+        return fingerprint.hexdigest()
+
+
+class PlayCacheMixin:
+    """Taking partial movies of the plays from the cache. Cached play is played through without rendering,
+    so the scene state after it is the same, and its movie is copied from the cache."""
+
+    def __init__(self, play_cache: PlayCache = None, **kwargs):
+        self.play_cache = play_cache
+        self.play_cache_records: List[PlayCacheRecord] = []
+        self._play_from_cache = False
+
+        super().__init__(**kwargs)
+
+    def update_skipping_status(self):
+        super().update_skipping_status()
+
+        if self._play_from_cache:
+            self.skip_animations = True
+
+    def _can_use_play_cache(self) -> bool:
+        return self.play_cache is not None and self.file_writer.write_to_movie and not self.skip_animations
+
+    def play(self, *args, **kwargs):
+        if not args or not self._can_use_play_cache():
+            return super().play(*args, **kwargs)
+
+        animations = self.compile_play_args_to_animation_list(*args, **kwargs)
+        key = self.play_cache.key(self, *animations)
+        name = ", ".join(str(x) for x in animations)
+
+        play = super().play
+        self._play_with_cache(key, name, lambda: play(*animations))
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, stop_condition=None):
+        if not self._can_use_play_cache():
+            return super().wait(duration, stop_condition)
+
+        key = self.play_cache.key(self, "wait", duration, stop_condition)
+
+        wait = super().wait
+        self._play_with_cache(key, f"Wait({duration})", lambda: wait(duration, stop_condition))
+
+        return self
+
+    def _play_with_cache(self, key: str, name: str, play: Callable):
+        """Playing with the cached movie, or rendering the movie and storing it to the cache.
+
+        Args:
+            key (str): Cache key.
+            name (str): Name of the play for the report.
+            play (Callable): Play or wait of the scene.
+        """
+        path = Path(self.file_writer.get_next_partial_movie_path())
+        cached_path = self.play_cache.get(key)
+
+        self._play_from_cache = cached_path is not None
+        try:
+            play()
+        finally:
+            if self._play_from_cache:
+                self.skip_animations = False
+            self._play_from_cache = False
+
+        if cached_path is not None:
+            shutil.copyfile(cached_path, path)
+        else:
+            self.play_cache.store_file(key, path)
+
+        self.play_cache_records.append(PlayCacheRecord(self.num_plays - 1, name, cached_path is not None))
@@ -0,0 +1,135 @@
+import json
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, List, NamedTuple, Sequence, Type, Union
+
+from manimlib.imports import Scene
+
+from .instrumentation import Progress
+from .parallel import RenderOptions, SegmentResult, render_parallel
+from .scene import DEFAULT_SCENARIO, DEFAULT_SCENE, get_scene_class
+from .segment_cache import SegmentCache
+from .segments import DEFAULT_SEGMENT_COST
+
+
+class RenderResult(NamedTuple):
+    output: Path
+    segments: List[SegmentResult]
+    wall_time: float
+
+    @property
+    def frames(self) -> int:
+        return sum(x.frames for x in self.segments)
+
+
+def render(
+    scene: Union[str, Type[Scene]] = DEFAULT_SCENE,
+    segments: Sequence[str] = None,
+    quality: str = "low",
+    fps: int = None,
+    workers: int = 1,
+    output: Union[str, Path] = None,
+    media_dir: str = "media",
+    scenario: str = DEFAULT_SCENARIO,
+    split: bool = True,
+    segment_cost: int = DEFAULT_SEGMENT_COST,
+    cache_dir: str = None,
+    cache_size: int = 2 * 1024 ** 3,
+    force: bool = False,
+    play_cache_dir: str = None,
+    report_dir: str = None,
+    progress: Callable[[Progress], None] = None,
+    static_layers: bool = False,
+    dirty_rects: bool = False,
+) -> RenderResult:
+    """Rendering the scene in this process, or in the process pool when there are several workers.
+    Errors of the rendering are raised as they are.
+
+    Args:
+        scene (Union[str, Type[Scene]], optional): Scene class or its path "module:Class".
+            Defaults to DEFAULT_SCENE.
+        segments (Sequence[str], optional): Scenario methods. Defaults to None (segments from the scene CONFIG).
+        quality (str, optional): One of "low", "medium", "high", "production". Defaults to "low".
+        fps (int, optional): Frame rate. Defaults to None (frame rate of the quality).
+        workers (int, optional): Processes count. Defaults to 1.
+        output (Union[str, Path], optional): Path of the video. Defaults to None (scene name in media_dir).
+        media_dir (str, optional): Directory for manim files. Defaults to "media".
+        scenario (str, optional): Path of the class with the segments. Defaults to DEFAULT_SCENARIO.
+        split (bool, optional): Split long segments by plays between the workers. Defaults to True.
+        segment_cost (int, optional): Maximum cost of the split segment, frames count multiplied by mobjects
+            count. Defaults to DEFAULT_SEGMENT_COST.
+        cache_dir (str, optional): Directory of the segments cache. Defaults to None (nothing is cached).
+        cache_size (int, optional): Maximum size of every cache in bytes. Defaults to 2 GB.
+        force (bool, optional): Render all segments again, even when they are cached. Defaults to False.
+        play_cache_dir (str, optional): Directory of the plays cache. Defaults to None (plays aren't cached).
+        report_dir (str, optional): Directory for the timings of every play and segment. JSONL file is written for
+            every segment, and report.json with all of them. Defaults to None (no report).
+        progress (Callable[[Progress], None], optional): Progress callback with ETA, must be picklable for several
+            workers. Defaults to None.
+        static_layers (bool, optional): Rasterize mobjects, that aren't animated, once for the play and draw only
+            the animated ones in every frame. Defaults to False.
+        dirty_rects (bool, optional): Draw only the boxes of the animated mobjects over the previous frame,
+            static layers are used for it as well. Defaults to False.
+
+    Returns:
+        RenderResult: Path of the video, frames count and wall time of every segment.
+    """
+    started = perf_counter()
+
+    scene_class = get_scene_class(scene)
+    output = Path(output) if output else Path(media_dir) / f"{scene_class.__name__}.mp4"
+
+    options = RenderOptions(
+        scene=scene if isinstance(scene, str) else f"{scene.__module__}:{scene.__qualname__}",
+        scenario=scenario,
+        quality=quality,
+        fps=fps,
+        media_dir=media_dir,
+        play_cache_dir=play_cache_dir,
+        play_cache_size=cache_size,
+        report_dir=report_dir,
+        progress=progress,
+        static_layers=static_layers,
+        dirty_rects=dirty_rects,
+    )
+
+    results = render_parallel(
+        segments or scene_class.CONFIG["segments"],
+        output,
+        options=options,
+        workers=workers,
+        split=split,
+        segment_cost=segment_cost,
+        cache=SegmentCache(cache_dir, cache_size) if cache_dir else None,
+        force=force,
+    )
+
+    result = RenderResult(output, results, perf_counter() - started)
+
+    if report_dir:
+        write_report(result, Path(report_dir) / "report.json")
+
+    return result
+
+
+def write_report(result: RenderResult, path: Path):
+    """Joining reports of the segments into one JSON file."""
+    segments = []
+    for segment in result.segments:
+        records = []
+        if segment.report is not None and segment.report.exists():
+            records = [json.loads(x) for x in segment.report.read_text().splitlines() if x]
+
+        segments.append(
+            {
+                "name": segment.segment.name,
+                "wall_time": segment.wall_time,
+                "frames": segment.frames,
+                "cached": segment.cached,
+                "records": records,
+            }
+        )
+
+    report = {"output": str(result.output), "wall_time": result.wall_time, "frames": result.frames}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({**report, "segments": segments}, indent=2))
@@ -0,0 +1,187 @@
+from importlib import import_module
+from math import ceil
+from typing import Any, Dict, List, Set, Type, Union
+
+from manimlib.constants import initialize_directories
+from manimlib.imports import (
+    DEFAULT_WAIT_TIME,
+    HIGH_QUALITY_CAMERA_CONFIG,
+    LOW_QUALITY_CAMERA_CONFIG,
+    MEDIUM_QUALITY_CAMERA_CONFIG,
+    PRODUCTION_QUALITY_CAMERA_CONFIG,
+    Scene,
+)
+
+# Scene that is rendered by default and the class with its segments, "module:Class"
+DEFAULT_SCENE = "main:MainScene"
+DEFAULT_SCENARIO = "scenario:Scenario"
+
+QUALITIES = {
+    "low": LOW_QUALITY_CAMERA_CONFIG,
+    "medium": MEDIUM_QUALITY_CAMERA_CONFIG,
+    "high": HIGH_QUALITY_CAMERA_CONFIG,
+    "production": PRODUCTION_QUALITY_CAMERA_CONFIG,
+}
+
+
+class SceneConfigException(Exception):
+    pass
+
+
+class SceneClassException(SceneConfigException):
+    pass
+
+
+class SceneQualityException(SceneConfigException):
+    pass
+
+
+def import_object(path: str) -> Any:
+    """Importing object by its path "module:name". Returns None, when the module has no such object."""
+    module_name, _, name = path.partition(":")
+
+    return getattr(import_module(module_name), name, None) if name else None
+
+
+def get_scene_class(scene: Union[str, Type[Scene]]) -> Type[Scene]:
+    """Getting scene class by its path. Path is used instead of the class, when the scene is sent to
+    another process.
+
+    Args:
+        scene (Union[str, Type[Scene]]): Path to the class "module:Class" or the class itself.
+
+    Raises:
+        SceneClassException: Raises when the path is wrong or it's not a scene.
+
+    Returns:
+        Type[Scene]: Scene class.
+    """
+    if not isinstance(scene, str):
+        return scene
+
+    scene_class = import_object(scene)
+
+    if not isinstance(scene_class, type) or not issubclass(scene_class, Scene):
+        detail = f"Scene must be set as 'module:Class', got [{scene}] instead."
+        raise SceneClassException(detail)
+
+    return scene_class
+
+
+def get_camera_config(quality: str, fps: int = None) -> Dict:
+    """Getting camera config for the quality, the same as manim flags -l, -m, --high_quality set.
+
+    Args:
+        quality (str): One of "low", "medium", "high", "production".
+        fps (int, optional): Frame rate. Defaults to None (frame rate of the quality).
+
+    Raises:
+        SceneQualityException: Raises when the quality is unknown.
+
+    Returns:
+        Dict: Camera config.
+    """
+    if quality not in QUALITIES:
+        detail = f"Quality must be one of {list(QUALITIES)}, got [{quality}] instead."
+        raise SceneQualityException(detail)
+
+    camera_config = dict(QUALITIES[quality])
+    if fps:
+        camera_config["frame_rate"] = fps
+
+    return camera_config
+
+
+def initialize_media(media_dir: str):
+    """Setting manim directories for videos, texts and Tex files, the same way as manim CLI does."""
+    initialize_directories(
+        {
+            "media_dir": media_dir,
+            "video_dir": None,
+            "video_output_dir": None,
+            "tex_dir": None,
+        }
+    )
+
+
+def with_mixins(scene_class: Type[Scene], *mixins: type) -> Type[Scene]:
+    """Creating scene class with the mixins. Mixins are going before the scene, so they could override
+    its methods and call them with super()."""
+    if not mixins:
+        return scene_class
+
+    names = "".join(x.__name__.replace("Mixin", "") for x in mixins)
+
+    return type(f"{names}{scene_class.__name__}", (*mixins, scene_class), {})
+
+
+class FramesCounterMixin:
+    """Counting frames, that were written to the movie. Skipped animations aren't counted."""
+
+    def __init__(self, **kwargs):
+        # Scene is played in __init__, so the counter must exist before it
+        self.rendered_frames = 0
+
+        super().__init__(**kwargs)
+
+    def add_frames(self, *frames):
+        if not self.skip_animations:
+            self.rendered_frames += len(frames)
+
+        super().add_frames(*frames)
+
+
+class CostEstimateMixin:
+    """Estimating render cost of every play and wait call as frames count multiplied by mobjects count.
+    Classes of the mobjects and animations of every play are recorded as well, they are used for the cache key
+    of the segment with these plays.
+    Scene should be played with skip_animations, so frames aren't rendered."""
+
+    def __init__(self, **kwargs):
+        self.play_costs: List[int] = []
+        self.play_frames: List[int] = []
+        self.play_classes: List[Set[type]] = []
+        self._play_classes: Set[type] = set()
+        self._play_cost = 0
+        self._play_frames = 0
+
+        super().__init__(**kwargs)
+
+    def _record_classes(self, objects: list):
+        self._play_classes.update(type(x) for x in objects)
+
+    def _record_play(self, cost: int, frames: int):
+        self.play_costs.append(cost)
+        self.play_frames.append(frames)
+        self.play_classes.append(self._play_classes)
+        self._play_classes = set()
+
+    def begin_animations(self, animations: list):
+        super().begin_animations(animations)
+
+        family = self.get_mobject_family_members()
+        self._record_classes(animations)
+        self._record_classes(family)
+
+        self._play_frames = ceil(self.get_run_time(animations) * self.camera.frame_rate)
+        self._play_cost = self._play_frames * len(family)
+
+    def play(self, *args, **kwargs):
+        self._play_cost = 0
+        self._play_frames = 0
+
+        super().play(*args, **kwargs)
+
+        self._record_play(self._play_cost, self._play_frames)
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, stop_condition=None):
+        family = self.get_mobject_family_members()
+        self._record_classes(family)
+
+        # Frame of the wait is rendered once and repeated, so only encoding depends on its duration
+        frames = int(duration * self.camera.frame_rate)
+        cost = len(family) + frames
+
+        super().wait(duration, stop_condition)
+
+        self._record_play(cost, frames)
@@ -0,0 +1,113 @@
+import hashlib
+import inspect
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, Optional, Union
+
+from classes import DiskCache
+
+from .segments import Segment
+
+
+class SegmentCache(DiskCache):
+    """Disk cache with the rendered segments. Key is made from everything that changes the video of the segment:
+    code of the Scenario method (with all constructor args, values and colors written in it), code of the classes,
+    that were used in the segment, scene config (background color) and camera config (quality, fps).
+    So changing the funnels doesn't render again the segments without funnels."""
+
+    suffix: str = ".mp4"
+
+    # Increase it when the way of rendering changes
+    version: int = 1
+
+    def key(
+        self,
+        segment: Segment,
+        method_source: str,
+        classes_digest: str,
+        scene_config: dict,
+        camera_config: dict,
+    ) -> str:
+        """Making the cache key.
+
+        Args:
+            segment (Segment): Rendered segment.
+            method_source (str): Code of the Scenario method.
+            classes_digest (str): Digest of the code of the used classes, see get_classes_digest.
+            scene_config (dict): Scene CONFIG.
+            camera_config (dict): Camera config for the quality.
+
+        Returns:
+            str: Cache key.
+        """
+        return self.make_key(
+            self.version,
+            segment.method,
+            segment.start,
+            segment.end,
+            method_source,
+            classes_digest,
+            _stable_repr(scene_config),
+            _stable_repr(camera_config),
+        )
+
+
+def _stable_repr(value) -> str:
+    """Dicts are sorted, so the same config always has the same repr."""
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{k!r}: {_stable_repr(v)}" for k, v in sorted(value.items(), key=str)) + "}"
+
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_stable_repr(x) for x in value) + "]"
+
+    return repr(value)
+
+
+def _get_local_path(module: Optional[ModuleType], root: Path) -> Optional[Path]:
+    """Getting file of the module, when it's the module of the project, not of the installed library."""
+    file = getattr(module, "__file__", None)
+    if not file:
+        return None
+
+    path = Path(file).resolve()
+    if root not in path.parents or "site-packages" in path.parts:
+        return None
+
+    return path
+
+
+def get_classes_digest(classes: Iterable[type], root: Union[str, Path]) -> str:
+    """Digest of the code of the classes and all project modules they depend on. Modules of the libraries
+    aren't included, only the files under root.
+
+    Args:
+        classes (Iterable[type]): Used classes of mobjects and animations.
+        root (Union[str, Path]): Project directory.
+
+    Returns:
+        str: Hex digest.
+    """
+    root = Path(root).resolve()
+
+    modules: Dict[str, Path] = {}
+    pending = [sys.modules.get(x.__module__) for cls in classes for x in cls.__mro__]
+
+    while pending:
+        module = pending.pop()
+        path = _get_local_path(module, root)
+        if path is None or module.__name__ in modules:
+            continue
+
+        modules[module.__name__] = path
+
+        # Modules and classes imported by the module
+        for value in vars(module).values():
+            if inspect.ismodule(value):
+                pending.append(value)
+            elif inspect.isclass(value) or inspect.isfunction(value):
+                pending.append(sys.modules.get(value.__module__))
+
+    digests = sorted((name, hashlib.sha256(path.read_bytes()).hexdigest()) for name, path in modules.items())
+
+    return DiskCache.make_key(*digests)
@@ -0,0 +1,106 @@
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+# Cost of the segment, that is rendered by one worker, it's frames count multiplied by mobjects count.
+# It's about 10 seconds of 100 mobjects in the low quality.
+DEFAULT_SEGMENT_COST = 15000
+
+
+class Segment(NamedTuple):
+    """Part of the scene, that is rendered as its own video. It's one Scenario method, or only plays
+    [start, end) of it. Plays before start are skipped, so the state of the scene is the same as in
+    the whole video."""
+
+    method: str
+    start: Optional[int] = None
+    end: Optional[int] = None
+    cost: int = 0
+
+    @property
+    def name(self) -> str:
+        if self.start is None and self.end is None:
+            return self.method
+
+        return f"{self.method}_{self.start or 0}_{'' if self.end is None else self.end}"
+
+
+class SegmentsException(Exception):
+    pass
+
+
+class SegmentCostException(SegmentsException):
+    pass
+
+
+def split_segment(method: str, play_costs: Sequence[int], max_cost: int) -> List[Segment]:
+    """Splitting Scenario method into segments by plays, so every segment costs no more than max_cost.
+    Play can't be split, so one play could cost more.
+
+    Args:
+        method (str): Scenario method.
+        play_costs (Sequence[int]): Cost of every play and wait of the method.
+        max_cost (int): Maximum cost of the segment.
+
+    Raises:
+        SegmentCostException: Raises when max_cost is not positive.
+
+    Returns:
+        List[Segment]: Segments in the order of the plays.
+    """
+    if max_cost <= 0:
+        detail = f"Segment cost must be a positive number, got [{max_cost}] instead."
+        raise SegmentCostException(detail)
+
+    bounds = [0]
+    cost = 0
+    for i, play_cost in enumerate(play_costs):
+        if cost and cost + play_cost > max_cost:
+            bounds.append(i)
+            cost = 0
+
+        cost += play_cost
+
+    bounds.append(len(play_costs))
+
+    if len(bounds) == 2:
+        return [Segment(method, cost=sum(play_costs))]
+
+    return [
+        Segment(
+            method,
+            start=start or None,
+            end=end if end < len(play_costs) else None,
+            cost=sum(play_costs[start:end]),
+        )
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+def plan_segments(
+    play_costs: Dict[str, Sequence[int]], max_cost: int = DEFAULT_SEGMENT_COST, split: bool = True
+) -> List[Segment]:
+    """Planning segments for rendering by several workers. Methods that cost more than max_cost are split
+    by plays. Bounds of the segments depend only on the plays of the method, not on the workers count or
+    the other methods, so the cached segments are found again with any of them.
+
+    Args:
+        play_costs (Dict[str, Sequence[int]]): Costs of the plays of every method, in the order of the video.
+        max_cost (int, optional): Maximum cost of the segment. Defaults to DEFAULT_SEGMENT_COST.
+        split (bool, optional): Split long methods. Defaults to True.
+
+    Returns:
+        List[Segment]: Segments in the order of the video.
+    """
+    segments = []
+    for method, costs in play_costs.items():
+        if split:
+            segments.extend(split_segment(method, costs, max_cost))
+        else:
+            segments.append(Segment(method, cost=sum(costs)))
+
+    return segments
+
+
+def schedule_segments(segments: Sequence[Segment]) -> List[Segment]:
+    """Longest segments go first. Workers take the next segment when they are free, so short segments
+    fill the gaps at the end, and the whole render takes about as long as the longest segment."""
+    return sorted(segments, key=lambda x: x.cost, reverse=True)
@@ -0,0 +1,237 @@
+import hashlib
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Set, Tuple
+
+from manimlib.imports import Mobject, VMobject, list_update
+from numpy import flatnonzero, ndarray, uint8, uint16, zeros_like
+
+from .play_cache import MOBJECT_STYLE_ATTRIBUTES
+
+
+class StaticLayer(NamedTuple):
+    """Rasterized static mobjects. Opaque layer is the whole frame with the background, transparent one is
+    cropped to the pixels, that were drawn, and is composited over the frame."""
+
+    pixels: ndarray
+    rows: slice
+    columns: slice
+
+
+class Layers(NamedTuple):
+    """Mobjects of the frame in the drawing order. Background is the static mobjects before the first animated
+    one. Every layer after it is either static (rasterized once and composited) or drawn in every frame."""
+
+    background: List[Mobject]
+    layers: List[Tuple[bool, List[Mobject]]]
+
+
+def split_layers(members: List[Mobject], animated: Set[int], min_layer_size: int) -> Layers:
+    """Splitting mobjects into the static and animated layers, keeping their drawing order.
+
+    Args:
+        members (List[Mobject]): Mobjects with points in the drawing order.
+        animated (Set[int]): Ids of the mobjects, that are changed by the animations or updaters.
+        min_layer_size (int): Shorter runs of the static mobjects after the first animated one are drawn in every
+            frame, compositing of the whole layer costs more for them.
+
+    Returns:
+        Layers: Background and the layers over it.
+    """
+    first = next((i for i, x in enumerate(members) if id(x) in animated), len(members))
+
+    layers = []
+    for member in members[first:]:
+        # Transparent layer is composited as premultiplied RGBA, the same way as cairo draws vectorized mobjects.
+        # Other mobjects are blended differently, so they are drawn as they are.
+        static = id(member) not in animated and isinstance(member, VMobject)
+
+        if layers and layers[-1][0] == static:
+            layers[-1][1].append(member)
+        else:
+            layers.append((static, [member]))
+
+    # Short static runs are joined with the drawn ones around them
+    merged = []
+    for static, run in layers:
+        static = static and len(run) >= min_layer_size
+        if merged and merged[-1][0] == static:
+            merged[-1][1].extend(run)
+        else:
+            merged.append((static, list(run)))
+
+    return Layers(members[:first], merged)
+
+
+def composite(pixels: ndarray, layer: StaticLayer):
+    """Drawing premultiplied RGBA layer over the frame in place, cairo OVER operator."""
+    target = pixels[layer.rows, layer.columns]
+    source = layer.pixels.astype(uint16)
+
+    alpha = source[:, :, 3:]
+    blended = source + (target.astype(uint16) * (255 - alpha) + 127) // 255
+
+    target[...] = blended.clip(0, 255).astype(uint8)
+
+
+class StaticLayersMixin:
+    """Rasterizing mobjects, that aren't changed by the current animation, only once. They are kept as cached
+    layers for the camera state, and only animated mobjects are drawn in every frame. Static mobjects over
+    the animated ones are composited from the transparent layer, so the drawing order is the same, pixels could
+    differ by one because of rounding. Full frames of waits and static images of plays are cached as well."""
+
+    # Count of the cached layers, every opaque layer takes the whole frame
+    static_layers_cache_size: int = 8
+
+    # Static runs shorter than this are drawn in every frame instead of compositing
+    static_layers_min_size: int = 16
+
+    def __init__(self, **kwargs):
+        self._static_layers: "OrderedDict[str, StaticLayer]" = OrderedDict()
+
+        super().__init__(**kwargs)
+
+    def get_layer_key(self, members: List[Mobject], opaque: bool) -> str:
+        """Key of the layer from the camera state and the points and style of the mobjects. Mobjects with
+        the same points and style are drawn the same way, so it doesn't matter, which mobjects they are."""
+        camera = self.camera
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(repr((opaque, camera.pixel_array.shape, str(camera.background_color))).encode())
+        digest.update(repr(camera.background_opacity).encode())
+
+        # Moving camera has the frame mobject, other cameras have fixed frame
+        frame = getattr(camera, "frame", None)
+        if frame is not None:
+            digest.update(frame.points.tobytes())
+        else:
+            digest.update(repr((tuple(camera.frame_center), camera.frame_width, camera.frame_height)).encode())
+
+        for member in members:
+            digest.update(type(member).__qualname__.encode())
+            digest.update(member.points.tobytes())
+
+            for attribute in MOBJECT_STYLE_ATTRIBUTES:
+                value = getattr(member, attribute, None)
+                if value is not None:
+                    digest.update(value.tobytes() if isinstance(value, ndarray) else repr(value).encode())
+
+        return digest.hexdigest()
+
+    def get_static_layer(self, members: List[Mobject], opaque: bool) -> StaticLayer:
+        """Getting the layer from the cache or rasterizing it.
+
+        Args:
+            members (List[Mobject]): Mobjects with points in the drawing order.
+            opaque (bool): Draw them over the background of the camera, otherwise over the transparent frame.
+
+        Returns:
+            StaticLayer: Rasterized mobjects.
+        """
+        key = self.get_layer_key(members, opaque)
+
+        layer = self._static_layers.get(key)
+        if layer is not None:
+            self._static_layers.move_to_end(key)
+            return layer
+
+        camera = self.camera
+        if opaque:
+            camera.reset()
+        else:
+            camera.set_pixel_array(zeros_like(camera.pixel_array))
+
+        camera.capture_mobjects(members, include_submobjects=False)
+
+        layer = StaticLayer(camera.pixel_array.copy(), slice(None), slice(None))
+        if not opaque:
+            layer = self._crop_layer(layer.pixels)
+
+        self._static_layers[key] = layer
+        while len(self._static_layers) > self.static_layers_cache_size:
+            self._static_layers.popitem(last=False)
+
+        return layer
+
+    @staticmethod
+    def _crop_layer(pixels: ndarray) -> StaticLayer:
+        drawn = pixels[:, :, 3] > 0
+        rows, columns = flatnonzero(drawn.any(axis=1)), flatnonzero(drawn.any(axis=0))
+
+        if not len(rows):
+            return StaticLayer(pixels[:0, :0], slice(0, 0), slice(0, 0))
+
+        rows = slice(rows[0], rows[-1] + 1)
+        columns = slice(columns[0], columns[-1] + 1)
+
+        return StaticLayer(pixels[rows, columns].copy(), rows, columns)
+
+    def get_drawn_members(self, excluded_mobjects: List[Mobject] = None) -> List[Mobject]:
+        """Mobjects with points in the drawing order, the same ones as update_frame draws."""
+        camera = self.camera
+        members = camera.extract_mobject_family_members(
+            list_update(self.mobjects, self.foreground_mobjects), only_those_with_points=True
+        )
+
+        if excluded_mobjects:
+            excluded = {id(x) for x in camera.extract_mobject_family_members(excluded_mobjects)}
+            members = [x for x in members if id(x) not in excluded]
+
+        return members
+
+    def update_frame(self, mobjects=None, background=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        # Only the full frames are cached, frames with the chosen mobjects are drawn as usual
+        if mobjects is not None or background is not None or not include_submobjects:
+            return super().update_frame(mobjects, background, include_submobjects, ignore_skipping, **kwargs)
+
+        if self.skip_animations and not ignore_skipping:
+            return
+
+        members = self.get_drawn_members(kwargs.get("excluded_mobjects"))
+        self.camera.set_frame_to_background(self.get_static_layer(members, opaque=True).pixels)
+
+    def get_animated_ids(self, animations: list) -> Optional[Set[int]]:
+        """Ids of the mobjects, that could change in the play. Returns None, when the camera is moving, so
+        every mobject is changed."""
+        changed = [x.mobject for x in animations] + list(self.foreground_mobjects)
+        changed += [x for x in self.get_mobject_family_members() if x.updaters]
+
+        animated = {id(x) for mobject in changed for x in mobject.get_family()}
+
+        get_indicators = getattr(self.camera, "get_mobjects_indicating_movement", None)
+        if get_indicators is not None and any(id(x) in animated for x in get_indicators()):
+            return None
+
+        return animated
+
+    def update_frame_layers(self, background: StaticLayer, layers: List[Tuple[Optional[StaticLayer], list]]):
+        """Drawing the frame from the background, cached static layers and animated mobjects."""
+        camera = self.camera
+        camera.set_frame_to_background(background.pixels)
+
+        for layer, members in layers:
+            if layer is not None:
+                composite(camera.pixel_array, layer)
+            else:
+                camera.capture_mobjects(members, include_submobjects=False)
+
+    def progress_through_animations(self, animations: list):
+        animated = None if self.skip_animations else self.get_animated_ids(animations)
+        if animated is None:
+            return super().progress_through_animations(animations)
+
+        split = split_layers(self.get_drawn_members(), animated, self.static_layers_min_size)
+
+        background = self.get_static_layer(split.background, opaque=True)
+        layers = [(self.get_static_layer(x, opaque=False) if static else None, x) for static, x in split.layers]
+
+        last_t = 0
+        for t in self.get_animation_time_progression(animations):
+            dt = t - last_t
+            last_t = t
+
+            for animation in animations:
+                animation.update_mobjects(dt)
+                animation.interpolate(t / animation.run_time)
+
+            self.update_mobjects(dt)
+            self.update_frame_layers(background, layers)
+            self.add_frames(self.get_frame())
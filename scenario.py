@@ -1,21 +1,27 @@
-from copy import deepcopy
 from random import randint
 
 from colour import Color
 from manimlib.imports import BLACK, Dot, FadeIn, FadeOut, Scene, Transform, VGroup
-from numpy import array
+from numpy import arange, array, stack
+from numpy.random import default_rng
 
 from classes import (
     CategoricalGraph,
     ContinuousGraph,
     CustomersTable,
+    DotCloud,
+    FollowTrajectories,
     Funnel,
     Funnels,
+    GaltonBoard,
     HistogramText,
     MovableCategoricalGraph,
     MovableContinuousGraph,
     MovableFunnel,
+    MoveToTargets,
+    get_dots_arrays,
 )
+from rendering.instrumentation import instrumented_segment
 
 
 class Scenario:
@@ -27,6 +33,7 @@ class Scenario:
         """
         self.scene = scene
 
+    @instrumented_segment
     def play_first_scene(self):
         # We are creating list for storing dots
         dots = []
@@ -83,6 +90,7 @@ class Scenario:
         # Waiting
         self.scene.wait(1)
 
+    @instrumented_segment
     def play_second_scene(self):
         table = CustomersTable(
             ((-2, 2), (2, 2)),
@@ -95,6 +103,7 @@ class Scenario:
 
         self.scene.wait(3)
 
+    @instrumented_segment
     def play_third_scene(self):
         cont_graph = ContinuousGraph(
             ((-4, -1), (0, -1)),
@@ -114,6 +123,7 @@ class Scenario:
 
         self.scene.wait(3)
 
+    @instrumented_segment
     def play_fourth_scene(self):
         funnel = Funnel(
             ((-2, 2), (1, -2)),
@@ -127,6 +137,7 @@ class Scenario:
 
         self.scene.wait(3)
 
+    @instrumented_segment
     def play_fifth_scene(self):
         # Initial dot values, to keep them the same over several animation builds
         start_dot_values = [1, 2, 1, 3, 4, 2, 1]
@@ -158,6 +169,7 @@ class Scenario:
 
         self.scene.wait(3)
 
+    @instrumented_segment
     def play_sixth_scene(self):
         bins = 100
         funnels = Funnels(
@@ -190,6 +202,52 @@ class Scenario:
             animate_rest=False,
         )
 
+    @instrumented_segment
+    def play_galton_board(self):
+        # Dot bins maximum value
+        bins = 100
+        count = 2000
+        radius = 0.05
+
+        dot_colors = list(Color("#7fcc81").range_to("#ff7555", int(bins)))
+
+        funnels = Funnels(
+            start_end_points=((-6.5, -0.5), (6.5, -0.5)),
+            funnel=Funnel,
+            count=5,
+            bins=bins,
+            annot=True,
+            point_radius=0.15,
+            height=3,
+        )
+
+        # Dots are placed in rows above the funnels, with the small random shift, so they don't fall in columns.
+        # Rows are narrower than the funnels, so the dots don't fall on the outer walls. The funnels are filled above
+        # their tops, before the dots flow out, so a few dots still fall over the outer walls.
+        generator = default_rng(0)
+        values = generator.integers(1, bins + 1, count)
+        step = radius * 2.4
+        columns = int(11 / step)
+        centers = stack([-5.5 + arange(count) % columns * step, 0.2 + arange(count) // columns * step], axis=1)
+        centers[:, 0] += generator.uniform(-radius / 4, radius / 4, count)
+
+        dots = DotCloud(values, centers, radii=radius, colors=[dot_colors[x - 1] for x in values], annot=False)
+
+        self.scene.play(FadeIn(funnels), FadeIn(dots))
+
+        # Fall is simulated before the animation, and the animation only follows the dots locations.
+        # All dots flow out of the funnels in about 18 seconds.
+        duration = 18
+        board = GaltonBoard.from_mobjects(funnels, dots)
+        trajectories = board.simulate(duration, self.scene.camera.frame_rate)
+
+        self.scene.play(FollowTrajectories(dots, trajectories), run_time=duration)
+
+        self.scene.wait(2)
+
+        self.scene.play(FadeOut(funnels), FadeOut(dots))
+
+    @instrumented_segment
     def play_whole_scenario(self):
         # Dot bins maximum value
         bins = 100
@@ -230,9 +288,6 @@ class Scenario:
             annot=True,
         )
 
-        # Copying dots. This for the future needs.
-        dots_second_position = deepcopy(table.dots)
-
         # Playing animations
         self.scene.play(FadeIn(table), FadeIn(x_graph))
 
@@ -251,18 +306,14 @@ class Scenario:
         # Removing graph
         self.scene.play(FadeOut(table.lines), FadeOut(table.customers))
 
-        # Moving dots from the first graph to the second
-        x_graph_second_position.drag_in_dots(
-            scene=self.scene,
-            dots=dots_second_position,
-            animate_slow=0,
-            animate_rest=False,
-        )
+        # Dots locations on the second graph. Dots themselves aren't copied, only their centers are calculated.
+        values, radii, _ = get_dots_arrays(table.dots)
+        dots_second_position = x_graph_second_position.get_next_dots_coords(values, radii)
 
         # Playing animation with moving graph from position 1 to position 2, and same for the dots.
         self.scene.play(
             Transform(x_graph, x_graph_second_position),
-            Transform(table.dots, dots_second_position),
+            MoveToTargets(table.dots, dots_second_position),
         )
 
         self.scene.wait(3)
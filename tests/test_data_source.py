@@ -0,0 +1,126 @@
+import pytest
+from numpy import arange, array, save
+
+from classes.data_source import (
+    ArrayDataSource,
+    CsvDataSource,
+    DataRow,
+    DataSourceFormatException,
+    DataSourceLengthException,
+    DataSourceRewindException,
+    IteratorDataSource,
+    NpyDataSource,
+    open_data_source,
+)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "customers.csv"
+    lines = ["value,name"] + [f"{i % 4 + 1},Customer {i}" for i in range(10)]
+
+    # Empty lines aren't rows
+    lines.insert(5, "")
+    path.write_text("\n".join(lines) + "\n")
+
+    return path
+
+
+def test_array_source():
+    source = ArrayDataSource(array([1, 2, 3]), labels=["a", "b", "c"])
+
+    assert len(source) == 3
+    assert source.read(1, 5) == [DataRow(2, "b"), DataRow(3, "c")]
+    assert source[0] == DataRow(1, "a")
+
+    with pytest.raises(IndexError):
+        source[3]
+
+
+def test_npy_source(tmp_path):
+    save(tmp_path / "values.npy", arange(12).reshape(6, 2))
+    source = NpyDataSource(tmp_path / "values.npy", column=1)
+
+    assert len(source) == 6
+    assert [x.value for x in source.read(2, 4)] == [5, 7]
+
+
+def test_csv_source_reads_any_chunk(csv_path):
+    source = CsvDataSource(csv_path, value_column="value", label_column="name", chunk_size=3)
+
+    # Chunks are read out of order, chunks before them are only skipped
+    assert source.read(7, 9) == [DataRow(4, "Customer 7"), DataRow(1, "Customer 8")]
+    assert source.read(0, 2) == [DataRow(1, "Customer 0"), DataRow(2, "Customer 1")]
+    assert [x.label for x in source.read(2, 5)] == ["Customer 2", "Customer 3", "Customer 4"]
+    assert [x.label for x in source.read(8, 20)] == ["Customer 8", "Customer 9"]
+    assert source.read(10, 20) == []
+    assert len(source) == 10
+
+
+def test_csv_source_chunks_offsets(csv_path):
+    source = CsvDataSource(csv_path, label_column=1, chunk_size=3)
+    len(source)
+
+    # Offset of every chunk is the start of its first row
+    content = csv_path.read_bytes()
+    for i, offset in enumerate(source._chunks_offsets):
+        first_row = content[offset:].lstrip(b"\n").split(b"\n")[0]
+        assert first_row.endswith(f"Customer {i * 3}".encode())
+
+
+def test_csv_source_length_multiple_of_chunk(tmp_path):
+    path = tmp_path / "values.csv"
+    path.write_text("\n".join(str(x) for x in range(1, 10)))
+
+    source = CsvDataSource(path, chunk_size=3)
+
+    assert len(source) == 9
+    assert source[8].value == 9
+    assert source[0] == DataRow(1, None)
+
+
+def test_csv_source_format(tmp_path):
+    path = tmp_path / "values.csv"
+    path.write_text("1\nfoo\n")
+
+    with pytest.raises(DataSourceFormatException):
+        CsvDataSource(path).read(0, 2)
+
+    with pytest.raises(DataSourceFormatException):
+        CsvDataSource(path, value_column="missing")
+
+
+def test_iterator_source_rewind():
+    source = IteratorDataSource(iter(range(1, 21)), history=5)
+
+    assert [x.value for x in source.read(0, 10)] == list(range(1, 11))
+
+    # Rows in the history could be read again, older ones are dropped
+    assert [x.value for x in source.read(5, 7)] == [6, 7]
+
+    with pytest.raises(DataSourceRewindException):
+        source.read(4, 5)
+
+    with pytest.raises(DataSourceLengthException):
+        len(source)
+
+    assert [x.value for x in source.read(18, 30)] == [19, 20]
+    assert len(source) == 20
+
+
+def test_iterator_source_labels():
+    source = IteratorDataSource([(1, "first"), ("2.5", "second"), 3])
+
+    assert source.read(0, 3) == [DataRow(1, "first"), DataRow(2.5, "second"), DataRow(3, None)]
+
+
+def test_open_data_source(tmp_path, csv_path):
+    save(tmp_path / "values.npy", arange(3))
+
+    assert isinstance(open_data_source([1, 2]), ArrayDataSource)
+    assert isinstance(open_data_source(tmp_path / "values.npy"), NpyDataSource)
+    assert isinstance(open_data_source(str(csv_path)), CsvDataSource)
+    assert isinstance(open_data_source(x for x in [1, 2]), IteratorDataSource)
+
+    with pytest.raises(DataSourceFormatException):
+        open_data_source("values.json")
@@ -0,0 +1,141 @@
+import os
+
+import pytest
+from numpy import array, zeros
+from numpy.testing import assert_allclose
+
+from classes.disk_cache import DiskCache, DiskCacheException
+from classes.text_cache import TextGeometryCache
+
+
+def store_bytes(cache: DiskCache, key: str, size: int, mtime: float = None):
+    path = cache.store(key, lambda file: file.write(b"x" * size))
+
+    # File system time could be too coarse to order the files written one after another
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+    return path
+
+
+def test_store_and_get(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=100)
+
+    assert cache.get("missing") is None
+
+    path = store_bytes(cache, "key", 10)
+
+    assert cache.get("key") == path
+    assert path.read_bytes() == b"x" * 10
+    assert cache.size() == 10
+
+
+def test_negative_size():
+    with pytest.raises(DiskCacheException):
+        DiskCache("cache", max_bytes=-1)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=30)
+    for i, key in enumerate(["a", "b", "c"]):
+        store_bytes(cache, key, 10, mtime=1000 + i)
+
+    # Reading marks the file as recently used, so "b" is the oldest one now
+    cache.get("a")
+    store_bytes(cache, "d", 10)
+
+    assert cache.get("b") is None
+    assert all(cache.get(x) is not None for x in ["a", "c", "d"])
+    assert cache.size() == 30
+
+
+def test_eviction_keeps_size_limit(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=25)
+    for i in range(10):
+        store_bytes(cache, str(i), 10, mtime=1000 + i)
+
+    assert cache.size() <= 25
+    assert sum(x.stat().st_size for x in tmp_path.iterdir()) == cache.size()
+
+    # Size is tracked without walking the directory, and it's the same after walking it
+    assert DiskCache(tmp_path, max_bytes=25).size() == cache.size()
+
+
+def test_overwrite_and_remove(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=100)
+    store_bytes(cache, "key", 10)
+    store_bytes(cache, "key", 20)
+
+    assert cache.size() == 20
+
+    cache.remove("key")
+
+    assert cache.get("key") is None
+    assert cache.size() == 0
+
+
+def test_failed_write_is_atomic(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=100)
+    store_bytes(cache, "key", 10)
+
+    def write(file):
+        file.write(b"partial")
+        raise RuntimeError("write failed")
+
+    with pytest.raises(RuntimeError):
+        cache.store("key", write)
+
+    with pytest.raises(RuntimeError):
+        cache.store("new", write)
+
+    # Old file is kept as it was, and no temporary files are left
+    assert cache.get("key").read_bytes() == b"x" * 10
+    assert cache.get("new") is None
+    assert [x.name for x in tmp_path.iterdir()] == ["key"]
+    assert cache.size() == 10
+
+
+def test_clear(tmp_path):
+    cache = DiskCache(tmp_path / "cache", max_bytes=100)
+    store_bytes(cache, "key", 10)
+    cache.clear()
+
+    assert cache.get("key") is None
+    assert cache.size() == 0
+
+
+def test_text_geometry_round_trip(tmp_path):
+    cache = TextGeometryCache(tmp_path, max_bytes=10 ** 6)
+    key = cache.key("12", "Consolas", {"size": 1})
+    points = [array([[0, 0, 0], [1, 1, 0]], dtype=float), zeros((0, 3)), array([[2, 2, 0]], dtype=float)]
+
+    assert cache.load(key) is None
+
+    cache.save(key, points, [True, False, True])
+    loaded, visible = cache.load(key)
+
+    assert len(loaded) == 3
+    for x, y in zip(loaded, points):
+        assert_allclose(x, y)
+    assert visible.tolist() == [True, False, True]
+
+
+def test_text_geometry_invalidate_font(tmp_path):
+    cache = TextGeometryCache(tmp_path, max_bytes=10 ** 6)
+    first, second = cache.key("1", "Consolas", {}), cache.key("1", "Arial", {})
+    cache.save(first, [zeros((1, 3))], [True])
+    cache.save(second, [zeros((1, 3))], [True])
+
+    cache.invalidate("Consolas")
+
+    assert cache.load(first) is None
+    assert cache.load(second) is not None
+
+
+def test_broken_text_geometry_is_removed(tmp_path):
+    cache = TextGeometryCache(tmp_path, max_bytes=10 ** 6)
+    key = cache.key("1", "Consolas", {})
+    cache.store(key, lambda file: file.write(b"broken"))
+
+    assert cache.load(key) is None
+    assert cache.get(key) is None
@@ -0,0 +1,46 @@
+import pytest
+from numpy.testing import assert_allclose
+
+pytest.importorskip("manimlib")
+
+from manimlib.imports import ORIGIN, ApplyMethod  # noqa: E402
+
+from classes.dot_cloud import DotCloud  # noqa: E402
+from classes.histogram_dot import HistogramDot  # noqa: E402
+from classes.move_dots import MoveToTargets, move_dot  # noqa: E402
+
+
+def test_empty_cloud():
+    cloud = DotCloud([], [])
+
+    assert len(cloud) == 0
+    assert cloud.centers.shape == (0, 3)
+
+
+def test_scale_keeps_radii_after_move():
+    cloud = DotCloud([1, 2], [[0, 0], [1, 0]], radii=0.1, colors=["#ff0000"] * 2, annot=False)
+    cloud.scale(2, about_point=ORIGIN)
+
+    assert_allclose(cloud.radii, [0.2, 0.2])
+    assert_allclose(cloud.centers[:, :2], [[0, 0], [2, 0]])
+
+    # Moving redraws the dot from its radius, it shouldn't snap back to the size before the scale
+    cloud.move_dots([0], [[5, 5]])
+    points = cloud.circles[0].points[: len(cloud._circle_template)]
+
+    assert points[:, 0].max() - points[:, 0].min() == pytest.approx(0.4, abs=1e-6)
+
+
+def test_shift_keeps_radii():
+    cloud = DotCloud([1], [[0, 0]], radii=0.1, annot=False)
+    cloud.shift([1, 2, 0])
+
+    assert_allclose(cloud.radii, [0.1])
+    assert_allclose(cloud.centers[0], [1, 2, 0])
+
+
+def test_move_dot():
+    cloud = DotCloud([1, 2], [[0, 0], [1, 0]], annot=False)
+
+    assert isinstance(move_dot(cloud[1], [3, 3, 0]), MoveToTargets)
+    assert isinstance(move_dot(HistogramDot(1, ORIGIN), [3, 3, 0]), ApplyMethod)
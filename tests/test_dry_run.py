@@ -0,0 +1,39 @@
+import pytest
+from numpy import hypot
+from numpy.random import default_rng
+
+pytest.importorskip("manimlib")
+
+from rendering.dry_run import find_overlapping_dots  # noqa: E402
+
+
+def get_overlapping_dots(centers, radii, tolerance):
+    """Checking every pair of the dots"""
+    return [
+        (i, j)
+        for i in range(len(radii))
+        for j in range(i + 1, len(radii))
+        if hypot(*(centers[i] - centers[j])) < radii[i] + radii[j] - tolerance
+    ]
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 300])
+def test_find_overlapping_dots(count):
+    generator = default_rng(count)
+    centers, radii = generator.uniform(-3, 3, (count, 2)), generator.uniform(0.01, 0.2, count)
+
+    assert find_overlapping_dots(centers, radii, 0.01) == get_overlapping_dots(centers, radii, 0.01)
+
+
+def test_find_overlapping_dots_column():
+    # Dots of the histogram column are on the same x, dots with the same center overlap as well
+    centers = default_rng(1).uniform(0, 2, (100, 2))
+    centers[:, 0] = 1.0
+    centers[1] = centers[0]
+    radii = default_rng(2).uniform(0.01, 0.05, 100)
+
+    pairs = find_overlapping_dots(centers, radii, 0.0)
+
+    assert (0, 1) in pairs
+    assert pairs == get_overlapping_dots(centers, radii, 0.0)
+    assert find_overlapping_dots(centers, radii * 0, 0.0) == []
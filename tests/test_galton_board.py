@@ -0,0 +1,110 @@
+import pytest
+from numpy import arange, isfinite, stack
+from numpy.random import default_rng
+
+from classes.galton_board import GaltonBoard, GaltonBoardShapeException, find_close_pairs
+
+# Two funnels side by side with the walls around them
+SEGMENTS = [
+    [(-3, 2), (-3, -2)],
+    [(3, 2), (3, -2)],
+    [(-3, 0.5), (-0.2, 0)],
+    [(-0.2, 0), (0.2, 0)],
+    [(0.2, 0), (3, 0.5)],
+    [(-3, -2), (3, -2)],
+]
+
+# Funnel over the axis line, that is above the floor and goes past the walls, as in Funnels
+AXIS_SEGMENTS = [
+    [(-1, 3), (-1, -2)],
+    [(1, 3), (1, -2)],
+    [(-1, 0.5), (-0.15, 0)],
+    [(1, 0.5), (0.15, 0)],
+    [(-1.2, -1.5), (1.2, -1.5)],
+]
+
+
+def get_energy(board: GaltonBoard) -> float:
+    return ((board.velocities ** 2).sum(axis=1) / 2 + board.gravity * board.positions[:, 1]).sum()
+
+
+@pytest.mark.parametrize(
+    "segments",
+    [
+        [[(-1, -1), (0, 0)], [(0, 0), (1, -1)]],
+        [[(-1, 0), (0, 0)], [(0, 0), (1, 0)]],
+        [[(-1, 0), (0, 0)], [(0, 0), (1, 0)], [(0, 0), (0, -1)]],
+    ],
+)
+def test_dot_on_shared_vertex(segments):
+    # Dot touching both segments at their common end is bounced once, so it never rises above its start
+    board = GaltonBoard(segments, [[0.0, 1.0]], 0.1)
+    trajectories = board.simulate(duration=3, frame_rate=60)
+
+    assert trajectories[1:, 0, 1].max() <= 1.0
+    assert trajectories[-1, 0, 1] == pytest.approx(0.1, abs=0.01)
+
+
+def test_speed_limit():
+    board = GaltonBoard(SEGMENTS, [[-2.0, 1.5], [2.0, 1.5]], 0.05, velocities=[[20.0, 0.0], [0.0, -20.0]])
+    board.step(1 / 30)
+
+    assert ((board.velocities ** 2).sum(axis=1) <= board.max_speed ** 2 + 1e-9).all()
+
+
+def test_dots_stay_inside():
+    count, radius = 400, 0.05
+    xs = -2.5 + (arange(count) % 40) * 0.125 + default_rng(1).uniform(-0.01, 0.01, count)
+    board = GaltonBoard(SEGMENTS, stack([xs, 0.7 + (arange(count) // 40) * 0.125], axis=1), radius)
+
+    energy = get_energy(board)
+    trajectories = board.simulate(duration=3, frame_rate=30)
+
+    assert isfinite(trajectories).all()
+    assert (abs(trajectories[..., 0]) < 3).all()
+    assert (trajectories[..., 1] > -2).all()
+    assert trajectories[..., 1].max() <= trajectories[0, :, 1].max() + radius
+
+    # Collisions lose energy and never add it
+    assert get_energy(board) < energy
+
+
+def test_dots_stay_above_axis():
+    # Stack on the thin line pushes the lowest dots into it, they are pushed back and never pass the line
+    count, radius = 400, 0.05
+    xs = -0.875 + (arange(count) % 15) * 0.125 + default_rng(1).uniform(-0.01, 0.01, count)
+    board = GaltonBoard(AXIS_SEGMENTS, stack([xs, 0.7 + (arange(count) // 15) * 0.125], axis=1), radius)
+    trajectories = board.simulate(duration=3, frame_rate=30)
+
+    assert isfinite(trajectories).all()
+    assert (abs(trajectories[..., 0]) < 1).all()
+    assert (trajectories[..., 1] > -1.5).all()
+
+
+def test_find_close_pairs():
+    positions = default_rng(2).uniform(-1, 1, (200, 2))
+    first, second = find_close_pairs(positions, 0.1)
+
+    found = {(min(x, y), max(x, y)) for x, y in zip(first.tolist(), second.tolist())}
+    expected = {
+        (i, j)
+        for i in range(len(positions))
+        for j in range(i + 1, len(positions))
+        if ((positions[i] - positions[j]) ** 2).sum() < 0.1 ** 2
+    }
+
+    # Every close pair is found once, pairs in the neighbour cells could be further
+    assert len(found) == len(first)
+    assert expected <= found
+    assert found == {(min(x, y), max(x, y)) for x, y in zip(*find_close_pairs(positions, 0.1, max_grid_cells=1))}
+
+
+def test_shapes():
+    with pytest.raises(GaltonBoardShapeException):
+        GaltonBoard([(0, 0), (1, 1)], [[0, 0]], 0.1)
+
+    with pytest.raises(GaltonBoardShapeException):
+        GaltonBoard(SEGMENTS, [0, 0], 0.1)
+
+    with pytest.raises(GaltonBoardShapeException):
+        GaltonBoard(SEGMENTS, [[0, 0]], 0.1, velocities=[[0, 0], [0, 0]])
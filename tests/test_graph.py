@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("manimlib")
+
+from manimlib.imports import Camera  # noqa: E402
+
+from classes.graph import CategoricalGraph, GraphCameraException  # noqa: E402
+from classes.histogram_text import HistogramText  # noqa: E402
+from rendering.scene import get_camera_config  # noqa: E402
+
+POINTS = ((-6, 0), (6, 0))
+
+
+def get_camera(quality: str = "low") -> Camera:
+    return Camera(**get_camera_config(quality))
+
+
+def get_texts(graph):
+    return [x for x in graph.submobjects if isinstance(x, HistogramText)]
+
+
+def test_lod_labels_start_at_first_bin():
+    graph = CategoricalGraph(POINTS, None, bins=1000, annot=True, lod=True, camera=get_camera())
+    texts = get_texts(graph)
+
+    assert 1 < len(texts) < 1000
+
+    # Labels are at the bins 1, 1 + step and so on
+    step = round((texts[1].get_center()[0] - texts[0].get_center()[0]) / graph.step_x)
+    assert texts[0].get_center()[0] == pytest.approx(-6 + graph.step_x / 2, abs=1e-6)
+    assert len(texts) == len(range(1, 1001, step))
+
+
+def test_lod_decimated_ticks_surround_labels():
+    graph = CategoricalGraph(POINTS, None, bins=20, lod=True, decimate_ticks=True, camera=get_camera())
+
+    assert graph._get_ticks(5).tolist() == [0, 1, 5, 6, 10, 11, 15, 16, 20]
+    assert graph._get_ticks(1).tolist() == list(range(21))
+
+
+def test_lod_without_labels():
+    graph = CategoricalGraph(POINTS, None, bins=1000, annot=False, lod=True, camera=get_camera())
+
+    assert get_texts(graph) == []
+
+
+def test_lod_labels_fit_camera_resolution():
+    low = CategoricalGraph(POINTS, None, bins=1000, annot=True, lod=True, camera=get_camera("low"))
+    production = CategoricalGraph(POINTS, None, bins=1000, annot=True, lod=True, camera=get_camera("production"))
+
+    # Gap between the labels is set in pixels, so it takes more of the axis in the smaller video
+    assert low.pixels_per_unit < production.pixels_per_unit
+    assert low._get_labels_step(0.1, 0.02) == 20
+    assert production._get_labels_step(0.1, 0.02) == 10
+
+    with pytest.raises(GraphCameraException):
+        CategoricalGraph(POINTS, None, bins=1000, lod=True)
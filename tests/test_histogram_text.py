@@ -0,0 +1,40 @@
+import pytest
+from numpy import array
+
+pytest.importorskip("manimlib")
+
+from manimlib.imports import RED, Text  # noqa: E402
+
+from classes.histogram_text import HistogramText  # noqa: E402
+from classes.text_cache import TextGeometryCache  # noqa: E402
+
+POINTS = [array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=float)] * 2
+
+
+@pytest.fixture
+def rendered(tmp_path, monkeypatch):
+    """Texts rendered by Text. Rendering is replaced, the cache always has the geometry of two characters."""
+    cache = TextGeometryCache(tmp_path, max_bytes=10 ** 6)
+    monkeypatch.setattr(cache, "load", lambda key: (POINTS, array([True, True])))
+    monkeypatch.setattr(HistogramText, "geometry_cache", cache)
+
+    texts = []
+    monkeypatch.setattr(Text, "__init__", lambda self, text, **config: texts.append(text))
+
+    return texts
+
+
+def test_cached_text(rendered):
+    text = HistogramText("ab")
+
+    assert rendered == []
+    assert text.text == "ab"
+    assert len(text.submobjects) == 2
+    assert text.find_indexes("b") == [(1, 2)]
+
+
+@pytest.mark.parametrize("config", [{"t2c": {"a": RED}}, {"text2color": {"a": RED}}, {"t2g": {"a": (RED, RED)}}])
+def test_indexed_text_is_rendered(rendered, config):
+    HistogramText("ab", **config)
+
+    assert rendered == ["ab"]
@@ -0,0 +1,116 @@
+import pytest
+from numpy import array, concatenate, interp, nan
+from numpy.random import default_rng
+from numpy.testing import assert_allclose
+
+pytest.importorskip("manimlib")
+
+from classes.movable_funnel import MovableFunnel  # noqa: E402
+from classes.movable_graph import MovableCategoricalGraph, MovableContinuousGraph  # noqa: E402
+
+
+class Dot:
+    """Dot with only the attributes, that the coordinates are calculated from"""
+
+    def __init__(self, value, radius, x=0.0):
+        self.value = value
+        self.radius = radius
+        self.x = x
+
+    def get_x(self):
+        return self.x
+
+
+def get_graph_reference(graph, values, radii):
+    """Stacking dots one by one, the same way as the graph did before the batch version"""
+    next_coords = graph._prepare_next_dot_coords()
+
+    coords = []
+    for value, radius in zip(values, radii):
+        current = next_coords[int(value)]
+        coords.append([current["x"], current["y"], 0])
+        current["y"] += radius + graph.dot_padding
+
+    return array(coords)
+
+
+def get_funnel_reference(funnel, xs, radii):
+    """Falling dots one by one, the same way as the funnel did before the batch version"""
+    left = funnel.left_to_bottom_right.get_all_points()
+    right = funnel.right_to_bottom_left.get_all_points()
+    current = funnel.y_point_bottom + funnel.y_bottom_shift * 2
+
+    points = []
+    for x, radius in zip(xs, radii):
+        first = second = third = [nan] * 3
+
+        if funnel.x_point_left <= x <= left[-1][0]:
+            line = left
+        elif right[-1][0] <= x <= funnel.x_point_right:
+            line = right
+        elif left[-1][0] < x < right[-1][0]:
+            line = None
+        else:
+            points.append((first, second, third))
+            continue
+
+        if line is not None:
+            order = line[:, 0].argsort()
+            first = [x, interp(x, line[order, 0], line[order, 1]) + 0.25, 0]
+            second = [funnel.x_funnel_center, left[-1][1] + 0.1, 0]
+
+        third = [funnel.x_funnel_center, current, 0]
+        current += radius + funnel.dot_padding
+
+        points.append((first, second, third))
+
+    return array(points).transpose(1, 0, 2)
+
+
+@pytest.mark.parametrize("graph_class", [MovableCategoricalGraph, MovableContinuousGraph])
+def test_graph_batch_equals_one_by_one(graph_class):
+    rng = default_rng(0)
+    values = rng.integers(1, 5, 200)
+    radii = rng.uniform(0.05, 0.2, 200)
+
+    batched = graph_class(((0, 0), (4, 0)), None, bins=4, annot=False)
+    one_by_one = graph_class(((0, 0), (4, 0)), None, bins=4, annot=False)
+
+    # Batches could be split anywhere, the stacking is continued from the previous one
+    coords = concatenate(
+        [
+            batched.get_next_dots_coords(values[:50], radii[:50]),
+            batched.get_next_dots_coords(values[50:], radii[50:]),
+        ]
+    )
+    single = [one_by_one._get_next_dot_coords(Dot(v, r)) for v, r in zip(values, radii)]
+
+    reference = get_graph_reference(batched, values, radii)
+    assert_allclose(array(single), reference)
+    assert_allclose(coords, reference)
+
+
+def test_funnel_batch_equals_one_by_one():
+    rng = default_rng(0)
+    xs = rng.uniform(-1.5, 1.5, 200)
+    radii = rng.uniform(0.05, 0.2, 200)
+
+    batched = MovableFunnel(((-1, 0), (1, 0)), 0.8, height=3, point_radius=0.2)
+    one_by_one = MovableFunnel(((-1, 0), (1, 0)), 0.8, height=3, point_radius=0.2)
+
+    first, second, third, on_slope, inside = batched.get_next_dots_coords(xs, radii)
+    reference = get_funnel_reference(batched, xs, radii)
+
+    assert_allclose(first, reference[0])
+    assert_allclose(second, reference[1])
+    assert_allclose(third, reference[2])
+    assert not inside.all() and inside.any() and on_slope.any()
+
+    for i, (x, radius) in enumerate(zip(xs, radii)):
+        points = one_by_one._get_next_dots_coords(Dot(1, radius, x))
+        expected = [None if not inside[i] or (j < 2 and not on_slope[i]) else reference[j, i] for j in range(3)]
+
+        for point, point_expected in zip(points, expected):
+            assert (point is None) == (point_expected is None)
+            if point is not None:
+                assert_allclose(point, point_expected)
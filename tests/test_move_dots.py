@@ -0,0 +1,84 @@
+import pytest
+from numpy.testing import assert_allclose
+
+pytest.importorskip("manimlib")
+
+from manimlib.imports import ORIGIN, RIGHT, Scene, VGroup, there_and_back  # noqa: E402
+
+from classes.histogram_dot import HistogramDot  # noqa: E402
+from classes.movable_graph import MovableCategoricalGraph  # noqa: E402
+from classes.move_dots import MoveToTargets, StaggeredMove  # noqa: E402
+from rendering.scene import get_camera_config  # noqa: E402
+
+
+def play(construct) -> Scene:
+    """Playing the construct function in the scene without rendering."""
+    scene_class = type("DotsScene", (Scene,), {"construct": construct})
+
+    return scene_class(
+        camera_config=get_camera_config("low"),
+        file_writer_config={"write_to_movie": False, "save_last_frame": False},
+        skip_animations=True,
+    )
+
+
+def get_dots(scene: Scene) -> list:
+    return [x for x in scene.get_mobject_family_members() if isinstance(x, HistogramDot)]
+
+
+def create_dots(count: int) -> VGroup:
+    return VGroup(*[HistogramDot(i % 4 + 1, ORIGIN + i * 0.1 * RIGHT) for i in range(count)])
+
+
+def test_moved_dots_stay_in_scene():
+    dots = create_dots(10)
+    targets = [x.get_center() + RIGHT for x in dots]
+
+    def construct(scene):
+        scene.add(dots)
+        scene.play(MoveToTargets(dots, targets))
+        scene.play(StaggeredMove(dots[:5], targets[:5], starts=0, durations=1))
+
+    scene = play(construct)
+
+    assert len(get_dots(scene)) == 10
+    assert_allclose([x.get_center() for x in dots], targets)
+
+
+def test_staggered_move_rate_func():
+    dots = create_dots(3)
+    targets = [x.get_center() + RIGHT for x in dots]
+
+    # Rate function with the condition is called for every dot, dots are back at the end
+    scene = play(lambda scene: scene.play(StaggeredMove(dots, targets, 0, 1, dot_rate_func=there_and_back)))
+
+    assert len(get_dots(scene)) == 3
+    assert_allclose([x.get_center()[0] for x in dots], [0, 0.1, 0.2], atol=1e-6)
+
+
+@pytest.mark.parametrize("animate_rest", [False, True])
+def test_batched_drag_keeps_same_mobjects(animate_rest):
+    results = []
+    for batched in [False, True]:
+        graph = MovableCategoricalGraph(((-6, -2), (6, -2)), None, bins=4)
+        dots = create_dots(10)
+
+        def construct(scene):
+            scene.add(graph, dots)
+            graph.drag_in_dots(scene, dots, animate_slow=3, animate_rest=animate_rest, batched=batched)
+
+        scene = play(construct)
+        assert {id(x) for x in get_dots(scene)} == {id(x) for x in dots}
+
+        # Mobjects are named by their place in the graph or in the dots, they are created again for every scene
+        names = {id(x): f"graph {i}" for i, x in enumerate(graph.get_family())}
+        names.update({id(x): f"dot {i}" for i, dot in enumerate(dots) for x in dot.get_family()})
+        drawn = sorted(names.get(id(x), "other") for x in scene.get_mobject_family_members() if len(x.points))
+
+        results.append((drawn, [x.get_center() for x in dots]))
+
+    (drawn, centers), (batched_drawn, batched_centers) = results
+
+    # Dots could be taken out of their group by the batched play, but the same mobjects are drawn
+    assert batched_drawn == drawn
+    assert_allclose(batched_centers, centers, atol=1e-6)
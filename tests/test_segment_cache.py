@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from rendering.segment_cache import SegmentCache, get_classes_digest
+from rendering.segments import Segment
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def get_key(cache: SegmentCache, segment=Segment("funnel", 2, 4), classes_digest="classes", scene_config=None):
+    return cache.key(segment, "def funnel(self): ...", classes_digest, scene_config or {"a": 1, "b": [1, 2]}, {})
+
+
+def test_key(tmp_path):
+    cache = SegmentCache(tmp_path, max_bytes=100)
+    key = get_key(cache)
+
+    assert get_key(cache) == key
+    assert get_key(cache, scene_config={"b": [1, 2], "a": 1}) == key
+
+    # Cost isn't the content of the video
+    assert get_key(cache, segment=Segment("funnel", 2, 4, cost=10)) == key
+
+    assert get_key(cache, segment=Segment("funnel", 2, 5)) != key
+    assert get_key(cache, classes_digest="other") != key
+    assert get_key(cache, scene_config={"a": 2, "b": [1, 2]}) != key
+
+
+def test_classes_digest(tmp_path):
+    digest = get_classes_digest([Segment], ROOT)
+
+    assert get_classes_digest([Segment], ROOT) == digest
+    assert get_classes_digest([], ROOT) != digest
+
+    # Modules outside the root aren't included
+    assert get_classes_digest([Segment], tmp_path) == get_classes_digest([], tmp_path)
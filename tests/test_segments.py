@@ -0,0 +1,66 @@
+import pytest
+
+from rendering.segments import Segment, SegmentCostException, plan_segments, schedule_segments, split_segment
+
+
+def test_split_segment_bounds():
+    segments = split_segment("funnel", [3, 3, 3, 3, 3], max_cost=6)
+
+    assert segments == [
+        Segment("funnel", None, 2, cost=6),
+        Segment("funnel", 2, 4, cost=6),
+        Segment("funnel", 4, None, cost=3),
+    ]
+    assert [x.name for x in segments] == ["funnel_0_2", "funnel_2_4", "funnel_4_"]
+
+
+def test_split_segment_fits():
+    assert split_segment("funnel", [1, 2, 3], max_cost=10) == [Segment("funnel", cost=6)]
+    assert split_segment("funnel", [], max_cost=10) == [Segment("funnel", cost=0)]
+
+
+def test_split_segment_long_play():
+    # Play can't be split, so it's the segment on its own
+    segments = split_segment("funnel", [1, 20, 1], max_cost=5)
+
+    assert [(x.start, x.end, x.cost) for x in segments] == [(None, 1, 1), (1, 2, 20), (2, None, 1)]
+
+
+@pytest.mark.parametrize("max_cost", [0, -1])
+def test_split_segment_cost(max_cost):
+    with pytest.raises(SegmentCostException):
+        split_segment("funnel", [1], max_cost)
+
+
+def test_plan_segments():
+    play_costs = {"intro": [1, 1], "funnel": [4, 4, 4, 4], "outro": [2]}
+
+    # Segments cover all plays in the order of the video
+    segments = plan_segments(play_costs, max_cost=8)
+    for method, costs in play_costs.items():
+        method_segments = [x for x in segments if x.method == method]
+        assert sum(x.cost for x in method_segments) == sum(costs)
+        assert method_segments[0].start is None and method_segments[-1].end is None
+        assert all(x.end == y.start for x, y in zip(method_segments[:-1], method_segments[1:]))
+
+    assert [x.method for x in segments] == sorted([x.method for x in segments], key=list(play_costs).index)
+
+    assert plan_segments(play_costs, max_cost=8, split=False) == [
+        Segment("intro", cost=2),
+        Segment("funnel", cost=16),
+        Segment("outro", cost=2),
+    ]
+
+
+def test_plan_segments_bounds_depend_on_method_only():
+    # Bounds of the method are the same with other methods, so its cached segments are found again
+    alone = plan_segments({"funnel": [4, 4, 4, 4]}, max_cost=8)
+    together = plan_segments({"intro": [100], "funnel": [4, 4, 4, 4]}, max_cost=8)
+
+    assert [x for x in together if x.method == "funnel"] == alone
+
+
+def test_schedule_segments():
+    segments = [Segment("a", cost=1), Segment("b", cost=5), Segment("c", cost=3)]
+
+    assert [x.method for x in schedule_segments(segments)] == ["b", "c", "a"]
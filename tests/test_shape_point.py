@@ -0,0 +1,59 @@
+import pytest
+from numpy import array, inf, nan
+from numpy.testing import assert_allclose
+
+from classes.shape_point import (
+    ShapePoint,
+    ShapePointArray,
+    ShapePointNotFiniteException,
+    ShapePointTooManyValuesException,
+    ShapePointTypeError,
+)
+
+
+@pytest.mark.parametrize("coords", [(1, 2), (1.0, 2.5), array([1, 2]), array([1.0, 2.0, 3.0])])
+def test_point(coords):
+    point = ShapePoint(coords)
+
+    assert_allclose(point.coords, [coords[0], coords[1], 0])
+
+
+@pytest.mark.parametrize("coords", [(nan, 1.0), (1.0, inf), array([nan, 1.0]), array([1.0, -inf])])
+def test_point_not_finite(coords):
+    with pytest.raises(ShapePointNotFiniteException):
+        ShapePoint(coords)
+
+
+def test_point_wrong_values():
+    with pytest.raises(ShapePointTypeError):
+        ShapePoint([1, 2])
+
+    with pytest.raises(ShapePointTypeError):
+        ShapePoint(("1", 2))
+
+    with pytest.raises(ShapePointTooManyValuesException):
+        ShapePoint((1, 2, 3))
+
+
+def test_array_rows_are_points():
+    points = ShapePointArray([[1, 2], [3, 4]])
+
+    assert len(points) == 2
+    assert_allclose(points[1].coords, [3, 4, 0])
+    assert_allclose([x.coords for x in points], [[1, 2, 0], [3, 4, 0]])
+
+    # Points are views of the array rows
+    assert points[0].coords.base is points.coords
+
+
+def test_array_validation():
+    assert len(ShapePointArray([])) == 0
+
+    with pytest.raises(ShapePointNotFiniteException):
+        ShapePointArray([[nan, 1]])
+
+    with pytest.raises(ShapePointTooManyValuesException):
+        ShapePointArray([[1, 2, 3, 4]])
+
+    with pytest.raises(ShapePointTypeError):
+        ShapePointArray([["a", "b"]])
@@ -0,0 +1,86 @@
+import pytest
+
+pytest.importorskip("manimlib")
+
+from manimlib.imports import DOWN, LEFT, RIGHT, UP, ApplyMethod, Dot, Scene, Square  # noqa: E402
+from numpy import int16  # noqa: E402
+
+from rendering.dirty_rects import DirtyRectsMixin  # noqa: E402
+from rendering.instrumentation import Instrumentation, InstrumentationMixin  # noqa: E402
+from rendering.scene import get_camera_config, with_mixins  # noqa: E402
+from rendering.static_layers import StaticLayersMixin  # noqa: E402
+
+
+class DotsScene(Scene):
+    """Dot moving between the static squares, squares are drawn under and over it."""
+
+    # Every static run is a layer, so the transparent layers are composited as well
+    static_layers_min_size = 1
+
+    def construct(self):
+        squares = [Square(side_length=0.5, fill_opacity=0.5).shift(x * RIGHT) for x in range(-3, 4)]
+        dot = Dot(LEFT * 4, radius=0.3)
+
+        self.add(*squares[:3], dot, *squares[3:])
+        self.play(ApplyMethod(dot.shift, RIGHT * 8), run_time=0.5)
+        self.play(ApplyMethod(squares[0].shift, UP), ApplyMethod(dot.shift, DOWN), run_time=0.5)
+
+
+class FramesMixin:
+    """Keeping every frame of the plays."""
+
+    def __init__(self, **kwargs):
+        self.frames = []
+
+        super().__init__(**kwargs)
+
+    def add_frames(self, *frames):
+        self.frames.extend(x.copy() for x in frames)
+
+        super().add_frames(*frames)
+
+
+def render_scene(*mixins, **kwargs) -> Scene:
+    return with_mixins(DotsScene, FramesMixin, *mixins)(
+        camera_config=get_camera_config("low"),
+        file_writer_config={"write_to_movie": False, "save_last_frame": False},
+        **kwargs,
+    )
+
+
+def assert_frames_equal(frames, expected):
+    assert len(frames) == len(expected)
+
+    # Static layers are composited, so pixels could differ by one because of rounding
+    for frame, frame_expected in zip(frames, expected):
+        assert abs(frame.astype(int16) - frame_expected.astype(int16)).max() <= 1
+
+
+def test_static_layers_frames():
+    expected = render_scene().frames
+
+    assert_frames_equal(render_scene(StaticLayersMixin).frames, expected)
+
+
+def test_static_layers_rasterization_is_timed():
+    scene = render_scene(InstrumentationMixin, StaticLayersMixin, instrumentation=Instrumentation())
+    plays = [x for x in scene.instrumentation.records if x["kind"] == "play"]
+
+    assert len(plays) == 2
+    assert all(x["rasterization"] > 0 for x in plays)
+    assert all(x["rasterization"] + x["encoding"] <= x["wall_time"] for x in plays)
+
+
+def test_dirty_rects_frames():
+    expected = render_scene().frames
+
+    assert_frames_equal(render_scene(DirtyRectsMixin).frames, expected)
+
+
+def test_dirty_rects_draw_only_box():
+    scene = render_scene(DirtyRectsMixin)
+
+    # Box of the last frame is around the moved square and dot, not the whole frame
+    top, bottom, left, right = scene._dirty_box
+    height, width = scene.frames[-1].shape[:2]
+    assert (bottom - top) * (right - left) < 0.25 * height * width
@@ -0,0 +1,117 @@
+import random
+
+import pytest
+from numpy.random import default_rng
+from numpy.testing import assert_allclose
+
+pytest.importorskip("manimlib")
+
+from classes.data_source import IteratorDataSource  # noqa: E402
+from classes.table import CustomersTable, TableRowCountException  # noqa: E402
+from classes.virtual_table import VirtualCustomersTable  # noqa: E402
+
+POINTS = ((-6, 3), (-2, 3))
+
+
+def get_rows(count: int):
+    return ((x % 4 + 1, f"Row {x}") for x in range(count))
+
+
+def test_iterator_needs_row_count():
+    with pytest.raises(TableRowCountException):
+        CustomersTable(POINTS, visible_row_count=5, bins=4, text="Customer", data_source=get_rows(3))
+
+    with pytest.raises(TableRowCountException):
+        VirtualCustomersTable(POINTS, visible_row_count=5, bins=4, text="Customer", data_source=get_rows(3))
+
+
+def test_iterator_is_read_once():
+    # Rows before the last 5 are dropped, so every row must be read only once
+    source = IteratorDataSource(get_rows(20), history=5)
+    table = CustomersTable(POINTS, row_count=22, row_height=0.2, visible_row_count=22, bins=4, data_source=source)
+
+    assert [x.value for x in table.dots][:20] == [x % 4 + 1 for x in range(20)]
+    assert len(table.dots) == 22
+
+
+def test_virtual_table_scrolls_iterator():
+    source = IteratorDataSource(get_rows(50), history=5)
+    table = VirtualCustomersTable(POINTS, row_count=50, visible_row_count=4, bins=4, data_source=source)
+
+    for top_row in range(0, 47, 3):
+        table.scroll_to(top_row)
+
+    assert all(row % table.slots_count == slot for slot, row in enumerate(table.slot_rows))
+    assert [x.value for x in table.dots] == [x % 4 + 1 for x in table.slot_rows]
+
+
+def test_virtual_table_rebinds_in_place():
+    table = VirtualCustomersTable(POINTS, row_count=100, row_height=0.2, visible_row_count=4, bins=4, text="Customer")
+    family = {id(x) for x in table.get_family()}
+
+    table.scroll_to(50)
+
+    # Mobjects of the slots are reused, labels could only get more characters
+    assert family <= {id(x) for x in table.get_family()}
+
+    full = CustomersTable(POINTS, row_count=60, row_height=0.2, visible_row_count=60, bins=4, text="Customer")
+    for slot, row in enumerate(table.slot_rows):
+        assert table.dots[slot].value == full.dots[row].value
+
+        glyphs = [x.points for x in table.customers[slot].submobjects if len(x.points)]
+        expected = [x.points for x in full.customers[row].family_members_with_points() if x.get_fill_opacity() > 0]
+        shift = [0, table.slot_y[slot] - (POINTS[0][1] - row * 0.2), 0]
+
+        assert len(glyphs) == len(expected)
+        for points, points_expected in zip(glyphs, expected):
+            assert_allclose(points, points_expected + shift, atol=0.02)
+
+
+def get_legacy_values(count: int, bins):
+    values = []
+    for i in range(count):
+        generator = random.Random(i + 1)
+        if isinstance(bins, int):
+            values.append(generator.randrange(1, bins + 1))
+        else:
+            values.append(round(generator.uniform(1.0, bins + 1.0), 1))
+
+    return values
+
+
+@pytest.mark.parametrize("bins", [4, 4.0])
+def test_legacy_values_keep_global_state(bins):
+    random.seed(123)
+    state = random.getstate()
+
+    table = CustomersTable(POINTS, row_count=10, row_height=0.2, visible_row_count=10, bins=bins)
+
+    assert [x.value for x in table.dots] == get_legacy_values(10, bins)
+    assert random.getstate() == state
+
+
+def test_seeded_values():
+    table = CustomersTable(POINTS, row_count=10, row_height=0.2, visible_row_count=10, bins=4, seed=7)
+    short = CustomersTable(POINTS, row_count=3, row_height=0.2, visible_row_count=3, bins=4, seed=7)
+
+    assert [x.value for x in table.dots] == default_rng(7).integers(1, 5, size=10).tolist()
+
+    # Value of the row doesn't depend on how many rows were generated
+    assert [x.value for x in short.dots] == [x.value for x in table.dots][:3]
+    assert table._get_dot_value(9) == table.dots[9].value
+
+
+def test_seeded_values_after_start_values():
+    table = CustomersTable(
+        POINTS, row_count=6, row_height=0.2, visible_row_count=6, bins=4, seed=7, start_dots_values=[4, 4]
+    )
+
+    assert [x.value for x in table.dots] == [4, 4] + default_rng(7).integers(1, 5, size=6).tolist()[2:]
+
+
+def test_virtual_table_seeded_values():
+    table = VirtualCustomersTable(POINTS, row_count=1000, row_height=0.2, visible_row_count=4, bins=4, seed=7)
+    table.scroll_to(500)
+
+    values = default_rng(7).integers(1, 5, size=1000)
+    assert [x.value for x in table.dots] == [values[x] for x in table.slot_rows]